@@ -0,0 +1,65 @@
+"""
+Email delivery throughput against the local debug SMTP server: a fresh
+connection per message (aiosmtplib.send) versus the pooled sessions
+EmailService uses. connect_delay stands in for the TCP + TLS + AUTH
+handshake of a real relay.
+
+    python -m scripts.bench_smtp --messages 500 --concurrency 10 --connect-delay 0.1
+"""
+import argparse
+import asyncio
+import time
+from email.message import EmailMessage
+import aiosmtplib
+from src.core.debug_smtp import DebugSMTPServer
+from src.core.smtp_pool import SMTPConnectionPool
+
+def build_message(i: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "recruitment@example.com"
+    message["To"] = f"candidate{i}@example.com"
+    message["Subject"] = "Your application"
+    message.set_content("<p>Thank you for applying.</p>", subtype="html")
+    return message
+
+async def run(server: DebugSMTPServer, messages: int, concurrency: int, send) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await send(build_message(i))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(messages)))
+    return time.perf_counter() - started
+
+async def bench(messages: int, concurrency: int, connect_delay: float, message_delay: float) -> None:
+    async with DebugSMTPServer(connect_delay=connect_delay, message_delay=message_delay) as server:
+        async def unpooled(message):
+            await aiosmtplib.send(
+                message, hostname=server.host, port=server.port,
+                username="bench", password="bench"
+            )
+
+        pool = SMTPConnectionPool(server.host, server.port, "bench", "bench", max_size=concurrency)
+
+        for name, send in (("per-message connection", unpooled), ("pooled sessions", pool.send)):
+            server.connections = 0
+            elapsed = await run(server, messages, concurrency, send)
+            print(
+                f"{name:>24}: {messages} messages in {elapsed:.2f}s "
+                f"({messages / elapsed:.0f}/s, {server.connections} connections)"
+            )
+        await pool.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--connect-delay", type=float, default=0.1, help="Seconds per new connection")
+    parser.add_argument("--message-delay", type=float, default=0.005, help="Seconds per message")
+    args = parser.parse_args()
+    asyncio.run(bench(args.messages, args.concurrency, args.connect_delay, args.message_delay))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from src.models import schemas, entities
+from src.services.funnel_service import FunnelService
+from src.services.status_history_service import StatusHistoryService
+from datetime import date
+from typing import List, Optional
+
+class AnalyticsController:
+    def __init__(self):
+        self.funnel_service = FunnelService()
+        self.status_history_service = StatusHistoryService()
+
+    def _check_access(self, current_user: entities.User) -> None:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can view hiring analytics"
+            )
+
+    def _check_range(self, date_from: Optional[date], date_to: Optional[date]) -> None:
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(status_code=400, detail="date_from must not be after date_to")
+
+    def get_funnel(
+        self,
+        db: Session,
+        company_id: Optional[int],
+        job_opening_id: Optional[int],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        current_user: entities.User
+    ) -> schemas.Funnel:
+        self._check_access(current_user)
+        self._check_range(date_from, date_to)
+        return self.funnel_service.get_funnel(db, company_id, job_opening_id, date_from, date_to)
+
+    def get_daily(
+        self,
+        db: Session,
+        company_id: Optional[int],
+        job_opening_id: Optional[int],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        current_user: entities.User
+    ) -> List[schemas.FunnelDay]:
+        self._check_access(current_user)
+        self._check_range(date_from, date_to)
+        return self.funnel_service.get_daily(db, company_id, job_opening_id, date_from, date_to)
+
+    def get_time_in_stage(
+        self,
+        db: Session,
+        company_id: Optional[int],
+        job_opening_id: Optional[int],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        current_user: entities.User
+    ) -> schemas.TimeInStage:
+        self._check_access(current_user)
+        self._check_range(date_from, date_to)
+        try:
+            return self.status_history_service.get_time_in_stage(
+                db, company_id, job_opening_id, date_from, date_to
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
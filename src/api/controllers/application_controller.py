@@ -2,48 +2,98 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from src.models import schemas, entities
 from src.services.application_service import ApplicationService
-from typing import List, Optional
+from src.core.pagination import Page
+from src.core.streaming import encode_csv, encode_ndjson
+from typing import Iterator, List, Optional
 
 class ApplicationController:
-    @staticmethod
+    def __init__(self):
+        self.service = ApplicationService()
+
     def get_applications(
+        self,
         db: Session,
         skip: int = 0,
         limit: int = 100,
         candidate_id: Optional[int] = None,
         job_opening_id: Optional[int] = None,
-        status: Optional[entities.ApplicationStatus] = None
-    ) -> List[schemas.Application]:
-        return ApplicationService.get_applications(
-            db, skip, limit, candidate_id, job_opening_id, status
+        status: Optional[entities.ApplicationStatus] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[schemas.Application]:
+        return self.service.get_applications(
+            db, skip, limit, candidate_id, job_opening_id, status, cursor, include_total
         )
 
-    @staticmethod
-    def get_application(db: Session, application_id: int) -> schemas.Application:
-        application = ApplicationService.get_application(db, application_id)
+    def get_application(self, db: Session, application_id: int) -> schemas.Application:
+        application = self.service.get_application(db, application_id)
         if application is None:
             raise HTTPException(status_code=404, detail="Application not found")
         return application
 
-    @staticmethod
-    def create_application(db: Session, application: schemas.ApplicationCreate) -> schemas.Application:
+    def create_application(
+        self,
+        db: Session,
+        application: schemas.ApplicationCreate,
+        current_user: entities.User
+    ) -> schemas.Application:
         try:
-            return ApplicationService.create_application(db, application)
+            return self.service.create_application(db, application, current_user)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    @staticmethod
     def update_application_status(
+        self,
         db: Session,
         application_id: int,
-        update: schemas.ApplicationUpdate
+        update: schemas.ApplicationUpdate,
+        current_user: entities.User
     ) -> schemas.Application:
         try:
-            updated_application = ApplicationService.update_application_status(
-                db, application_id, update
+            updated_application = self.service.update_application_status(
+                db, application_id, update, current_user
             )
             if updated_application is None:
                 raise HTTPException(status_code=404, detail="Application not found")
             return updated_application
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def batch_update_status(
+        self,
+        db: Session,
+        batch: schemas.ApplicationBatchStatusUpdate,
+        current_user: entities.User
+    ) -> schemas.ApplicationBatchStatusResult:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can update application statuses"
+            )
+        return self.service.batch_update_status(db, batch, current_user)
+
+    def export_applications(
+        self,
+        db: Session,
+        format: str,
+        columns: Optional[List[str]],
+        company_id: Optional[int],
+        job_opening_id: Optional[int],
+        status: Optional[entities.ApplicationStatus],
+        batch_size: int,
+        current_user: entities.User
+    ) -> Iterator[bytes]:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can export applications"
+            )
+        try:
+            columns, statement = self.service.export_statement(
+                columns, company_id, job_opening_id, status
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        batches = self.service.stream_export(db, statement, batch_size)
+        encode = encode_csv if format == "csv" else encode_ndjson
+        return encode(columns, batches)
\ No newline at end of file
@@ -1,38 +1,93 @@
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.models import schemas
+from src.models import schemas, entities
 from src.services.candidate_service import CandidateService
-from typing import List
+from src.core.pagination import Page
+from src.core.streaming import (
+    CSV_CONTENT_TYPES, NDJSON_CONTENT_TYPES, iter_csv_records, iter_lines, iter_ndjson_records
+)
+from typing import Optional
 
 class CandidateController:
-    @staticmethod
-    def get_candidates(db: Session, skip: int = 0, limit: int = 100) -> List[schemas.Candidate]:
-        return CandidateService.get_candidates(db, skip, limit)
+    def __init__(self):
+        self.service = CandidateService()
 
-    @staticmethod
-    def get_candidate(db: Session, candidate_id: int) -> schemas.Candidate:
-        candidate = CandidateService.get_candidate(db, candidate_id)
+    def get_candidates(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[schemas.Candidate]:
+        return self.service.get_candidates(db, skip, limit, cursor, include_total)
+
+    def search_candidates(
+        self,
+        db: Session,
+        q: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[schemas.Candidate]:
+        try:
+            return self.service.search_candidates(db, q, skip, limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def get_candidate(self, db: Session, candidate_id: int) -> schemas.Candidate:
+        candidate = self.service.get_candidate(db, candidate_id)
         if candidate is None:
             raise HTTPException(status_code=404, detail="Candidate not found")
         return candidate
 
-    @staticmethod
-    def create_candidate(db: Session, candidate: schemas.CandidateCreate) -> schemas.Candidate:
+    def create_candidate(
+        self,
+        db: Session,
+        candidate: schemas.CandidateCreate,
+        current_user: entities.User
+    ) -> schemas.Candidate:
         try:
-            return CandidateService.create_candidate(db, candidate)
+            return self.service.create_candidate(db, candidate, current_user)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    @staticmethod
     def update_candidate(
+        self,
         db: Session,
         candidate_id: int,
-        candidate: schemas.CandidateBase
+        candidate: schemas.CandidateBase,
+        current_user: entities.User
     ) -> schemas.Candidate:
         try:
-            updated_candidate = CandidateService.update_candidate(db, candidate_id, candidate)
+            updated_candidate = self.service.update_candidate(db, candidate_id, candidate, current_user)
             if updated_candidate is None:
                 raise HTTPException(status_code=404, detail="Candidate not found")
             return updated_candidate
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def import_candidates(
+        self,
+        db: AsyncSession,
+        request: Request,
+        chunk_size: int,
+        current_user: entities.User
+    ) -> schemas.CandidateImportResult:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can import candidates"
+            )
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type in CSV_CONTENT_TYPES:
+            records = iter_csv_records(iter_lines(request.stream()))
+        elif content_type in NDJSON_CONTENT_TYPES:
+            records = iter_ndjson_records(iter_lines(request.stream()))
+        else:
+            raise HTTPException(
+                status_code=415,
+                detail="Upload candidates as text/csv or application/x-ndjson"
+            )
+        return await self.service.import_candidates(db, records, current_user, chunk_size)
\ No newline at end of file
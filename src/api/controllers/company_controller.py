@@ -2,14 +2,22 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from src.models import schemas, entities
 from src.services.company_service import CompanyService
-from typing import List
+from src.core.pagination import Page
+from typing import Optional
 
 class CompanyController:
     def __init__(self):
         self.service = CompanyService()
 
-    def get_companies(self, db: Session, skip: int = 0, limit: int = 100) -> List[schemas.Company]:
-        return self.service.get_companies(db, skip, limit)
+    def get_companies(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[schemas.Company]:
+        return self.service.get_companies(db, skip, limit, cursor, include_total)
 
     def get_company(self, db: Session, company_id: int) -> schemas.Company:
         company = self.service.get_company(db, company_id)
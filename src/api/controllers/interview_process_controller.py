@@ -1,12 +1,16 @@
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.models import schemas, entities
 from src.services.interview_process_service import InterviewProcessService
-from typing import List
+from src.services.scheduling_service import SchedulingService
+from datetime import date, time
+from typing import List, Optional
 
 class InterviewProcessController:
     def __init__(self):
         self.service = InterviewProcessService()
+        self.scheduling_service = SchedulingService()
 
     def start_process(
         self,
@@ -26,9 +30,22 @@ class InterviewProcessController:
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    async def update_step(
+    def start_processes(
         self,
         db: Session,
+        batch: schemas.InterviewProcessBatchStart,
+        current_user: entities.User
+    ) -> schemas.InterviewProcessBatchResult:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can start interview processes"
+            )
+        return self.service.start_interview_processes(db, batch, current_user)
+
+    async def update_step(
+        self,
+        db: AsyncSession,
         step_id: int,
         update: schemas.InterviewStepUpdate,
         current_user: entities.User
@@ -43,4 +60,48 @@ class InterviewProcessController:
         except HTTPException:
             raise
         except Exception as e:
-            raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+            raise HTTPException(status_code=400, detail=str(e)) 
+
+    def check_schedule(
+        self,
+        db: Session,
+        request: schemas.ScheduleCheckRequest,
+        current_user: entities.User
+    ) -> List[schemas.ScheduleCheckResult]:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can check interview schedules"
+            )
+        try:
+            return self.scheduling_service.check_schedule(db, request.proposals)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def find_free_slots(
+        self,
+        db: Session,
+        date_from: date,
+        date_to: date,
+        duration_minutes: int,
+        step_type: Optional[entities.InterviewStepType],
+        interviewer_ids: Optional[List[int]],
+        limit: int,
+        day_start: time,
+        day_end: time,
+        granularity_minutes: int,
+        include_weekends: bool,
+        current_user: entities.User
+    ) -> List[schemas.FreeSlot]:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can search interviewer availability"
+            )
+        try:
+            return self.scheduling_service.find_free_slots(
+                db, date_from, date_to, duration_minutes, step_type, interviewer_ids,
+                limit, day_start, day_end, granularity_minutes, include_weekends
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
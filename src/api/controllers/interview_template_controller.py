@@ -2,7 +2,8 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from src.models import schemas, entities
 from src.services.interview_template_service import InterviewTemplateService
-from typing import List
+from src.core.pagination import Page
+from typing import Optional
 
 class InterviewTemplateController:
     def __init__(self):
@@ -12,9 +13,11 @@ class InterviewTemplateController:
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[schemas.InterviewTemplate]:
-        return self.service.get_active_templates(db, skip, limit)
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[schemas.InterviewTemplate]:
+        return self.service.get_active_templates(db, skip, limit, cursor, include_total)
 
     def create_template(
         self,
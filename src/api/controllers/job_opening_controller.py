@@ -2,29 +2,93 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from src.models import schemas, entities
 from src.services.job_opening_service import JobOpeningService
-from typing import List, Optional
+from src.services.matching_service import MatchingService
+from src.services.job_search_service import JobSearchService
+from src.core.pagination import Page
+from typing import Dict, List, Optional
 
 class JobOpeningController:
-    @staticmethod
+    def __init__(self):
+        self.service = JobOpeningService()
+        self.matching_service = MatchingService()
+        self.search_service = JobSearchService()
+
     def get_job_openings(
+        self,
         db: Session,
         skip: int = 0,
         limit: int = 100,
         company_id: Optional[int] = None,
-        status: Optional[entities.JobStatus] = None
-    ) -> List[schemas.JobOpening]:
-        return JobOpeningService.get_job_openings(db, skip, limit, company_id, status)
+        status: Optional[entities.JobStatus] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[schemas.JobOpening]:
+        return self.service.get_job_openings(db, skip, limit, company_id, status, cursor, include_total)
 
-    @staticmethod
-    def get_job_opening(db: Session, job_id: int) -> schemas.JobOpening:
-        job = JobOpeningService.get_job_opening(db, job_id)
+    def search_job_openings(
+        self,
+        db: Session,
+        q: Optional[str],
+        filters: Dict[str, List[str]],
+        skip: int = 0,
+        limit: int = 20
+    ) -> schemas.JobSearchResult:
+        jobs, total, facets = self.search_service.search_jobs(db, q, filters, skip, limit)
+        return schemas.JobSearchResult(
+            total=total,
+            items=jobs,
+            facets={
+                name: [
+                    schemas.FacetValue(
+                        value=value,
+                        label=self.search_service.index.company_name(value) if name == "company" else None,
+                        count=count
+                    )
+                    for value, count in values
+                ]
+                for name, values in facets.items()
+            }
+        )
+
+    def get_job_opening(self, db: Session, job_id: int) -> schemas.JobOpening:
+        job = self.service.get_job_opening(db, job_id)
         if job is None:
             raise HTTPException(status_code=404, detail="Job opening not found")
         return job
 
-    @staticmethod
-    def create_job_opening(db: Session, job: schemas.JobOpeningCreate) -> schemas.JobOpening:
+    def match_candidates(
+        self,
+        db: Session,
+        job_id: int,
+        limit: int,
+        current_user: entities.User
+    ) -> List[schemas.CandidateMatch]:
+        if current_user.role not in [entities.UserRole.RECRUITER, entities.UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Only recruiters and admins can match candidates"
+            )
+        job = self.service.get_by_id(db, job_id, options=())
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job opening not found")
+        return [
+            schemas.CandidateMatch(
+                candidate=candidate,
+                score=score.score,
+                skill_score=score.skill_score,
+                experience_score=score.experience_score,
+                location_score=score.location_score
+            )
+            for candidate, score in self.matching_service.match_candidates(db, job, limit)
+        ]
+
+    def create_job_opening(
+        self,
+        db: Session,
+        job: schemas.JobOpeningCreate,
+        current_user: entities.User
+    ) -> schemas.JobOpening:
         try:
-            return JobOpeningService.create_job_opening(db, job)
+            return self.service.create_job_opening(db, job, current_user)
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+            raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,119 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.database import engine, async_engine, get_async_db, get_db
+from src.database.pool import pool_status
+from src.core.password_hashing import password_hasher
+from src.models import entities, schemas
+from src.services.auth_service import AuthService, principal_cache, verified_tokens
+from src.services.email_outbox_worker import email_outbox_worker
+from src.services.revocation_service import revocation_list
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"]
+)
+
+def require_admin(
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+) -> entities.User:
+    if current_user.role != entities.UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can access this endpoint"
+        )
+    return current_user
+
+@router.get(
+    "/db/pool",
+    summary="Database connection pool statistics",
+    description="Checked-out and idle connections, overflow and connection "
+                "acquire-time histograms for the sync and async engines",
+    responses={403: {"description": "Not authorized"}}
+)
+def get_pool_stats(current_user: entities.User = Depends(require_admin)):
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool)
+    }
+
+@router.get(
+    "/auth/password-hashing",
+    summary="Password hashing pool statistics",
+    description="bcrypt workers, checks pending, queue wait histogram, completed and "
+                "rejected (429) hash and verify calls",
+    responses={403: {"description": "Not authorized"}}
+)
+def get_password_hashing_stats(current_user: entities.User = Depends(require_admin)):
+    return password_hasher.stats()
+
+@router.get(
+    "/auth/tokens",
+    summary="Token and principal cache statistics",
+    description="Verified-token cache, revocation filter and principal cache sizes and hit counts",
+    responses={403: {"description": "Not authorized"}}
+)
+def get_token_stats(current_user: entities.User = Depends(require_admin)):
+    return {
+        "verified_tokens": verified_tokens.stats(),
+        "revocations": revocation_list.stats(),
+        "principals": principal_cache.stats(),
+    }
+
+@router.get(
+    "/email/outbox",
+    summary="Email outbox statistics",
+    description="Outbox messages per status, the oldest pending message and the "
+                "delivery worker's sent, retried and dead-lettered counters",
+    responses={403: {"description": "Not authorized"}}
+)
+async def get_email_outbox_stats(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: entities.User = Depends(require_admin)
+):
+    return await email_outbox_worker.stats(db)
+
+@router.patch(
+    "/users/{user_id}",
+    response_model=schemas.User,
+    summary="Change a user's role or deactivate them",
+    description="Takes effect on the user's next request in every process: cached "
+                "principals are invalidated with the change",
+    responses={
+        400: {"description": "Invalid update"},
+        403: {"description": "Not authorized"},
+        404: {"description": "User not found"}
+    }
+)
+def update_user(
+    user_id: int = Path(..., description="The ID of the user"),
+    update: schemas.UserAdminUpdate = Body(...),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(require_admin)
+):
+    try:
+        user = AuthService.update_user(db, user_id, update)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+@router.post(
+    "/users/{user_id}/sign-out",
+    status_code=204,
+    summary="Sign a user out everywhere",
+    description="Revokes every access token issued to the user so far; they can log in again",
+    responses={
+        403: {"description": "Not authorized"},
+        404: {"description": "User not found"}
+    }
+)
+def sign_out_user(
+    user_id: int = Path(..., description="The ID of the user"),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(require_admin)
+):
+    if AuthService.sign_out_user(db, user_id) is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return Response(status_code=204)
\ No newline at end of file
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import List, Optional
+from src.database import get_db
+from src.models import schemas, entities
+from src.api.controllers.analytics_controller import AnalyticsController
+from src.services.auth_service import AuthService
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["Analytics"]
+)
+
+analytics_controller = AnalyticsController()
+
+@router.get(
+    "/funnel",
+    response_model=schemas.Funnel,
+    summary="Hiring funnel",
+    description="Applications currently in each status (as of date_to), how many entered "
+                "each status within the date range, and the conversion rate from the "
+                "previous pipeline stage. Read from the daily rollup, not the applications table.",
+    responses={403: {"description": "Not authorized to view analytics"}}
+)
+def get_funnel(
+    company_id: Optional[int] = Query(None, description="Limit to one company"),
+    job_opening_id: Optional[int] = Query(None, description="Limit to one job opening"),
+    date_from: Optional[date] = Query(None, description="First day counted (inclusive)"),
+    date_to: Optional[date] = Query(None, description="Last day counted (inclusive)"),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return analytics_controller.get_funnel(
+        db, company_id, job_opening_id, date_from, date_to, current_user
+    )
+
+@router.get(
+    "/funnel/daily",
+    response_model=List[schemas.FunnelDay],
+    summary="Daily hiring volume",
+    description="Applications entering and leaving each status per day.",
+    responses={403: {"description": "Not authorized to view analytics"}}
+)
+def get_daily_funnel(
+    company_id: Optional[int] = Query(None, description="Limit to one company"),
+    job_opening_id: Optional[int] = Query(None, description="Limit to one job opening"),
+    date_from: Optional[date] = Query(None, description="First day returned (inclusive)"),
+    date_to: Optional[date] = Query(None, description="Last day returned (inclusive)"),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return analytics_controller.get_daily(
+        db, company_id, job_opening_id, date_from, date_to, current_user
+    )
+
+@router.get(
+    "/time-in-stage",
+    response_model=schemas.TimeInStage,
+    summary="Time in stage",
+    description="Median (p50) and p90 time applications spent in each status before "
+                "moving on, and time from application to hire, computed with window "
+                "functions over the status history. Only completed stays are counted; "
+                "the date range applies to when a stay began.",
+    responses={403: {"description": "Not authorized to view analytics"}}
+)
+def get_time_in_stage(
+    company_id: Optional[int] = Query(None, description="Limit to one company"),
+    job_opening_id: Optional[int] = Query(None, description="Limit to one job opening"),
+    date_from: Optional[date] = Query(None, description="First day counted (inclusive)"),
+    date_to: Optional[date] = Query(None, description="Last day counted (inclusive)"),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return analytics_controller.get_time_in_stage(
+        db, company_id, job_opening_id, date_from, date_to, current_user
+    )
\ No newline at end of file
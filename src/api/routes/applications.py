@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, Query, Path, Body
+from fastapi import APIRouter, Depends, Query, Path, Body, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from src.database import get_db
 from src.models import schemas, entities
 from src.api.controllers.application_controller import ApplicationController
+from src.core.pagination import apply_page_headers
+from src.core.streaming import gzip_chunks
+from src.services.auth_service import AuthService
 
 router = APIRouter(
     prefix="/applications",
@@ -11,23 +15,84 @@ router = APIRouter(
     responses={404: {"description": "Not found"}}
 )
 
+application_controller = ApplicationController()
+
 @router.get(
     "/",
     response_model=List[schemas.Application],
     summary="List all applications",
-    description="Get a list of all applications with optional filtering"
+    description="Get a list of all applications with optional filtering. "
+                "The X-Next-Cursor response header holds the cursor for the next page; "
+                "with include_total, X-Total-Count holds the number of matches."
 )
 def get_applications(
-    skip: int = Query(0, ge=0, description="Number of applications to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of applications to skip (ignored when cursor is set)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of applications to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    include_total: bool = Query(False, description="Report the number of matching rows in X-Total-Count"),
     candidate_id: Optional[int] = Query(None, description="Filter by candidate ID"),
     job_opening_id: Optional[int] = Query(None, description="Filter by job opening ID"),
     status: Optional[entities.ApplicationStatus] = Query(None, description="Filter by application status"),
     db: Session = Depends(get_db)
 ):
-    return ApplicationController.get_applications(
-        db, skip, limit, candidate_id, job_opening_id, status
+    page = application_controller.get_applications(
+        db, skip, limit, candidate_id, job_opening_id, status, cursor, include_total
     )
+    apply_page_headers(response, page)
+    return page.items
+
+@router.get(
+    "/export",
+    summary="Export applications",
+    description="Stream every matching application as NDJSON or CSV. Rows are read "
+                "from a server-side cursor and written as they arrive, so the export "
+                "runs in constant memory. Choose fields with `columns`; the body is "
+                "gzip-compressed when the client sends Accept-Encoding: gzip.",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Application rows",
+            "content": {"application/x-ndjson": {}, "text/csv": {}}
+        },
+        400: {"description": "Unknown column requested"},
+        403: {"description": "Not authorized to export applications"}
+    }
+)
+def export_applications(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Output format"),
+    columns: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to include, e.g. id,status,company_name"
+    ),
+    company_id: Optional[int] = Query(None, description="Filter by company ID"),
+    job_opening_id: Optional[int] = Query(None, description="Filter by job opening ID"),
+    status: Optional[entities.ApplicationStatus] = Query(None, description="Filter by application status"),
+    batch_size: int = Query(1000, ge=1, le=10000, description="Rows fetched and written per chunk"),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    chunks = application_controller.export_applications(
+        db,
+        format,
+        [name.strip() for name in columns.split(",") if name.strip()] if columns else None,
+        company_id,
+        job_opening_id,
+        status,
+        batch_size,
+        current_user
+    )
+    headers = {
+        "Content-Disposition": f'attachment; filename="applications.{format}"',
+        "Vary": "Accept-Encoding"
+    }
+    if "gzip" in request.headers.get("accept-encoding", "").lower():
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    # The stream closes the db session itself once the last row is read
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
 
 @router.get(
     "/{application_id}",
@@ -54,7 +119,7 @@ def get_application(
     application_id: int = Path(..., ge=1, description="The ID of the application to retrieve"),
     db: Session = Depends(get_db)
 ):
-    return ApplicationController.get_application(db, application_id)
+    return application_controller.get_application(db, application_id)
 
 @router.post(
     "/",
@@ -90,9 +155,10 @@ def create_application(
             "salary_expectation": "$120,000 - $140,000"
         }
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
 ):
-    return ApplicationController.create_application(db, application)
+    return application_controller.create_application(db, application, current_user)
 
 @router.put(
     "/{application_id}/status",
@@ -114,6 +180,32 @@ def update_application_status(
             "notes": "Scheduled for technical interview"
         }
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return application_controller.update_application_status(db, application_id, update, current_user)
+
+@router.post(
+    "/batch/status",
+    response_model=schemas.ApplicationBatchStatusResult,
+    summary="Update the status of many applications",
+    description="Move the applications selected by ids and/or a filter to a new status "
+                "in one set-based update. Notification emails are added to the outbox "
+                "in the same transaction.",
+    responses={
+        200: {"description": "Rows changed, already in the target status, or not found"},
+        422: {"description": "Neither ids nor a filter were given"}
+    }
+)
+def batch_update_application_status(
+    batch: schemas.ApplicationBatchStatusUpdate = Body(
+        ...,
+        example={
+            "filter": {"job_opening_id": 1, "status": "screening"},
+            "status": "rejected"
+        }
+    ),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
 ):
-    return ApplicationController.update_application_status(db, application_id, update) 
\ No newline at end of file
+    return application_controller.batch_update_status(db, batch, current_user)
\ No newline at end of file
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import timedelta
-from src.database import get_db
-from src.services.auth_service import AuthService
+from src.database import get_async_db, get_db
+from src.services.auth_service import AuthService, oauth2_scheme
 from src.models import schemas
 from src.core.config import get_settings
 from src.models import entities
@@ -40,7 +42,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 )
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create access token for user authentication.
@@ -71,6 +73,21 @@ async def login_for_access_token(
         "token_type": "bearer"
     }
 
+@router.post(
+    "/logout",
+    status_code=204,
+    summary="Revoke the current access token",
+    description="The token is rejected from then on, in every process within a second",
+    responses={401: {"description": "Not authenticated"}}
+)
+def logout(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_user)
+):
+    AuthService.revoke_token(db, token)
+    return Response(status_code=204)
+
 @router.get(
     "/me",
     response_model=schemas.User,
@@ -106,9 +123,9 @@ async def read_users_me(
     return current_user 
 
 @router.get("/debug/users", tags=["Debug"])
-async def list_users(db: Session = Depends(get_db)):
+async def list_users(db: AsyncSession = Depends(get_async_db)):
     """Debug endpoint to list all users - remove in production"""
-    users = db.query(entities.User).all()
+    users = (await db.execute(select(entities.User))).scalars().all()
     return [{
         "email": user.email,
         "role": user.role,
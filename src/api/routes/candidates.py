@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, Query, Path, Body
+from fastapi import APIRouter, Depends, Query, Path, Body, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from src.database import get_db
-from src.models import schemas
+from typing import List, Optional
+from src.database import get_db, get_async_db
+from src.models import schemas, entities
 from src.api.controllers.candidate_controller import CandidateController
+from src.core.pagination import apply_page_headers
+from src.services.auth_service import AuthService
 
 router = APIRouter(
     prefix="/candidates",
@@ -11,18 +14,49 @@ router = APIRouter(
     responses={404: {"description": "Not found"}}
 )
 
+candidate_controller = CandidateController()
+
 @router.get(
     "/",
     response_model=List[schemas.Candidate],
     summary="List all candidates",
-    description="Get a list of all candidates with pagination support"
+    description="Get a list of all candidates with pagination support. "
+                "The X-Next-Cursor response header holds the cursor for the next page; "
+                "with include_total, X-Total-Count holds the number of matches."
 )
 def get_candidates(
-    skip: int = Query(0, ge=0, description="Number of candidates to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of candidates to skip (ignored when cursor is set)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of candidates to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    include_total: bool = Query(False, description="Report the number of matching rows in X-Total-Count"),
+    db: Session = Depends(get_db)
+):
+    page = candidate_controller.get_candidates(db, skip, limit, cursor, include_total)
+    apply_page_headers(response, page)
+    return page.items
+
+@router.get(
+    "/search",
+    response_model=List[schemas.Candidate],
+    summary="Search candidates",
+    description="Full-text search over skills, current position, current company and notes, "
+                "best matches first. All words must match; use OR for alternatives, "
+                "-word or NOT word to exclude, \"quotes\" for phrases and word* for prefixes. "
+                "The X-Next-Cursor response header holds the cursor for the next page.",
+    responses={400: {"description": "Empty query or invalid cursor"}}
+)
+def search_candidates(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=500, description="Search text, e.g. Python Kubernetes"),
+    skip: int = Query(0, ge=0, description="Number of results to skip (ignored when cursor is set)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of candidates to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
     db: Session = Depends(get_db)
 ):
-    return CandidateController.get_candidates(db, skip, limit)
+    page = candidate_controller.search_candidates(db, q, skip, limit, cursor)
+    apply_page_headers(response, page)
+    return page.items
 
 @router.get(
     "/{candidate_id}",
@@ -51,7 +85,7 @@ def get_candidate(
     candidate_id: int = Path(..., ge=1, description="The ID of the candidate to retrieve"),
     db: Session = Depends(get_db)
 ):
-    return CandidateController.get_candidate(db, candidate_id)
+    return candidate_controller.get_candidate(db, candidate_id)
 
 @router.post(
     "/",
@@ -78,9 +112,10 @@ def create_candidate(
             "education": "Bachelor's in Computer Science"
         }
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
 ):
-    return CandidateController.create_candidate(db, candidate)
+    return candidate_controller.create_candidate(db, candidate, current_user)
 
 @router.put(
     "/{candidate_id}",
@@ -94,6 +129,28 @@ def create_candidate(
 def update_candidate(
     candidate_id: int = Path(..., ge=1),
     candidate: schemas.CandidateBase = Body(...),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return candidate_controller.update_candidate(db, candidate_id, candidate, current_user)
+
+@router.post(
+    "/import",
+    response_model=schemas.CandidateImportResult,
+    summary="Bulk import candidates",
+    description="Stream a CSV (with a header row) or NDJSON body of candidates. "
+                "Rows are validated like POST /candidates/, duplicates are skipped "
+                "and reported, and the response lists the rows that failed.",
+    responses={
+        200: {"description": "Import finished; see failed/errors for rejected rows"},
+        403: {"description": "Not authorized to import candidates"},
+        415: {"description": "Unsupported upload format"}
+    }
+)
+async def import_candidates(
+    request: Request,
+    chunk_size: int = Query(1000, ge=1, le=5000, description="Rows validated and inserted per batch"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
 ):
-    return CandidateController.update_candidate(db, candidate_id, candidate) 
\ No newline at end of file
+    return await candidate_controller.import_candidates(db, request, chunk_size, current_user)
\ No newline at end of file
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, Query, Path, Body, HTTPException
+from fastapi import APIRouter, Depends, Query, Path, Body, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from src.database import get_db
 from src.models import schemas, entities
 from src.api.controllers.company_controller import CompanyController
 from src.services.auth_service import AuthService
 from src.services.company_service import CompanyService
+from src.core.pagination import apply_page_headers
 
 router = APIRouter(
     prefix="/companies",
@@ -20,14 +21,21 @@ company_service = CompanyService()
     "/",
     response_model=List[schemas.Company],
     summary="List all companies",
-    description="Get a list of all companies with pagination support"
+    description="Get a list of all companies with pagination support. "
+                "The X-Next-Cursor response header holds the cursor for the next page; "
+                "with include_total, X-Total-Count holds the number of matches."
 )
 def get_companies(
-    skip: int = Query(0, ge=0, description="Number of companies to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of companies to skip (ignored when cursor is set)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of companies to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    include_total: bool = Query(False, description="Report the number of matching rows in X-Total-Count"),
     db: Session = Depends(get_db)
 ):
-    return company_controller.get_companies(db, skip, limit)
+    page = company_controller.get_companies(db, skip, limit, cursor, include_total)
+    apply_page_headers(response, page)
+    return page.items
 
 @router.get(
     "/{company_id}",
@@ -30,6 +30,33 @@ def create_template(
         )
     return template_service.create_template(db, template, current_user)
 
+@router.put(
+    "/{template_id}",
+    response_model=schemas.EmailTemplate,
+    summary="Update an email template",
+    description="Change any field of a template; set is_active to false to deactivate it. "
+                "Every process picks up the change within a second.",
+    responses={
+        403: {"description": "Not authorized to update email templates"},
+        404: {"description": "Email template not found"}
+    }
+)
+def update_template(
+    template_id: int = Path(..., description="The ID of the email template"),
+    template: schemas.EmailTemplateUpdate = Body(...),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    if current_user.role != entities.UserRole.ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="Only admins can update email templates"
+        )
+    updated = template_service.update_template(db, template_id, template, current_user)
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Email template not found")
+    return updated
+
 @router.get(
     "/",
     response_model=List[schemas.EmailTemplate]
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, Query, Path, Body
+from fastapi import APIRouter, Depends, Query, Path, Body, Response
 from sqlalchemy.orm import Session
-from typing import List
-from src.database import get_db
+from typing import List, Optional
+from datetime import date, time
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import get_db, get_async_db
 from src.models import schemas, entities
 from src.api.controllers.interview_template_controller import InterviewTemplateController
 from src.api.controllers.interview_process_controller import InterviewProcessController
 from src.services.auth_service import AuthService
+from src.core.pagination import apply_page_headers
 
 router = APIRouter(
     prefix="/interviews",
@@ -20,14 +23,21 @@ process_controller = InterviewProcessController()
     "/templates",
     response_model=List[schemas.InterviewTemplate],
     summary="List interview templates",
-    description="Get a list of all active interview templates"
+    description="Get a list of all active interview templates. "
+                "The X-Next-Cursor response header holds the cursor for the next page; "
+                "with include_total, X-Total-Count holds the number of matches."
 )
 def get_templates(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    include_total: bool = Query(False, description="Report the number of matching rows in X-Total-Count"),
     db: Session = Depends(get_db)
 ):
-    return template_controller.get_templates(db, skip, limit)
+    page = template_controller.get_templates(db, skip, limit, cursor, include_total)
+    apply_page_headers(response, page)
+    return page.items
 
 @router.post(
     "/templates",
@@ -46,6 +56,27 @@ def create_template(
 ):
     return template_controller.create_template(db, template, current_user)
 
+@router.post(
+    "/applications/batch/start",
+    response_model=schemas.InterviewProcessBatchResult,
+    summary="Start interview processes for many applications",
+    description="Create the interview process and steps for each application from its job "
+                "opening's template and move it to interviewing, all in one transaction. "
+                "Applications that already have a process or whose job has no template are "
+                "reported and skipped. Notification emails are added to the outbox in the "
+                "same transaction.",
+    responses={
+        200: {"description": "Processes started, skipped or not found"},
+        403: {"description": "Not authorized to start interview processes"}
+    }
+)
+def start_interview_processes(
+    batch: schemas.InterviewProcessBatchStart = Body(...),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return process_controller.start_processes(db, batch, current_user)
+
 @router.post(
     "/applications/{application_id}/start",
     response_model=schemas.InterviewStep,
@@ -71,13 +102,65 @@ def start_interview_process(
     responses={
         200: {"description": "Step updated successfully"},
         403: {"description": "Not authorized to update step"},
-        404: {"description": "Step not found"}
+        404: {"description": "Step not found"},
+        409: {"description": "The interviewer is already booked at that time"}
     }
 )
 async def update_interview_step(
     step_id: int = Path(..., ge=1),
     update: schemas.InterviewStepUpdate = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return await process_controller.update_step(db, step_id, update, current_user) 
+
+@router.post(
+    "/schedule/check",
+    response_model=List[schemas.ScheduleCheckResult],
+    summary="Check a schedule for conflicts",
+    description="Validate many proposed interview bookings at once, e.g. a whole week's "
+                "schedule, against existing bookings and against each other. Durations "
+                "default to the step's template duration. Nothing is saved.",
+    responses={
+        400: {"description": "Unknown interview step"},
+        403: {"description": "Not authorized to check schedules"}
+    }
+)
+def check_schedule(
+    request: schemas.ScheduleCheckRequest = Body(...),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return process_controller.check_schedule(db, request, current_user)
+
+@router.get(
+    "/schedule/free-slots",
+    response_model=List[schemas.FreeSlot],
+    summary="Find free interview slots",
+    description="The earliest slots in the date range where at least one interviewer is "
+                "free for duration_minutes, within working hours (UTC). With step_type, only "
+                "interviewers who have run that kind of step before are considered. Each slot "
+                "lists every interviewer free for all of it.",
+    responses={
+        400: {"description": "Invalid date range or working hours"},
+        403: {"description": "Not authorized to search availability"}
+    }
+)
+def find_free_slots(
+    date_from: date = Query(..., description="First day searched"),
+    date_to: date = Query(..., description="Last day searched (inclusive, at most 31 days later)"),
+    duration_minutes: int = Query(60, ge=5, le=480),
+    step_type: Optional[entities.InterviewStepType] = Query(None, description="Kind of interview to staff"),
+    interviewer_ids: Optional[List[int]] = Query(None, description="Only consider these interviewers"),
+    limit: int = Query(5, ge=1, le=100),
+    day_start: time = Query(time(9), description="Start of working hours, UTC"),
+    day_end: time = Query(time(17), description="End of working hours, UTC"),
+    granularity_minutes: int = Query(30, ge=5, le=240, description="Slots start on this grid"),
+    include_weekends: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: entities.User = Depends(AuthService.get_current_active_user)
 ):
-    return await process_controller.update_step(db, step_id, update, current_user) 
\ No newline at end of file
+    return process_controller.find_free_slots(
+        db, date_from, date_to, duration_minutes, step_type, interviewer_ids, limit,
+        day_start, day_end, granularity_minutes, include_weekends, current_user
+    )
\ No newline at end of file
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, Query, Path, Body
+from fastapi import APIRouter, Depends, Query, Path, Body, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from src.database import get_db
 from src.models import schemas, entities
 from src.api.controllers.job_opening_controller import JobOpeningController
+from src.core.pagination import apply_page_headers
+from src.services.auth_service import AuthService
 
 router = APIRouter(
     prefix="/job-openings",
@@ -11,20 +13,58 @@ router = APIRouter(
     responses={404: {"description": "Not found"}}
 )
 
+job_opening_controller = JobOpeningController()
+
 @router.get(
     "/",
     response_model=List[schemas.JobOpening],
     summary="List all job openings",
-    description="Get a list of all job openings with optional filtering"
+    description="Get a list of all job openings with optional filtering. "
+                "The X-Next-Cursor response header holds the cursor for the next page; "
+                "with include_total, X-Total-Count holds the number of matches."
 )
 def get_job_openings(
-    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of jobs to skip (ignored when cursor is set)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of jobs to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    include_total: bool = Query(False, description="Report the number of matching rows in X-Total-Count"),
     company_id: Optional[int] = Query(None, description="Filter by company ID"),
     status: Optional[entities.JobStatus] = Query(None, description="Filter by job status"),
     db: Session = Depends(get_db)
 ):
-    return JobOpeningController.get_job_openings(db, skip, limit, company_id, status)
+    page = job_opening_controller.get_job_openings(db, skip, limit, company_id, status, cursor, include_total)
+    apply_page_headers(response, page)
+    return page.items
+
+@router.get(
+    "/search",
+    response_model=schemas.JobSearchResult,
+    summary="Search job openings",
+    description="Keyword search over title, description, requirements and company name "
+                "(the last word also matches as a prefix), narrowed by facet filters. "
+                "Repeat a facet parameter to select several values. Each facet lists "
+                "its values with the number of jobs that selecting it would return."
+)
+def search_job_openings(
+    q: Optional[str] = Query(None, max_length=200, description="Keywords, e.g. python engineer"),
+    location: Optional[List[str]] = Query(None, description="Filter by location"),
+    job_type: Optional[List[str]] = Query(None, description="Filter by job type"),
+    experience_level: Optional[List[str]] = Query(None, description="Filter by experience level"),
+    company_id: Optional[List[int]] = Query(None, description="Filter by company ID"),
+    status: Optional[List[entities.JobStatus]] = Query(None, description="Filter by job status"),
+    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of jobs to return"),
+    db: Session = Depends(get_db)
+):
+    filters = {
+        "location": location,
+        "job_type": job_type,
+        "experience_level": experience_level,
+        "company": [str(id) for id in company_id] if company_id else None,
+        "status": [s.value for s in status] if status else None,
+    }
+    return job_opening_controller.search_job_openings(db, q, filters, skip, limit)
 
 @router.get(
     "/{job_id}",
@@ -35,7 +75,24 @@ def get_job_opening(
     job_id: int = Path(..., ge=1, description="The ID of the job opening to retrieve"),
     db: Session = Depends(get_db)
 ):
-    return JobOpeningController.get_job_opening(db, job_id)
+    return job_opening_controller.get_job_opening(db, job_id)
+
+@router.get(
+    "/{job_id}/matches",
+    response_model=List[schemas.CandidateMatch],
+    summary="Rank candidates for a job opening",
+    description="Top candidates for the job, scored on skills named in the title and "
+                "requirements, years of experience against the requirements or "
+                "experience level, and location.",
+    responses={403: {"description": "Not authorized to match candidates"}}
+)
+def match_candidates(
+    job_id: int = Path(..., ge=1, description="The ID of the job opening to match"),
+    limit: int = Query(20, ge=1, le=100, description="Number of candidates to return"),
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
+):
+    return job_opening_controller.match_candidates(db, job_id, limit, current_user)
 
 @router.post(
     "/",
@@ -62,6 +119,7 @@ def create_job_opening(
             "experience_level": "Senior"
         }
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: entities.User = Depends(AuthService.get_current_active_user)
 ):
-    return JobOpeningController.create_job_opening(db, job) 
\ No newline at end of file
+    return job_opening_controller.create_job_opening(db, job, current_user) 
\ No newline at end of file
@@ -9,6 +9,7 @@ load_dotenv()
 
 class DatabaseConfig(BaseModel):
     DRIVER: str = "postgresql+psycopg2"
+    ASYNC_DRIVER: str = "postgresql+asyncpg"
     HOST: str = Field(default="localhost", env="DB_HOST")
     PORT: int = Field(default=3306, env="DB_PORT")
     USERNAME: str = Field(default="root", env="DB_USER")
@@ -16,11 +17,17 @@ class DatabaseConfig(BaseModel):
     DATABASE: str = Field(default="recruitment", env="DB_NAME")
     SSL_MODE: str = Field(default="require", env="DB_SSL_MODE")
     SSL_CA: Optional[str] = Field(default=None, env="DB_SSL_CA")
-    POOL_SIZE: int = Field(default=5, env="DB_POOL_SIZE")
-    MAX_OVERFLOW: int = Field(default=10, env="DB_MAX_OVERFLOW")
-    POOL_TIMEOUT: int = Field(default=30, env="DB_POOL_TIMEOUT")
-    POOL_RECYCLE: int = Field(default=1800, env="DB_POOL_RECYCLE")
-    ECHO: bool = Field(default=False, env="DB_ECHO")
+    POOL_SIZE: int = Field(default=int(os.getenv("DB_POOL_SIZE", "5")), env="DB_POOL_SIZE")
+    MAX_OVERFLOW: int = Field(default=int(os.getenv("DB_MAX_OVERFLOW", "10")), env="DB_MAX_OVERFLOW")
+    POOL_TIMEOUT: int = Field(default=int(os.getenv("DB_POOL_TIMEOUT", "30")), env="DB_POOL_TIMEOUT")
+    POOL_RECYCLE: int = Field(default=int(os.getenv("DB_POOL_RECYCLE", "1800")), env="DB_POOL_RECYCLE")
+    ECHO: bool = Field(default=os.getenv("DB_ECHO", "false").lower() == "true", env="DB_ECHO")
+    # Comma-separated read replica URLs; empty sends all traffic to the primary
+    REPLICA_URLS: str = Field(default=os.getenv("DB_REPLICA_URLS", ""), env="DB_REPLICA_URLS")
+    REPLICA_MAX_LAG_SECONDS: float = Field(
+        default=float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5")),
+        env="DB_REPLICA_MAX_LAG_SECONDS"
+    )
 
     def get_connection_url(self) -> str:
         if os.getenv("ENVIRONMENT") == "development":
@@ -41,6 +48,15 @@ class DatabaseConfig(BaseModel):
         return f"{self.DRIVER}://{self.USERNAME}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DATABASE}?" + \
                "&".join(f"{key}={value}" for key, value in params.items() if value is not None)
 
+    def get_replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.REPLICA_URLS.split(",") if url.strip()]
+
+    def get_async_connection_url(self) -> str:
+        if os.getenv("ENVIRONMENT") == "development":
+            return "sqlite+aiosqlite:///./recruitment.db"
+        # asyncpg takes SSL settings through connect_args, not the query string
+        return f"{self.ASYNC_DRIVER}://{self.USERNAME}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DATABASE}"
+
 class Settings(BaseModel):
     # Environment
     ENVIRONMENT: str = Field(default="development", env="ENVIRONMENT")
@@ -54,6 +70,7 @@ class Settings(BaseModel):
     # Database
     db: DatabaseConfig = DatabaseConfig()
     DATABASE_URL: str = Field(default="")
+    ASYNC_DATABASE_URL: str = Field(default="")
 
     # JWT Settings
     SECRET_KEY: str = Field(
@@ -62,6 +79,34 @@ class Settings(BaseModel):
     )
     ALGORITHM: str = Field(default="HS256", env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
+    # bcrypt threads (0: up to 4, one per CPU) and how many checks may queue
+    # before logins are turned away with a 429
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=int(os.getenv("PASSWORD_HASH_WORKERS", "0")),
+        env="PASSWORD_HASH_WORKERS"
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32")),
+        env="PASSWORD_HASH_MAX_PENDING"
+    )
+    # Verified tokens kept per process, and the revocation filter's sizing
+    VERIFIED_TOKEN_CACHE_SIZE: int = Field(
+        default=int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", "10000")),
+        env="VERIFIED_TOKEN_CACHE_SIZE"
+    )
+    TOKEN_REVOCATION_CAPACITY: int = Field(
+        default=int(os.getenv("TOKEN_REVOCATION_CAPACITY", "100000")),
+        env="TOKEN_REVOCATION_CAPACITY"
+    )
+    # Authenticated users kept in memory per process, and for how long
+    PRINCIPAL_CACHE_TTL: float = Field(
+        default=float(os.getenv("PRINCIPAL_CACHE_TTL", "60")),
+        env="PRINCIPAL_CACHE_TTL"
+    )
+    PRINCIPAL_CACHE_SIZE: int = Field(
+        default=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")),
+        env="PRINCIPAL_CACHE_SIZE"
+    )
 
     # Email Settings
     SMTP_HOST: str = Field(default="smtp.gmail.com", env="SMTP_HOST")
@@ -69,13 +114,54 @@ class Settings(BaseModel):
     SMTP_USER: str = Field(default="your-email@gmail.com", env="SMTP_USER")
     SMTP_PASSWORD: str = Field(default="your-app-password", env="SMTP_PASSWORD")
     FROM_EMAIL: str = Field(default="recruitment@yourcompany.com", env="FROM_EMAIL")
+    SMTP_USE_TLS: bool = Field(
+        default=os.getenv("SMTP_USE_TLS", "true").lower() == "true",
+        env="SMTP_USE_TLS"
+    )
+    # Open SMTP sessions kept for reuse, and when to recycle them
+    SMTP_POOL_SIZE: int = Field(
+        default=int(os.getenv("SMTP_POOL_SIZE", "5")),
+        env="SMTP_POOL_SIZE"
+    )
+    SMTP_POOL_MAX_MESSAGES: int = Field(
+        default=int(os.getenv("SMTP_POOL_MAX_MESSAGES", "100")),
+        env="SMTP_POOL_MAX_MESSAGES"
+    )
+    SMTP_POOL_IDLE_TIMEOUT: float = Field(
+        default=float(os.getenv("SMTP_POOL_IDLE_TIMEOUT", "30")),
+        env="SMTP_POOL_IDLE_TIMEOUT"
+    )
+    # Compiled email templates kept in memory per process
+    EMAIL_TEMPLATE_CACHE_SIZE: int = Field(
+        default=int(os.getenv("EMAIL_TEMPLATE_CACHE_SIZE", "256")),
+        env="EMAIL_TEMPLATE_CACHE_SIZE"
+    )
+    # Background delivery of the email outbox
+    EMAIL_WORKER_ENABLED: bool = Field(
+        default=os.getenv("EMAIL_WORKER_ENABLED", "true").lower() == "true",
+        env="EMAIL_WORKER_ENABLED"
+    )
+    EMAIL_WORKER_CONCURRENCY: int = Field(
+        default=int(os.getenv("EMAIL_WORKER_CONCURRENCY", "10")),
+        env="EMAIL_WORKER_CONCURRENCY"
+    )
+    EMAIL_MAX_ATTEMPTS: int = Field(
+        default=int(os.getenv("EMAIL_MAX_ATTEMPTS", "8")),
+        env="EMAIL_MAX_ATTEMPTS"
+    )
 
     # Application Settings
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
+    # JSON-lines file the query profiler appends new query fingerprints to
+    QUERY_FINGERPRINT_FILE: Optional[str] = Field(
+        default=os.getenv("QUERY_FINGERPRINT_FILE"),
+        env="QUERY_FINGERPRINT_FILE"
+    )
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.DATABASE_URL = self.db.get_connection_url()
+        self.ASYNC_DATABASE_URL = self.db.get_async_connection_url()
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -0,0 +1,126 @@
+import asyncio
+import base64
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+@dataclass
+class ReceivedMessage:
+    mail_from: str
+    rcpt_tos: List[str]
+    data: bytes
+
+@dataclass
+class DebugSMTPServer:
+    """
+    Minimal in-process SMTP server that accepts and records every message,
+    for tests and local benchmarks. No TLS; AUTH PLAIN accepts anything.
+
+    connect_delay and message_delay simulate a slow relay, and fail_next
+    rejects that many upcoming messages with a transient 451.
+    """
+    host: str = "127.0.0.1"
+    port: int = 0
+    connect_delay: float = 0.0
+    message_delay: float = 0.0
+    fail_next: int = 0
+    messages: List[ReceivedMessage] = field(default_factory=list)
+    connections: int = 0
+    _server: Optional[asyncio.AbstractServer] = field(default=None, init=False, repr=False)
+    _writers: Set[asyncio.StreamWriter] = field(default_factory=set, init=False, repr=False)
+    _handlers: Set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+
+    async def start(self) -> "DebugSMTPServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            # Let open sessions end before the loop does
+            self.disconnect_all()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def disconnect_all(self) -> None:
+        """Drop every open client connection, as a relay's idle timeout would"""
+        for writer in list(self._writers):
+            writer.close()
+
+    async def __aenter__(self) -> "DebugSMTPServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        self._handlers.add(asyncio.current_task())
+        if self.connect_delay:
+            await asyncio.sleep(self.connect_delay)
+
+        def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+
+        reply("220 localhost debug ESMTP")
+        mail_from, rcpt_tos = "", []
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors="replace").strip()
+                verb = command.split(" ", 1)[0].upper()
+                if verb == "EHLO":
+                    reply("250-localhost")
+                    reply("250-8BITMIME")
+                    reply("250 AUTH PLAIN")
+                elif verb == "HELO":
+                    reply("250 localhost")
+                elif verb == "AUTH":
+                    if len(command.split()) < 3:
+                        reply("334 ")
+                        base64.b64decode(await reader.readline())
+                    reply("235 2.7.0 Authentication successful")
+                elif verb == "MAIL":
+                    mail_from, rcpt_tos = command[10:].strip(" <>"), []
+                    reply("250 OK")
+                elif verb == "RCPT":
+                    rcpt_tos.append(command[8:].strip(" <>"))
+                    reply("250 OK")
+                elif verb == "DATA":
+                    reply("354 End data with <CR><LF>.<CR><LF>")
+                    await writer.drain()
+                    lines = []
+                    while True:
+                        data_line = await reader.readline()
+                        if not data_line or data_line in (b".\r\n", b".\n"):
+                            break
+                        lines.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                    if self.message_delay:
+                        await asyncio.sleep(self.message_delay)
+                    if self.fail_next > 0:
+                        self.fail_next -= 1
+                        reply("451 4.3.0 Try again later")
+                    else:
+                        self.messages.append(ReceivedMessage(mail_from, rcpt_tos, b"".join(lines)))
+                        reply("250 OK")
+                elif verb in ("RSET", "NOOP"):
+                    if verb == "RSET":
+                        mail_from, rcpt_tos = "", []
+                    reply("250 OK")
+                elif verb == "QUIT":
+                    reply("221 Bye")
+                    await writer.drain()
+                    break
+                else:
+                    reply("502 Command not implemented")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
\ No newline at end of file
@@ -4,10 +4,91 @@ import time
 from loguru import logger
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from src.core.config import get_settings
+import json
+import re
 import threading
+from datetime import datetime
 
 local = threading.local()
 
+# Bound parameter placeholders: qmark, format and pyformat styles
+_PLACEHOLDER = re.compile(r"\?|%s|%\(\w+\)s")
+# An expanded IN list, e.g. "IN (?, ?, ?)"
+_IN_LIST = re.compile(r"\bIN \(((?:\?|%s|%\(\w+\)s)(?:, (?:\?|%s|%\(\w+\)s))+)\)", re.I)
+
+def _collapse_in_lists(statement: str, parameters):
+    """Render each expanded IN list as one placeholder, so list lengths don't make new shapes"""
+    dropped = set()
+
+    def collapse(match):
+        placeholders = _PLACEHOLDER.findall(match.group(1))
+        start = len(_PLACEHOLDER.findall(statement, 0, match.start()))
+        dropped.update(range(start + 1, start + len(placeholders)))
+        return f"IN ({placeholders[0]})"
+
+    collapsed = _IN_LIST.sub(collapse, statement)
+    if isinstance(parameters, dict):
+        names = set(re.findall(r"%\((\w+)\)s", collapsed))
+        parameters = {name: value for name, value in parameters.items() if name in names}
+    elif parameters:
+        parameters = [value for i, value in enumerate(parameters) if i not in dropped]
+    return collapsed, parameters
+
+def _redact(value):
+    """A stand-in of the same type, good enough for EXPLAIN but leaking nothing"""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return type(value)(0)
+    if isinstance(value, (str, bytes)):
+        return ""
+    if isinstance(value, datetime):
+        return datetime(1970, 1, 1)
+    return None
+
+class QueryFingerprintRecorder:
+    """
+    Appends each distinct query shape to a JSON-lines file for the index
+    advisor. Parameters are recorded only as redacted stand-ins, and at
+    most max_shapes shapes are kept: more than that means queries with
+    inlined literals, which would grow the file without bound.
+    """
+
+    RECORDED_VERBS = ("SELECT", "UPDATE", "DELETE")
+
+    def __init__(self, path: str, max_shapes: int = 10000):
+        self.path = path
+        self.max_shapes = max_shapes
+        self._seen = set()
+        self._full = False
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, parameters, executemany: bool):
+        if executemany or not statement.lstrip().upper().startswith(self.RECORDED_VERBS):
+            return
+        statement, parameters = _collapse_in_lists(" ".join(statement.split()), parameters)
+        with self._lock:
+            if statement in self._seen or self._full:
+                return
+            if len(self._seen) >= self.max_shapes:
+                self._full = True
+                logger.warning(f"Recorded {self.max_shapes} query shapes; no longer recording new ones")
+                return
+            self._seen.add(statement)
+            if isinstance(parameters, dict):
+                parameters = {name: _redact(value) for name, value in parameters.items()}
+            elif parameters:
+                parameters = [_redact(value) for value in parameters]
+            with open(self.path, "a") as f:
+                f.write(json.dumps(
+                    {"statement": statement, "parameters": parameters},
+                    default=str
+                ) + "\n")
+
+_fingerprint_file = get_settings().QUERY_FINGERPRINT_FILE
+fingerprint_recorder = QueryFingerprintRecorder(_fingerprint_file) if _fingerprint_file else None
+
 @event.listens_for(Engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     if not hasattr(local, "query_start_time"):
@@ -18,6 +99,9 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
 @event.listens_for(Engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     total = time.time() - local.query_start_time[threading.get_ident()]
+
+    if fingerprint_recorder:
+        fingerprint_recorder.record(statement, parameters, executemany)
     
     # Log slow queries (more than 100ms)
     if total > 0.1:
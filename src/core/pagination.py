@@ -0,0 +1,90 @@
+import base64
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+from fastapi import Response
+
+T = TypeVar('T')
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+# "true" when X-Total-Count came from the count cache rather than this query
+TOTAL_COUNT_APPROXIMATE_HEADER = "X-Total-Count-Approximate"
+
+@dataclass
+class Page(Generic[T]):
+    """A page of results plus the opaque cursor pointing at the next page"""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    # Only filled in when the caller asked for a total
+    total: Optional[int] = None
+    total_is_approximate: bool = False
+
+class CountCache:
+    """Recent row counts per (table, filters) with the time they were taken"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._counts: Dict[Hashable, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, max_age: float) -> Optional[int]:
+        with self._lock:
+            cached = self._counts.get(key)
+        if cached and time.monotonic() - cached[1] <= max_age:
+            return cached[0]
+        return None
+
+    def set(self, key: Hashable, count: int) -> None:
+        with self._lock:
+            if len(self._counts) >= self.max_entries and key not in self._counts:
+                # Drop the oldest entry
+                oldest = min(self._counts, key=lambda k: self._counts[k][1])
+                del self._counts[oldest]
+            self._counts[key] = (count, time.monotonic())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+count_cache = CountCache()
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row into an opaque token"""
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a token produced by encode_cursor, raising ValueError if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(payload, list) or len(payload) != size:
+        raise ValueError("Invalid cursor")
+    values = []
+    for value in payload:
+        if isinstance(value, dict):
+            try:
+                value = datetime.fromisoformat(value["dt"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+        values.append(value)
+    return values
+
+def apply_page_headers(response: Response, page: Page) -> None:
+    """Expose pagination metadata as headers so list bodies stay plain arrays"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total)
+        if page.total_is_approximate:
+            response.headers[TOTAL_COUNT_APPROXIMATE_HEADER] = "true"
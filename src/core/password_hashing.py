@@ -0,0 +1,99 @@
+import asyncio
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+from src.core.config import get_settings
+from src.database.pool import PoolWaitStats
+from src.models import entities
+
+T = TypeVar("T")
+
+class PasswordHasherBusy(Exception):
+    """More password checks are queued than the hasher accepts"""
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification on a dedicated thread pool, off
+    the event loop; bcrypt releases the GIL, so the workers run in
+    parallel.
+
+    At most max_pending calls may be running or queued. Beyond that an
+    async call fails at once with PasswordHasherBusy instead of queueing,
+    so a login burst is shed rather than piling up. hash_sync callers
+    (user creation, the seeder) have no 429 to return and wait their turn.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.wait_stats = PoolWaitStats()
+        self.metrics: Counter = Counter()
+
+    def _submit(self, operation: str, fn: Callable[..., T], *args, shed: bool = True) -> Future:
+        with self._lock:
+            if shed and self._pending >= self.max_pending:
+                self.metrics["rejected"] += 1
+                raise PasswordHasherBusy(f"{self._pending} password checks already pending")
+            self._pending += 1
+        queued_at = time.perf_counter()
+
+        def run() -> T:
+            started = time.perf_counter()
+            self.wait_stats.observe(started - queued_at)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    self.metrics[operation] += 1
+                    self.metrics[f"{operation}_seconds"] += time.perf_counter() - started
+
+        try:
+            return self._executor.submit(run)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(
+            self._submit("verified", entities.User.verify_password, plain_password, hashed_password)
+        )
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit("hashed", entities.User.hash_password, password))
+
+    def hash_sync(self, password: str) -> str:
+        """hash() for synchronous callers such as the seeder; blocks the calling thread"""
+        return self._submit("hashed", entities.User.hash_password, password, shed=False).result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = self._pending
+            metrics = dict(self.metrics)
+        for operation in ("verified", "hashed"):
+            if metrics.get(operation):
+                metrics[f"{operation}_avg_ms"] = round(
+                    metrics[f"{operation}_seconds"] * 1000 / metrics[operation], 3
+                )
+            metrics.pop(f"{operation}_seconds", None)
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": pending,
+            "wait_time": self.wait_stats.snapshot(),
+            **metrics,
+        }
+
+settings = get_settings()
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1),
+    settings.PASSWORD_HASH_MAX_PENDING
+)
\ No newline at end of file
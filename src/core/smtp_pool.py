@@ -0,0 +1,144 @@
+import asyncio
+import time
+from collections import Counter, deque
+from email.message import Message
+from typing import Deque, Optional, Tuple
+import aiosmtplib
+from loguru import logger
+
+# Errors after which a connection can't be trusted for another message
+CONNECTION_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError, ConnectionError)
+
+class SMTPConnectionPool:
+    """
+    Authenticated SMTP sessions kept open and reused across messages.
+
+    At most max_size sessions are in use at once; callers beyond that wait
+    for one to be released. Idle sessions are reused newest first and are
+    dropped after idle_timeout seconds or max_messages messages, so a
+    relay's own idle timeout or per-session limit is rarely hit. A reused
+    session that turns out to have been closed by the server is replaced
+    by a fresh one and the message is retried on it once.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        max_size: int = 5,
+        max_messages: int = 100,
+        idle_timeout: float = 30.0,
+        timeout: float = 60.0
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username or None
+        self.password = password or None
+        self.use_tls = use_tls
+        self.max_size = max_size
+        self.max_messages = max_messages
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.metrics: Counter = Counter()
+        # (session, messages sent on it, when it was released)
+        self._idle: Deque[Tuple[aiosmtplib.SMTP, int, float]] = deque()
+        self._slots = asyncio.Semaphore(max_size)
+        self._in_use = 0
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    async def send(self, message: Message) -> None:
+        async with self._slots:
+            self._in_use += 1
+            try:
+                await self._send(message)
+            finally:
+                self._in_use -= 1
+
+    async def _send(self, message: Message) -> None:
+        client, sent, reused = await self._acquire()
+        try:
+            await client.send_message(message)
+        except CONNECTION_ERRORS:
+            await self._discard(client)
+            if not reused:
+                raise
+            # Stale pooled session: the message never reached the server
+            self.metrics["stale"] += 1
+            self.logger.debug(f"Pooled SMTP session to {self.hostname} was closed, reconnecting")
+            client, sent = await self._connect(), 0
+            try:
+                await client.send_message(message)
+            except Exception:
+                await self._discard(client)
+                raise
+        except aiosmtplib.SMTPResponseException:
+            # Refused by the server; the session itself is still usable
+            # once the transaction is reset
+            try:
+                await client.rset()
+            except Exception:
+                await self._discard(client)
+            else:
+                await self._release(client, sent)
+            raise
+        except Exception:
+            await self._discard(client)
+            raise
+        self.metrics["sent"] += 1
+        await self._release(client, sent + 1)
+
+    async def _acquire(self) -> Tuple[aiosmtplib.SMTP, int, bool]:
+        now = time.monotonic()
+        while self._idle:
+            client, sent, released_at = self._idle.pop()
+            if client.is_connected and now - released_at < self.idle_timeout:
+                self.metrics["reused"] += 1
+                return client, sent, True
+            await self._discard(client)
+        return await self._connect(), 0, False
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            timeout=self.timeout
+        )
+        # Connects, upgrades with STARTTLS if offered and logs in
+        await client.connect()
+        self.metrics["connected"] += 1
+        return client
+
+    async def _release(self, client: aiosmtplib.SMTP, sent: int) -> None:
+        if sent >= self.max_messages:
+            await self._discard(client)
+        else:
+            self._idle.append((client, sent, time.monotonic()))
+
+    async def _discard(self, client: aiosmtplib.SMTP) -> None:
+        self.metrics["closed"] += 1
+        if not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    async def close(self) -> None:
+        """Close every idle session"""
+        while self._idle:
+            client, _, _ = self._idle.pop()
+            await self._discard(client)
+
+    def stats(self) -> dict:
+        return {
+            "max_size": self.max_size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            **self.metrics,
+        }
\ No newline at end of file
@@ -1,8 +1,13 @@
-from sqlalchemy import create_engine, event
+from fastapi import Request
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from src.core.config import get_settings
-from sqlalchemy.pool import QueuePool
+from src.database.pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from src.database.routing import (
+    MAX_STALENESS_HEADER, READ_METHODS, ReplicaSet, RoutingSession, parse_max_staleness
+)
 import ssl
 
 settings = get_settings()
@@ -15,14 +20,73 @@ connect_args = {}
 if SQLALCHEMY_DATABASE_URL.startswith('sqlite'):
     connect_args["check_same_thread"] = False
 
+def _engine_options(url: str, poolclass) -> dict:
+    # pre_ping validates a connection on checkout and transparently replaces
+    # stale ones; SQLite keeps SQLAlchemy's default pool for its driver
+    options = {"echo": settings.db.ECHO, "pool_pre_ping": True}
+    if not url.startswith('sqlite'):
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.db.POOL_SIZE,
+            max_overflow=settings.db.MAX_OVERFLOW,
+            pool_timeout=settings.db.POOL_TIMEOUT,
+            pool_recycle=settings.db.POOL_RECYCLE,
+        )
+    return options
+
 # Create SQLAlchemy engine
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args=connect_args
+    connect_args=connect_args,
+    **_engine_options(SQLALCHEMY_DATABASE_URL, InstrumentedQueuePool)
+)
+
+# Read replicas for GET traffic
+replica_set = ReplicaSet(
+    [
+        create_engine(
+            url,
+            connect_args={"check_same_thread": False} if url.startswith('sqlite') else {},
+            **_engine_options(url, InstrumentedQueuePool)
+        )
+        for url in settings.db.get_replica_urls()
+    ],
+    max_lag_seconds=settings.db.REPLICA_MAX_LAG_SECONDS
+)
+
+# Create SessionLocal class; sessions only use replicas when read_only=True
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replica_set=replica_set
+)
+
+# Async engine for routes that run on the event loop
+# (aiosqlite in development, asyncpg for PostgreSQL)
+ASYNC_SQLALCHEMY_DATABASE_URL = settings.ASYNC_DATABASE_URL
+
+async_connect_args = {}
+if not ASYNC_SQLALCHEMY_DATABASE_URL.startswith('sqlite'):
+    if settings.db.SSL_CA:
+        async_connect_args["ssl"] = ssl.create_default_context(cafile=settings.db.SSL_CA)
+    elif settings.db.SSL_MODE:
+        async_connect_args["ssl"] = settings.db.SSL_MODE
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    connect_args=async_connect_args,
+    **_engine_options(ASYNC_SQLALCHEMY_DATABASE_URL, InstrumentedAsyncQueuePool)
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: expired attributes can't be lazy-loaded under asyncio
+AsyncSessionLocal = sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Create Base class
 Base = declarative_base()
@@ -33,23 +97,22 @@ def init_db():
     Base.metadata.create_all(bind=engine)  # Create all tables
 
 # Dependency
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request):
+    # Reads go to a replica unless the request writes or asks for fresher data
+    db = SessionLocal(
+        read_only=request.method in READ_METHODS,
+        max_staleness=parse_max_staleness(request.headers.get(MAX_STALENESS_HEADER))
+    )
     try:
         yield db
     finally:
         db.close()
 
-__all__ = ['engine', 'Base', 'SessionLocal', 'get_db', 'init_db']
-
-# Add ping/reconnect functionality
-@event.listens_for(engine, "engine_connect")
-def ping_connection(connection, branch):
-    if branch:
-        return
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
 
-    try:
-        connection.scalar("SELECT 1")
-    except Exception:
-        connection.connection.close()
-        raise 
\ No newline at end of file
+__all__ = [
+    'engine', 'Base', 'SessionLocal', 'get_db', 'init_db',
+    'async_engine', 'AsyncSessionLocal', 'get_async_db', 'replica_set'
+]
@@ -0,0 +1,109 @@
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List
+from loguru import logger
+from sqlalchemy.engine import Engine
+
+# Comparison of a qualified column ("table.column <op>") in SQL text
+_QUALIFIED_COLUMN = r"\b{alias}\.\"?(\w+)\"?\s*(?:=|!=|<>|<=|>=|<|>|\bIN\b|\bIS\b|\bLIKE\b)"
+# Comparison of a bare column in a PostgreSQL plan filter, e.g. "((status)::text = 'x'::text)"
+_FILTER_COLUMN = re.compile(r"\(?\"?(\w+)\"?\)*(?:::[\w ]+)?\)*\s*(?:=|<>|<=|>=|<|>|~~)")
+_WHERE_CLAUSE = re.compile(r"\bWHERE\b(.*?)(?:\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|$)", re.I | re.S)
+
+@dataclass
+class IndexFinding:
+    table: str
+    columns: List[str]
+    statement: str
+    occurrences: int = 1
+
+    @property
+    def suggestion(self) -> str:
+        name = f"ix_{self.table}_{'_'.join(self.columns)}"
+        return f"CREATE INDEX {name} ON {self.table} ({', '.join(self.columns)})"
+
+def load_fingerprints(path: Path) -> List[dict]:
+    """Read the JSON-lines file written by the query profiler"""
+    fingerprints = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                fingerprints.append(json.loads(line))
+    return fingerprints
+
+def advise(engine: Engine, fingerprints: Iterable[dict]) -> List[IndexFinding]:
+    """EXPLAIN every recorded query and collect filtered full-table scans"""
+    findings = {}
+    for fingerprint in fingerprints:
+        statement = fingerprint["statement"]
+        try:
+            scans = _full_scans(engine, statement, fingerprint.get("parameters"))
+        except Exception as e:
+            logger.warning(f"Could not EXPLAIN query: {str(e)}\n{statement}")
+            continue
+        for table, columns in scans:
+            key = (table, tuple(columns))
+            if key in findings:
+                findings[key].occurrences += 1
+            else:
+                findings[key] = IndexFinding(table, columns, statement)
+    return sorted(findings.values(), key=lambda f: -f.occurrences)
+
+def _full_scans(engine: Engine, statement: str, parameters) -> List[tuple]:
+    if isinstance(parameters, list):
+        parameters = tuple(parameters)
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            plan = connection.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + statement, parameters or {}
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return _postgres_scans(plan[0]["Plan"])
+        rows = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters or ()
+        ).fetchall()
+        return _sqlite_scans([row[-1] for row in rows], statement)
+
+def _sqlite_scans(details: List[str], statement: str) -> List[tuple]:
+    # "SCAN applications" (or "SCAN TABLE applications AS applications_1")
+    # is a full scan; indexed access shows up as SEARCH or "USING ... INDEX"
+    scans = []
+    where = _WHERE_CLAUSE.search(statement)
+    for detail in details:
+        match = re.match(r"SCAN (?:TABLE )?(\w+)(?: AS (\w+))?", detail)
+        if not match or "INDEX" in detail or not where:
+            continue
+        table, alias = match.group(1), match.group(2) or match.group(1)
+        columns = _unique(re.findall(_QUALIFIED_COLUMN.format(alias=re.escape(alias)), where.group(1)))
+        if columns:
+            scans.append((table, columns))
+    return scans
+
+def _postgres_scans(plan: dict) -> List[tuple]:
+    scans = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Filter"):
+        columns = _unique(_FILTER_COLUMN.findall(plan["Filter"]))
+        if columns:
+            scans.append((plan["Relation Name"], columns))
+    for child in plan.get("Plans", []):
+        scans.extend(_postgres_scans(child))
+    return scans
+
+def _unique(columns: List[str]) -> List[str]:
+    return list(dict.fromkeys(columns))
+
+def format_report(findings: List[IndexFinding]) -> str:
+    if not findings:
+        return "No missing indexes found"
+    lines = []
+    for finding in findings:
+        lines.append(
+            f"{finding.table} ({', '.join(finding.columns)}) - "
+            f"{finding.occurrences} query shape(s)\n"
+            f"  {finding.suggestion}\n"
+            f"  e.g. {finding.statement}"
+        )
+    return "\n".join(lines)
@@ -25,4 +25,67 @@ def upgrade():
 
 def downgrade():
     op.drop_index(op.f('ix_users_email'), table_name='users')
-    op.drop_table('users') 
\ No newline at end of file
+    op.drop_table('users') 
+
+# Applications that repeat an earlier application's (candidate_id, job_opening_id)
+_LATER_DUPLICATE = """
+    EXISTS (
+        SELECT 1 FROM applications earlier
+        WHERE earlier.candidate_id = applications.candidate_id
+          AND earlier.job_opening_id = applications.job_opening_id
+          AND earlier.id < applications.id
+    )
+"""
+
+# The earliest application with the same pair as application {column}
+_KEEPER = """
+    (
+        SELECT MIN(keeper.id) FROM applications keeper
+        JOIN applications duplicate
+          ON keeper.candidate_id = duplicate.candidate_id
+         AND keeper.job_opening_id = duplicate.job_opening_id
+        WHERE duplicate.id = {column}
+    )
+"""
+
+_QUERY_INDEXES = [
+    ("ix_job_openings_company_status", "job_openings", ["company_id", "status"]),
+    ("ix_candidates_created_at", "candidates", ["created_at"]),
+    ("ix_candidates_updated_at", "candidates", ["updated_at"]),
+    ("ix_applications_job_opening_status", "applications", ["job_opening_id", "status"]),
+    ("ix_applications_status", "applications", ["status"]),
+    ("ix_interview_template_steps_template_order", "interview_template_steps", ["template_id", "order"]),
+    ("ix_interview_steps_process_order", "interview_steps", ["process_id", "order"]),
+    ("ix_interview_steps_interviewer_scheduled", "interview_steps", ["interviewer_id", "scheduled_at"]),
+    ("ix_email_templates_type_active_name", "email_templates", ["type", "is_active", "name"]),
+]
+
+def upgrade_query_indexes():
+    """
+    Add the list/lookup indexes and the duplicate-application constraint to
+    tables created before them (create_all never alters existing tables).
+
+    Duplicate applications are merged into the earliest one first: their
+    interview processes and status history move to it, then they are
+    deleted.
+    """
+    for table in ("interview_processes", "application_status_history"):
+        op.execute(f"""
+            UPDATE {table} SET application_id = {_KEEPER.format(column=f"{table}.application_id")}
+            WHERE application_id IN (SELECT id FROM applications WHERE {_LATER_DUPLICATE})
+        """)
+    op.execute(f"DELETE FROM applications WHERE {_LATER_DUPLICATE}")
+
+    # Batch mode rebuilds the table where ALTER can't add a constraint (SQLite)
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.create_unique_constraint(
+            'uq_applications_candidate_job', ['candidate_id', 'job_opening_id']
+        )
+    for name, table, columns in _QUERY_INDEXES:
+        op.create_index(name, table, columns)
+
+def downgrade_query_indexes():
+    for name, table, _ in reversed(_QUERY_INDEXES):
+        op.drop_index(name, table_name=table)
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_constraint('uq_applications_candidate_job', type_='unique')
\ No newline at end of file
@@ -0,0 +1,89 @@
+import threading
+import time
+from bisect import bisect_left
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (in milliseconds) of the connection acquire-time histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+class PoolWaitStats:
+    """Thread-safe histogram of how long callers waited to get a connection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._total = 0.0
+        self._max = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds: float) -> None:
+        millis = seconds * 1000
+        with self._lock:
+            self._counts[bisect_left(WAIT_BUCKETS_MS, millis)] += 1
+            self._total += millis
+            self._max = max(self._max, millis)
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count = sum(self._counts)
+            buckets = {
+                f"le_{bound}ms": self._counts[i]
+                for i, bound in enumerate(WAIT_BUCKETS_MS)
+            }
+            buckets["gt_%dms" % WAIT_BUCKETS_MS[-1]] = self._counts[-1]
+            return {
+                "count": count,
+                "avg_ms": round(self._total / count, 3) if count else 0.0,
+                "max_ms": round(self._max, 3),
+                "timeouts": self.timeouts,
+                "buckets": buckets,
+            }
+
+class _WaitTimeMixin:
+    """Records the time spent in Pool.connect(), including queueing for a free slot"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.wait_stats.observe_timeout()
+            raise
+        finally:
+            self.wait_stats.observe(time.perf_counter() - start)
+
+    def recreate(self):
+        # Keep the histogram across dispose()/invalidation
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+class InstrumentedQueuePool(_WaitTimeMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_WaitTimeMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_status(pool: Pool) -> dict:
+    """Live usage figures for a pool; sizing fields are None for unsized pools"""
+    sized = isinstance(pool, QueuePool)
+    status = {
+        "pool_class": pool.__class__.__name__,
+        "size": pool.size() if sized else None,
+        "checked_out": pool.checkedout() if sized else None,
+        "idle": pool.checkedin() if sized else None,
+        "overflow": pool.overflow() if sized else None,
+        "max_overflow": pool._max_overflow if sized else None,
+    }
+    wait_stats = getattr(pool, "wait_stats", None)
+    status["wait_time"] = wait_stats.snapshot() if wait_stats else None
+    return status
@@ -0,0 +1,119 @@
+import itertools
+import threading
+import time
+from typing import List, Optional
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Request header carrying the freshness hint: the replica lag (in seconds)
+# the caller can tolerate. 0 forces the primary.
+MAX_STALENESS_HEADER = "X-Max-Staleness"
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Execution option sending one SELECT to the primary without moving the rest
+# of the session off its replica, for reads that can't tolerate any lag
+PRIMARY_OPTION = "use_primary"
+
+class ReplicaSet:
+    """Read replicas plus a cached view of how far each one lags the primary"""
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag_seconds: float = 5.0,
+        lag_check_interval: float = 5.0
+    ):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self._lag = {}
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self.logger = logger.bind(service="ReplicaSet")
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self, max_staleness: Optional[float] = None) -> Optional[Engine]:
+        """Pick a replica whose lag is within the bound, or None to use the primary"""
+        bound = self.max_lag_seconds if max_staleness is None else max_staleness
+        if not self.engines or bound <= 0:
+            return None
+        fresh = [engine for engine in self.engines if self.lag(engine) <= bound]
+        if not fresh:
+            return None
+        return fresh[next(self._round_robin) % len(fresh)]
+
+    def lag(self, engine: Engine) -> float:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._lag.get(engine)
+            if cached and now - cached[1] < self.lag_check_interval:
+                return cached[0]
+        lag = self._measure_lag(engine)
+        with self._lock:
+            self._lag[engine] = (lag, now)
+        return lag
+
+    def _measure_lag(self, engine: Engine) -> float:
+        if engine.dialect.name != "postgresql":
+            # No replication to measure (e.g. SQLite stand-ins in development)
+            return 0.0
+        try:
+            with engine.connect() as connection:
+                lag = connection.execute(text(
+                    "SELECT COALESCE(EXTRACT(EPOCH FROM "
+                    "now() - pg_last_xact_replay_timestamp()), 0)"
+                )).scalar()
+            return float(lag)
+        except Exception as e:
+            self.logger.warning(f"Replica {engine.url.host} lag check failed: {str(e)}")
+            return float("inf")
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica and everything else to the primary.
+
+    Replicas are only used when the session is created with read_only=True
+    (GET requests), and only for SELECTs. Any other statement (ORM writes,
+    text() SQL, DDL), SELECT ... FOR UPDATE and every statement after the
+    first of those go to the primary, so a request always reads its own
+    writes. A SELECT carrying the PRIMARY_OPTION execution option goes to
+    the primary on its own.
+    """
+
+    def __init__(
+        self,
+        *args,
+        replica_set: Optional[ReplicaSet] = None,
+        read_only: bool = False,
+        max_staleness: Optional[float] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._replica = None
+        if read_only and replica_set:
+            self._replica = replica_set.choose(max_staleness)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._replica is not None:
+            if self._flushing or (clause is not None and not getattr(clause, "is_select", False)):
+                # Stay on the primary for the rest of the session
+                self._replica = None
+            elif clause is None or (
+                getattr(clause, "_for_update_arg", None) is None
+                and not clause.get_execution_options().get(PRIMARY_OPTION)
+            ):
+                return self._replica
+        return super().get_bind(mapper, clause, **kwargs)
+
+def parse_max_staleness(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
@@ -0,0 +1,153 @@
+import re
+from dataclasses import dataclass, field
+from typing import List
+from sqlalchemy import DDL, Table, bindparam, column, event, func, literal_column, select, table
+from sqlalchemy.engine import Engine
+
+# Candidate fields covered by the full-text index
+SEARCH_COLUMNS = ("skills", "current_position", "current_company", "notes")
+
+FTS_TABLE = "candidates_fts"
+TS_CONFIG = "english"
+
+_TOKEN = re.compile(r'-?"[^"]*"|\S+')
+_WORD = re.compile(r"\w+")
+
+@dataclass
+class Term:
+    words: List[str]
+    prefix: bool = False
+
+@dataclass
+class SearchQuery:
+    """Parsed search text: OR-ed groups of AND-ed terms, minus excluded terms"""
+    groups: List[List[Term]] = field(default_factory=list)
+    excluded: List[Term] = field(default_factory=list)
+
+def parse_search_query(text: str) -> SearchQuery:
+    """
+    Parse a web-style query: words and "quoted phrases" must all match,
+    OR separates alternatives, and NOT or a leading "-" excludes a term.
+    A trailing "*" makes a word a prefix match. Raises ValueError when
+    nothing is left to search for.
+    """
+    query = SearchQuery(groups=[[]])
+    negate = False
+    for token in _TOKEN.findall(text):
+        if token == "OR":
+            if query.groups[-1]:
+                query.groups.append([])
+            continue
+        if token in ("AND", "NOT"):
+            negate = negate or token == "NOT"
+            continue
+        if token.startswith("-"):
+            negate, token = True, token[1:]
+        prefix = token.endswith("*") and not token.startswith('"')
+        words = _WORD.findall(token)
+        if words:
+            term = Term(words, prefix)
+            (query.excluded if negate else query.groups[-1]).append(term)
+        negate = False
+    query.groups = [group for group in query.groups if group]
+    if not query.groups:
+        raise ValueError("Search query must contain at least one word to match")
+    return query
+
+def to_fts5(query: SearchQuery) -> str:
+    """Render for an FTS5 MATCH (NOT binds tighter than AND, AND than OR)"""
+    def term(t: Term) -> str:
+        return '"' + " ".join(t.words) + '"' + ("*" if t.prefix else "")
+    expression = " OR ".join(
+        "(" + " AND ".join(term(t) for t in group) + ")" for group in query.groups
+    )
+    if query.excluded:
+        expression = f"({expression})" + "".join(f" NOT {term(t)}" for t in query.excluded)
+    return expression
+
+def to_tsquery(query: SearchQuery) -> str:
+    """Render for PostgreSQL to_tsquery (! binds tighter than &, & than |)"""
+    def term(t: Term) -> str:
+        words = [f"'{word}'" for word in t.words]
+        if t.prefix:
+            words[-1] += ":*"
+        return "(" + " <-> ".join(words) + ")"
+    expression = " | ".join(
+        "(" + " & ".join(term(t) for t in group) + ")" for group in query.groups
+    )
+    if query.excluded:
+        expression = f"({expression})" + "".join(f" & !{term(t)}" for t in query.excluded)
+    return expression
+
+def candidate_matches(dialect_name: str, query: SearchQuery):
+    """
+    SELECT of (id, rank) for the candidates matching query. Lower rank is a
+    better match on every backend, so callers sort ascending.
+    """
+    if dialect_name == "postgresql":
+        candidates = table("candidates", column("id"), column("search_vector"))
+        ts_query = func.to_tsquery(TS_CONFIG, bindparam("search_query", to_tsquery(query)))
+        return select(
+            candidates.c.id.label("id"),
+            (-func.ts_rank_cd(candidates.c.search_vector, ts_query)).label("rank")
+        ).where(candidates.c.search_vector.op("@@")(ts_query))
+    if dialect_name == "sqlite":
+        fts = table(FTS_TABLE, column("rowid"))
+        return select(
+            fts.c.rowid.label("id"),
+            func.bm25(literal_column(FTS_TABLE)).label("rank")
+        ).where(literal_column(FTS_TABLE).op("MATCH")(bindparam("search_query", to_fts5(query))))
+    raise ValueError(f"Full-text search is not supported on {dialect_name}")
+
+def _sqlite_ddl(table_name: str) -> List[str]:
+    columns = ", ".join(SEARCH_COLUMNS)
+    new = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+    old = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+    # External-content FTS5 table kept in sync by triggers, so every write
+    # path (ORM, bulk import, raw SQL) updates the index
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{columns}, content='{table_name}', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {columns} ON {table_name} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new}); END",
+    ]
+
+def _postgres_ddl(table_name: str) -> List[str]:
+    document = " || ' ' || ".join(f"coalesce({c}, '')" for c in SEARCH_COLUMNS)
+    # A generated column is recomputed by PostgreSQL on every write
+    return [
+        f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('{TS_CONFIG}', {document})) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_search_vector ON {table_name} USING GIN (search_vector)",
+    ]
+
+def attach(target: Table) -> None:
+    """Create the search index along with the table on SQLite and PostgreSQL"""
+    for statement in _sqlite_ddl(target.name):
+        event.listen(target, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in _postgres_ddl(target.name):
+        event.listen(target, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    # The FTS5 table isn't in the metadata, so drop_all would leave it behind
+    event.listen(
+        target, "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite")
+    )
+
+def rebuild(engine: Engine, table_name: str = "candidates") -> None:
+    """Create the index on an existing database and re-index every row"""
+    with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            for statement in _sqlite_ddl(table_name):
+                connection.exec_driver_sql(statement)
+            connection.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        elif engine.dialect.name == "postgresql":
+            for statement in _postgres_ddl(table_name):
+                connection.exec_driver_sql(statement)
+            connection.exec_driver_sql(f"REINDEX INDEX ix_{table_name}_search_vector")
+        else:
+            raise ValueError(f"Full-text search is not supported on {engine.dialect.name}")
\ No newline at end of file
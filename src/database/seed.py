@@ -1,6 +1,7 @@
 import logging
 from sqlalchemy.orm import Session
 from src.models import entities
+from src.core.password_hashing import password_hasher
 from datetime import datetime, timedelta, UTC
 import random
 
@@ -35,7 +36,7 @@ def seed_database(db: Session):
     # Create users
     admin = entities.User(
         email="admin@company.com",
-        hashed_password=entities.User.hash_password("admin123"),
+        hashed_password=password_hasher.hash_sync("admin123"),
         role=entities.UserRole.ADMIN,
         first_name="Admin",
         last_name="User",
@@ -54,7 +55,7 @@ def seed_database(db: Session):
 
     recruiter = entities.User(
         email="recruiter@company.com",
-        hashed_password=entities.User.hash_password("recruiter123"),
+        hashed_password=password_hasher.hash_sync("recruiter123"),
         role=entities.UserRole.RECRUITER,
         first_name="John",
         last_name="Doe",
@@ -63,7 +64,7 @@ def seed_database(db: Session):
 
     interviewer = entities.User(
         email="interviewer@company.com",
-        hashed_password=entities.User.hash_password("interviewer123"),
+        hashed_password=password_hasher.hash_sync("interviewer123"),
         role=entities.UserRole.INTERVIEWER,
         first_name="Jane",
         last_name="Smith",
@@ -84,7 +85,7 @@ def seed_database(db: Session):
     # Create a candidate user and profile
     candidate_user = entities.User(
         email="candidate@company.com",
-        hashed_password=entities.User.hash_password("candidate123"),
+        hashed_password=password_hasher.hash_sync("candidate123"),
         role=entities.UserRole.CANDIDATE,
         first_name="John",
         last_name="Applicant",
@@ -102,6 +103,7 @@ def seed_database(db: Session):
         phone="+1234567890",
         skills="Python, FastAPI, SQL",
         experience_years=5,
+        location="San Francisco, CA",
         education="Bachelor's in Computer Science"
     )
     db.add(candidate)
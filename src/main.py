@@ -2,13 +2,24 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware as CORSMiddlewareClass
 from src.database import engine, Base, SessionLocal, init_db
 from src.database.seed import seed_database
-from src.api.routes import companies, job_openings, candidates, applications, interviews, email_templates, auth
+from src.api.routes import companies, job_openings, candidates, applications, interviews, email_templates, auth, admin, analytics
 from datetime import datetime, UTC
 from src.core.logging import setup_logging
 from src.core.config import get_settings
 from src.core.middleware.db_profiler import DBProfilerMiddleware
 from src.core.monitoring import setup_azure_monitoring
+from src.core.pagination import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_APPROXIMATE_HEADER
+)
 from sqlalchemy.exc import SQLAlchemyError
+from src.database.index_advisor import advise, format_report, load_fingerprints
+from src.database import search
+from src.services.funnel_service import funnel_service
+from src.services.status_history_service import status_history_service
+from src.services.email_outbox_worker import email_outbox_worker
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional
 import typer
 
 cli = typer.Typer()
@@ -17,8 +28,19 @@ cli = typer.Typer()
 logger = setup_logging()
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The outbox worker shares the server's event loop
+    if settings.EMAIL_WORKER_ENABLED:
+        email_outbox_worker.start()
+    try:
+        yield
+    finally:
+        await email_outbox_worker.stop()
+
 # Initialize FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="Recruitment System API",
     description="REST API for managing job openings, candidates, and applications",
     version="1.0.0",
@@ -50,6 +72,14 @@ app = FastAPI(
         {
             "name": "Email Templates",
             "description": "Manage email templates for various notifications"
+        },
+        {
+            "name": "Admin",
+            "description": "Operational endpoints for administrators"
+        },
+        {
+            "name": "Analytics",
+            "description": "Hiring funnel and time-in-stage reports"
         }
     ],
     docs_url="/docs",
@@ -87,6 +117,48 @@ def run(
     import uvicorn
     uvicorn.run("src.main:app", host="127.0.0.1", port=8000, reload=True)
 
+@cli.command()
+def advise_indexes(
+    fingerprints: Optional[Path] = typer.Argument(
+        None,
+        help="JSON-lines file of recorded queries (defaults to QUERY_FINGERPRINT_FILE)"
+    )
+):
+    """Replay recorded query fingerprints with EXPLAIN and report missing indexes"""
+    path = fingerprints or settings.QUERY_FINGERPRINT_FILE
+    if not path:
+        raise typer.BadParameter("No fingerprint file given and QUERY_FINGERPRINT_FILE is not set")
+    recorded = load_fingerprints(path)
+    logger.info(f"Explaining {len(recorded)} recorded queries")
+    typer.echo(format_report(advise(engine, recorded)))
+
+@cli.command()
+def rebuild_funnel():
+    """Recompute the application funnel rollup from the applications table"""
+    db = SessionLocal()
+    try:
+        rows = funnel_service.rebuild(db)
+    finally:
+        db.close()
+    typer.echo(f"Application funnel rollup rebuilt: {rows} rows")
+
+@cli.command()
+def backfill_status_history():
+    """Write a starting status history for applications that have none"""
+    db = SessionLocal()
+    try:
+        rows = status_history_service.backfill(db)
+    finally:
+        db.close()
+    typer.echo(f"Application status history backfilled: {rows} rows")
+
+@cli.command()
+def rebuild_search_index():
+    """Create the candidate full-text index if missing and re-index all candidates"""
+    logger.info("Rebuilding candidate search index...")
+    search.rebuild(engine)
+    logger.info("Candidate search index rebuilt")
+
 # Setup Azure monitoring in production
 if settings.ENVIRONMENT == "production":
     try:
@@ -103,6 +175,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_APPROXIMATE_HEADER],
 )
 
 # Add database profiler middleware in non-production environments
@@ -117,6 +190,8 @@ app.include_router(candidates.router, prefix="/v1", tags=["Candidates"])
 app.include_router(applications.router, prefix="/v1", tags=["Applications"])
 app.include_router(interviews.router, prefix="/v1", tags=["Interviews"])
 app.include_router(email_templates.router, prefix="/v1", tags=["Email Templates"])
+app.include_router(admin.router, prefix="/v1", tags=["Admin"])
+app.include_router(analytics.router, prefix="/v1", tags=["Analytics"])
 
 @app.get("/")
 async def root():
@@ -2,13 +2,24 @@ from sqlalchemy import Column, Integer, DateTime, String, ForeignKey
 from sqlalchemy.orm import declared_attr, relationship
 from src.database import Base
 from datetime import datetime, UTC
+from typing import Optional
+
+def utc_now() -> datetime:
+    """Current time as naive UTC, the form every DateTime column stores"""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+def to_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Stored timestamps are naive UTC; convert aware input to match"""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
 
 class BaseEntity(Base):
     __abstract__ = True
 
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
     
     @declared_attr
     def created_by_id(cls):
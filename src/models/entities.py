@@ -1,7 +1,7 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Enum, func
-from sqlalchemy.orm import relationship
-from src.models.base_entity import BaseEntity
-from datetime import datetime, UTC
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String, DateTime, Text, Enum, Index, UniqueConstraint, func
+from sqlalchemy.orm import column_property, relationship
+from src.models.base_entity import BaseEntity, utc_now
+from src.database import Base, search
 import enum
 import bcrypt
 
@@ -43,6 +43,12 @@ class InterviewStepType(str, enum.Enum):
     HR = "hr"
     FINAL = "final"
 
+class EmailOutboxStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+
 class Company(BaseEntity):
     __tablename__ = "companies"
 
@@ -61,6 +67,10 @@ class Company(BaseEntity):
 
 class JobOpening(BaseEntity):
     __tablename__ = "job_openings"
+    __table_args__ = (
+        # List filter: company_id alone or company_id + status
+        Index("ix_job_openings_company_status", "company_id", "status"),
+    )
 
     title = Column(String, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"))
@@ -83,6 +93,11 @@ class JobOpening(BaseEntity):
 
 class Candidate(BaseEntity):
     __tablename__ = "candidates"
+    __table_args__ = (
+        # Change scans of the candidate matching index
+        Index("ix_candidates_created_at", "created_at"),
+        Index("ix_candidates_updated_at", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True)
@@ -96,6 +111,7 @@ class Candidate(BaseEntity):
     experience_years = Column(Integer, nullable=True)
     current_company = Column(String, nullable=True)
     current_position = Column(String, nullable=True)
+    location = Column(String, nullable=True)
     education = Column(String, nullable=True)
     available_from = Column(DateTime(timezone=True), nullable=True)
     notes = Column(String, nullable=True)
@@ -113,13 +129,27 @@ class Candidate(BaseEntity):
         cascade="all, delete-orphan"
     )
 
+# Full-text index over skills, position, company and notes (FTS5 / tsvector)
+search.attach(Candidate.__table__)
+
 class Application(BaseEntity):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Duplicate-application guard; also serves candidate_id lookups
+        UniqueConstraint("candidate_id", "job_opening_id", name="uq_applications_candidate_job"),
+        Index("ix_applications_job_opening_status", "job_opening_id", "status"),
+        Index("ix_applications_status", "status"),
+    )
 
     candidate_id = Column(Integer, ForeignKey("candidates.id"))
     job_opening_id = Column(Integer, ForeignKey("job_openings.id"))
-    status = Column(Enum(ApplicationStatus), default=ApplicationStatus.APPLIED)
-    applied_date = Column(DateTime, default=lambda: datetime.now(UTC))
+    # active_history loads the old status before it is overwritten, so the
+    # funnel rollup sees the transition even on an expired instance
+    status = column_property(
+        Column(Enum(ApplicationStatus), default=ApplicationStatus.APPLIED),
+        active_history=True
+    )
+    applied_date = Column(DateTime, default=utc_now)
     resume_version = Column(String)  # Version of resume used for this application
     cover_letter = Column(Text)
     notes = Column(Text)
@@ -188,6 +218,10 @@ class InterviewTemplate(BaseEntity):
 
 class InterviewTemplateStep(BaseEntity):
     __tablename__ = "interview_template_steps"
+    __table_args__ = (
+        # selectinload of InterviewTemplate.steps, returned in step order
+        Index("ix_interview_template_steps_template_order", "template_id", "order"),
+    )
 
     template_id = Column(Integer, ForeignKey("interview_templates.id"))
     name = Column(String)
@@ -222,6 +256,11 @@ class InterviewProcess(BaseEntity):
 
 class InterviewStep(BaseEntity):
     __tablename__ = "interview_steps"
+    __table_args__ = (
+        Index("ix_interview_steps_process_order", "process_id", "order"),
+        # Overlap checks: an interviewer's steps by start time
+        Index("ix_interview_steps_interviewer_scheduled", "interviewer_id", "scheduled_at"),
+    )
 
     process_id = Column(Integer, ForeignKey("interview_processes.id"))
     template_step_id = Column(Integer, ForeignKey("interview_template_steps.id"))
@@ -241,6 +280,10 @@ class InterviewStep(BaseEntity):
 
 class EmailTemplate(BaseEntity):
     __tablename__ = "email_templates"
+    __table_args__ = (
+        # Covers get_active_template's type/is_active/name lookup
+        Index("ix_email_templates_type_active_name", "type", "is_active", "name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
@@ -257,4 +300,98 @@ class EmailTemplate(BaseEntity):
         "User",
         back_populates="email_templates",
         foreign_keys=[created_by_id]
-    ) 
\ No newline at end of file
+    )
+
+class ApplicationFunnelDaily(Base):
+    """
+    Rollup of application status changes per job opening, day and status.
+    entered - exited summed over all days is the number currently in a status.
+    """
+    __tablename__ = "application_funnel_daily"
+    __table_args__ = (
+        Index("ix_application_funnel_daily_company_day", "company_id", "day"),
+    )
+
+    job_opening_id = Column(Integer, ForeignKey("job_openings.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(ApplicationStatus), primary_key=True)
+    # Denormalized from the job opening so company funnels skip the join
+    company_id = Column(Integer, nullable=True)
+    entered = Column(Integer, nullable=False, default=0)
+    exited = Column(Integer, nullable=False, default=0)
+
+class ApplicationStatusHistory(Base):
+    """
+    Append-only log of application status changes, written in the same
+    transaction as the change. from_status is None for a new application and
+    to_status is None for a deleted one.
+    """
+    __tablename__ = "application_status_history"
+    __table_args__ = (
+        Index("ix_application_status_history_application", "application_id", "changed_at"),
+        Index("ix_application_status_history_job", "job_opening_id", "changed_at"),
+        Index("ix_application_status_history_company", "company_id", "changed_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    # No foreign keys: history outlives deleted applications and users
+    application_id = Column(Integer, nullable=False)
+    job_opening_id = Column(Integer, nullable=False)
+    # Denormalized from the job opening so company reports skip the join
+    company_id = Column(Integer, nullable=True)
+    from_status = Column(Enum(ApplicationStatus), nullable=True)
+    to_status = Column(Enum(ApplicationStatus), nullable=True)
+    changed_at = Column(DateTime, nullable=False)
+    changed_by_id = Column(Integer, nullable=True)
+
+class EmailOutbox(Base):
+    """
+    Emails waiting to be sent, written in the same transaction as the change
+    that triggers them and delivered by the background outbox worker. The
+    template is rendered at delivery time from template_data (JSON).
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # The worker's claim query: due rows by status, oldest first
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    to_email = Column(String, nullable=False)
+    template_type = Column(String, nullable=False)
+    template_name = Column(String, nullable=True)
+    template_data = Column(Text, nullable=False, default="{}")
+    status = Column(Enum(EmailOutboxStatus), nullable=False, default=EmailOutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=utc_now)
+    # A claimed (sending) row whose lease ran out is claimed again
+    locked_until = Column(DateTime, nullable=True)
+    claim_token = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=utc_now)
+    sent_at = Column(DateTime, nullable=True)
+
+class CacheVersion(Base):
+    """
+    Change counters for data that processes cache in memory. Writers bump
+    the counter in the same transaction as the change; readers compare it
+    with the version their cache was filled at.
+    """
+    __tablename__ = "cache_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class RevokedToken(Base):
+    """
+    Access tokens revoked before they expire: one token by its jti (logout),
+    or every token of a subject issued up to revoked_at (forced sign-out).
+    Rows are useless once expires_at has passed and are pruned.
+    """
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True)
+    jti = Column(String, nullable=True, unique=True)
+    subject = Column(String, nullable=True, index=True)
+    revoked_at = Column(DateTime, nullable=False, default=utc_now, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
\ No newline at end of file
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr, HttpUrl, constr, SecretStr
+from pydantic import BaseModel, EmailStr, HttpUrl, Field, constr, SecretStr, field_validator, model_validator
 from pydantic.types import constr
-from typing import Optional, List
-from datetime import datetime
+from typing import Dict, Optional, List
+import json
+from datetime import date, datetime
 from src.models.entities import JobStatus, ApplicationStatus, UserRole, InterviewStepStatus, InterviewStepType
 
 # Company Schemas
@@ -47,6 +48,16 @@ class JobOpening(JobOpeningBase):
     class Config:
         from_attributes = True
 
+class FacetValue(BaseModel):
+    value: str
+    label: Optional[str] = None
+    count: int
+
+class JobSearchResult(BaseModel):
+    total: int
+    items: List[JobOpening]
+    facets: Dict[str, List[FacetValue]]
+
 # Candidate Schemas
 class CandidateBase(BaseModel):
     first_name: str
@@ -59,6 +70,7 @@ class CandidateBase(BaseModel):
     experience_years: int
     current_company: Optional[str] = None
     current_position: Optional[str] = None
+    location: Optional[str] = None
     education: str
     available_from: Optional[datetime] = None
     notes: Optional[str] = None
@@ -69,11 +81,30 @@ class CandidateCreate(CandidateBase):
 class Candidate(CandidateBase):
     id: int
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
 
+class CandidateMatch(BaseModel):
+    candidate: Candidate
+    score: float
+    skill_score: float
+    experience_score: float
+    location_score: float
+
+class CandidateImportError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    errors: List[str]
+
+class CandidateImportResult(BaseModel):
+    total: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: List[CandidateImportError] = []
+    errors_truncated: bool = False
+
 # Application Schemas
 class ApplicationBase(BaseModel):
     resume_version: Optional[str] = None
@@ -90,6 +121,39 @@ class ApplicationUpdate(BaseModel):
     interview_feedback: Optional[str] = None
     notes: Optional[str] = None
 
+class ApplicationBatchFilter(BaseModel):
+    job_opening_id: Optional[int] = None
+    candidate_id: Optional[int] = None
+    company_id: Optional[int] = None
+    status: Optional[ApplicationStatus] = None
+
+class ApplicationBatchStatusUpdate(BaseModel):
+    ids: Optional[List[int]] = Field(default=None, max_length=10000)
+    filter: Optional[ApplicationBatchFilter] = None
+    status: ApplicationStatus
+    notify: bool = True
+
+    @model_validator(mode='after')
+    def require_selection(self):
+        # Never allow an unscoped UPDATE of every application
+        has_filter = self.filter is not None and any(
+            value is not None for value in self.filter.model_dump().values()
+        )
+        if not self.ids and not has_filter:
+            raise ValueError("Provide ids or at least one filter")
+        return self
+
+class ApplicationStatusChange(BaseModel):
+    id: int
+    previous_status: ApplicationStatus
+
+class ApplicationBatchStatusResult(BaseModel):
+    status: ApplicationStatus
+    updated: List[ApplicationStatusChange] = []
+    unchanged_ids: List[int] = []
+    not_found_ids: List[int] = []
+    notifications_queued: int = 0
+
 class Application(ApplicationBase):
     id: int
     candidate_id: int
@@ -126,6 +190,10 @@ class User(UserBase):
     class Config:
         from_attributes = True
 
+class UserAdminUpdate(BaseModel):
+    role: Optional[UserRole] = None
+    is_active: Optional[bool] = None
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -143,6 +211,14 @@ class InterviewTemplateStepBase(BaseModel):
     evaluation_criteria: list[str]
     passing_score: int
 
+    @field_validator('required_participants', 'evaluation_criteria', mode='before')
+    @classmethod
+    def parse_json_list(cls, value):
+        # Stored as JSON text on the entity
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
 class InterviewTemplateBase(BaseModel):
     name: str
     description: str
@@ -169,6 +245,55 @@ class InterviewStepUpdate(BaseModel):
     meeting_link: Optional[str] = None
     location: Optional[str] = None
 
+class InterviewProcessBatchStart(BaseModel):
+    application_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    notify: bool = True
+
+class InterviewProcessStarted(BaseModel):
+    application_id: int
+    process_id: int
+    step_count: int
+
+class InterviewProcessBatchResult(BaseModel):
+    started: List[InterviewProcessStarted] = []
+    already_started_ids: List[int] = []
+    no_template_ids: List[int] = []
+    not_found_ids: List[int] = []
+    notifications_queued: int = 0
+
+class ScheduleProposal(BaseModel):
+    # Omit for a booking that has no interview step yet
+    step_id: Optional[int] = None
+    interviewer_id: int
+    scheduled_at: datetime
+    # Defaults to the step's template duration, else 60 minutes
+    duration_minutes: Optional[int] = Field(None, ge=1)
+
+class ScheduleCheckRequest(BaseModel):
+    proposals: List[ScheduleProposal] = Field(..., min_length=1, max_length=5000)
+
+class ScheduleConflict(BaseModel):
+    step_id: Optional[int] = None
+    # Set when the conflict is with another proposal in the same request
+    proposal_index: Optional[int] = None
+    starts_at: datetime
+    ends_at: datetime
+
+class ScheduleCheckResult(BaseModel):
+    index: int
+    step_id: Optional[int] = None
+    interviewer_id: int
+    starts_at: datetime
+    ends_at: datetime
+    ok: bool
+    conflicts: List[ScheduleConflict]
+
+class FreeSlot(BaseModel):
+    starts_at: datetime
+    ends_at: datetime
+    # Interviewers free for the whole slot
+    interviewer_ids: List[int]
+
 class InterviewStep(BaseModel):
     id: int
     order: int
@@ -196,6 +321,14 @@ class EmailTemplateBase(BaseModel):
 class EmailTemplateCreate(EmailTemplateBase):
     pass
 
+class EmailTemplateUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    subject_template: Optional[str] = None
+    html_content: Optional[str] = None
+    type: Optional[str] = None
+    is_active: Optional[bool] = None
+
 class EmailTemplate(EmailTemplateBase):
     id: int
     created_at: datetime
@@ -203,4 +336,44 @@ class EmailTemplate(EmailTemplateBase):
     created_by_id: int
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+# Analytics Schemas
+class FunnelStage(BaseModel):
+    status: ApplicationStatus
+    current: int
+    entered: int
+    # entered / entered of the previous pipeline stage
+    conversion_rate: Optional[float] = None
+
+class Funnel(BaseModel):
+    company_id: Optional[int] = None
+    job_opening_id: Optional[int] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    stages: List[FunnelStage]
+
+class FunnelDay(BaseModel):
+    day: date
+    status: ApplicationStatus
+    entered: int
+    exited: int
+
+class DurationStats(BaseModel):
+    # Number of completed stays measured
+    count: int
+    average_seconds: Optional[float] = None
+    p50_seconds: Optional[float] = None
+    p90_seconds: Optional[float] = None
+
+class StageDuration(DurationStats):
+    status: ApplicationStatus
+
+class TimeInStage(BaseModel):
+    company_id: Optional[int] = None
+    job_opening_id: Optional[int] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    stages: List[StageDuration]
+    # From entering the pipeline to being hired
+    time_to_hire: DurationStats
\ No newline at end of file
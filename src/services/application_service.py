@@ -1,13 +1,53 @@
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from src.models import entities, schemas
 from src.services.base_service import BaseService
-from typing import List, Optional
+from src.services.email_service import EmailService
+from src.services.funnel_service import StatusTransition
+from src.services.status_history_service import record_status_transitions
+from src.core.pagination import Page
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime, UTC
 
 class ApplicationService(BaseService[entities.Application]):
+    # schemas.Application nests candidate and job_opening (which nests company);
+    # all are many-to-one, so a single joined SELECT covers the whole page
+    load_options = (
+        joinedload(entities.Application.candidate),
+        joinedload(entities.Application.job_opening)
+        .joinedload(entities.JobOpening.company),
+    )
+
+    # IN-list size for follow-up lookups over a batch of application ids
+    batch_lookup_size = 1000
+
+    # Columns the export endpoint can project, by output name
+    export_columns = {
+        "id": entities.Application.id,
+        "candidate_id": entities.Application.candidate_id,
+        "candidate_email": entities.Candidate.email,
+        "candidate_first_name": entities.Candidate.first_name,
+        "candidate_last_name": entities.Candidate.last_name,
+        "job_opening_id": entities.Application.job_opening_id,
+        "job_title": entities.JobOpening.title,
+        "company_id": entities.JobOpening.company_id,
+        "company_name": entities.Company.name,
+        "status": entities.Application.status,
+        "applied_date": entities.Application.applied_date,
+        "salary_expectation": entities.Application.salary_expectation,
+        "created_at": entities.Application.created_at,
+        "updated_at": entities.Application.updated_at,
+    }
+    default_export_columns = (
+        "id", "candidate_id", "job_opening_id", "company_id", "status",
+        "applied_date", "created_at", "updated_at"
+    )
+
     def __init__(self):
         super().__init__(entities.Application)
+        self.email_service = EmailService()
 
     def get_applications(
         self,
@@ -16,8 +56,10 @@ class ApplicationService(BaseService[entities.Application]):
         limit: int = 100,
         candidate_id: Optional[int] = None,
         job_opening_id: Optional[int] = None,
-        status: Optional[entities.ApplicationStatus] = None
-    ) -> List[entities.Application]:
+        status: Optional[entities.ApplicationStatus] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[entities.Application]:
         filters = {}
         if candidate_id:
             filters['candidate_id'] = candidate_id
@@ -25,7 +67,7 @@ class ApplicationService(BaseService[entities.Application]):
             filters['job_opening_id'] = job_opening_id
         if status:
             filters['status'] = status
-        return self.get_all(db, skip=skip, limit=limit, **filters)
+        return self.get_page(db, skip=skip, limit=limit, cursor=cursor, include_total=include_total, **filters)
 
     def get_application(self, db: Session, application_id: int) -> Optional[entities.Application]:
         return self.get_by_id(db, application_id)
@@ -46,15 +88,36 @@ class ApplicationService(BaseService[entities.Application]):
             raise ValueError("Job opening is not accepting applications")
 
         # Check if candidate already applied
-        existing = db.query(entities.Application).filter(
-            entities.Application.candidate_id == application.candidate_id,
-            entities.Application.job_opening_id == application.job_opening_id
-        ).first()
-        if existing:
+        if self._find_application(db, application.candidate_id, application.job_opening_id):
             raise ValueError("Candidate has already applied for this position")
 
-        application_data = application.model_dump()
-        return self.create(db, application_data, current_user)
+        db_application = entities.Application(**application.model_dump())
+        db_application.created_by_id = current_user.id
+        db_application.updated_by_id = current_user.id
+        try:
+            db.add(db_application)
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            # uq_applications_candidate_job caught a concurrent duplicate the check missed
+            if self._find_application(db, application.candidate_id, application.job_opening_id):
+                raise ValueError("Candidate has already applied for this position")
+            self.logger.error(f"Error creating Application: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        db.refresh(db_application)
+        self.logger.info(f"Created Application with id: {db_application.id} by user {current_user.email}")
+        return db_application
+
+    def _find_application(
+        self,
+        db: Session,
+        candidate_id: int,
+        job_opening_id: int
+    ) -> Optional[entities.Application]:
+        return db.query(entities.Application).filter(
+            entities.Application.candidate_id == candidate_id,
+            entities.Application.job_opening_id == job_opening_id
+        ).first()
 
     def update_application_status(
         self,
@@ -64,4 +127,221 @@ class ApplicationService(BaseService[entities.Application]):
         current_user: entities.User
     ) -> Optional[entities.Application]:
         update_data = update.model_dump()
-        return self.update(db, application_id, update_data, current_user) 
\ No newline at end of file
+        return self.update(db, application_id, update_data, current_user)
+
+    def batch_update_status(
+        self,
+        db: Session,
+        batch: schemas.ApplicationBatchStatusUpdate,
+        current_user: entities.User
+    ) -> schemas.ApplicationBatchStatusResult:
+        """
+        Move every selected application to batch.status in one UPDATE.
+
+        PostgreSQL uses UPDATE ... FROM (SELECT ... FOR UPDATE) RETURNING to
+        get the changed ids and their previous status in a single statement;
+        dialects without RETURNING select the rows first in the same
+        transaction.
+        """
+        table = entities.Application.__table__
+        conditions = self._batch_conditions(batch)
+        changed = conditions + [table.c.status != batch.status]
+        values = {"status": batch.status, "updated_by_id": current_user.id}
+        self.logger.info(
+            f"Batch status update to {batch.status.value} by user {current_user.email}"
+        )
+
+        try:
+            if db.get_bind().dialect.full_returning:
+                previous = select(
+                    table.c.id, table.c.status.label("previous_status")
+                ).where(*changed).with_for_update().subquery()
+                rows = db.execute(
+                    update(table)
+                    .where(table.c.id == previous.c.id)
+                    .values(**values)
+                    .returning(table.c.id, previous.c.previous_status, table.c.job_opening_id)
+                ).all()
+            else:
+                rows = db.execute(
+                    select(table.c.id, table.c.status, table.c.job_opening_id).where(*changed)
+                ).all()
+                for start in range(0, len(rows), self.batch_lookup_size):
+                    ids = [row[0] for row in rows[start:start + self.batch_lookup_size]]
+                    db.execute(update(table).where(table.c.id.in_(ids)).values(**values))
+
+            result = schemas.ApplicationBatchStatusResult(
+                status=batch.status,
+                updated=[
+                    schemas.ApplicationStatusChange(id=id, previous_status=previous_status)
+                    for id, previous_status, _ in sorted(rows)
+                ]
+            )
+            # Core UPDATEs don't go through the ORM flush hook
+            record_status_transitions(db, [
+                StatusTransition(job_opening_id, previous_status, batch.status, id, current_user.id)
+                for id, previous_status, job_opening_id in rows
+            ])
+            if batch.ids:
+                matched = set(db.execute(
+                    select(table.c.id).where(*conditions)
+                ).scalars())
+                updated_ids = {change.id for change in result.updated}
+                result.unchanged_ids = sorted(matched - updated_ids)
+                result.not_found_ids = sorted(set(batch.ids) - matched)
+            if batch.notify and result.updated:
+                result.notifications_queued = self.queue_status_notifications(
+                    db, [change.id for change in result.updated], batch.status
+                )
+            db.commit()
+        except Exception as e:
+            self.logger.error(f"Error in batch status update: {str(e)}")
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+        self.logger.info(f"Batch status update changed {len(result.updated)} applications")
+        return result
+
+    def _batch_conditions(self, batch: schemas.ApplicationBatchStatusUpdate) -> list:
+        table = entities.Application.__table__
+        conditions = []
+        if batch.ids:
+            conditions.append(table.c.id.in_(batch.ids))
+        if batch.filter:
+            if batch.filter.job_opening_id is not None:
+                conditions.append(table.c.job_opening_id == batch.filter.job_opening_id)
+            if batch.filter.candidate_id is not None:
+                conditions.append(table.c.candidate_id == batch.filter.candidate_id)
+            if batch.filter.status is not None:
+                conditions.append(table.c.status == batch.filter.status)
+            if batch.filter.company_id is not None:
+                conditions.append(table.c.job_opening_id.in_(
+                    select(entities.JobOpening.id).where(
+                        entities.JobOpening.company_id == batch.filter.company_id
+                    )
+                ))
+        return conditions
+
+    def queue_status_notifications(
+        self,
+        db: Session,
+        application_ids: List[int],
+        status: entities.ApplicationStatus
+    ) -> int:
+        """Queue "application_<status>" emails for the given applications"""
+        return self.queue_candidate_notifications(
+            db, application_ids, f"application_{status.value}", {"status": status.value}
+        )
+
+    def queue_candidate_notifications(
+        self,
+        db: Session,
+        application_ids: List[int],
+        template_type: str,
+        extra_data: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        Add template_type emails to the candidates of the given applications
+        to the outbox, inside the caller's transaction. Recipients are
+        resolved with one query per lookup batch; nothing is queued without
+        an active template.
+        """
+        try:
+            self.email_service.template_service.get_active_template(db, template_type)
+        except HTTPException:
+            self.logger.debug(f"No active email template for {template_type}")
+            return 0
+
+        recipients = []
+        for start in range(0, len(application_ids), self.batch_lookup_size):
+            ids = application_ids[start:start + self.batch_lookup_size]
+            rows = db.query(
+                entities.Candidate.email,
+                entities.Candidate.first_name,
+                entities.Candidate.last_name,
+                entities.JobOpening.title,
+                entities.Company.name
+            ).select_from(entities.Application).join(
+                entities.Application.candidate
+            ).join(
+                entities.Application.job_opening
+            ).join(
+                entities.JobOpening.company
+            ).filter(entities.Application.id.in_(ids)).all()
+            recipients.extend(
+                (email, {
+                    "candidate_name": f"{first_name} {last_name}",
+                    "job_title": title,
+                    "company_name": company_name,
+                    **(extra_data or {})
+                })
+                for email, first_name, last_name, title, company_name in rows
+            )
+
+        self.email_service.enqueue_batch(db, template_type, recipients)
+        return len(recipients)
+
+    def export_statement(
+        self,
+        columns: Optional[List[str]] = None,
+        company_id: Optional[int] = None,
+        job_opening_id: Optional[int] = None,
+        status: Optional[entities.ApplicationStatus] = None
+    ) -> Tuple[List[str], object]:
+        """
+        Build the projection query for an export. Column names are checked
+        here so a bad request fails before any of the response is streamed.
+        """
+        columns = list(columns or self.default_export_columns)
+        unknown = [name for name in columns if name not in self.export_columns]
+        if unknown:
+            raise ValueError(
+                f"Unknown export columns: {', '.join(unknown)}. "
+                f"Available: {', '.join(self.export_columns)}"
+            )
+
+        statement = select(
+            *[self.export_columns[name].label(name) for name in columns]
+        ).select_from(entities.Application)
+        # Only join what the projection or the filters need
+        tables = {self.export_columns[name].class_ for name in columns}
+        if tables & {entities.JobOpening, entities.Company} or company_id is not None:
+            statement = statement.join(entities.Application.job_opening)
+        if entities.Company in tables:
+            statement = statement.join(entities.JobOpening.company)
+        if entities.Candidate in tables:
+            statement = statement.join(entities.Application.candidate)
+
+        if company_id is not None:
+            statement = statement.where(entities.JobOpening.company_id == company_id)
+        if job_opening_id is not None:
+            statement = statement.where(entities.Application.job_opening_id == job_opening_id)
+        if status is not None:
+            statement = statement.where(entities.Application.status == status)
+        return columns, statement.order_by(entities.Application.id)
+
+    def stream_export(
+        self,
+        db: Session,
+        statement,
+        batch_size: int = 1000
+    ) -> Iterator[Sequence[tuple]]:
+        """
+        Yield export rows in batches straight off the cursor. stream_results
+        asks the driver for a server-side cursor (psycopg2), so memory stays
+        flat regardless of the number of rows.
+
+        The stream owns the session: it runs its query on first iteration and
+        closes the session when it ends, whether the framework has already
+        run its dependency cleanup or not.
+        """
+        # Plain rows need no ORM result processing; run on the session's
+        # (possibly replica) connection so the cursor can be closed early
+        connection = db.connection(bind_arguments={"clause": statement})
+        result = connection.execute(statement.execution_options(stream_results=True))
+        try:
+            for rows in result.partitions(batch_size):
+                yield [tuple(row) for row in rows]
+        finally:
+            result.close()
+            db.close()
\ No newline at end of file
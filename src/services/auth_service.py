@@ -1,18 +1,165 @@
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta, UTC
-from typing import Optional
+from typing import Optional, Set, Tuple
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from src.models import schemas, entities
 from src.database import get_db
 from src.core.config import get_settings
+from src.core.password_hashing import PasswordHasherBusy, password_hasher
+from src.services.cache_versions import VersionedCache, bump_cache_version
+from src.services.revocation_service import revocation_list
 
 # Configuration (move to settings later)
 settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/token")
 
+class VerifiedTokenCache:
+    """
+    Claims of tokens whose signature was already checked, so a token the UI
+    sends again and again is decoded once. Entries go when the token
+    expires; least recently used are evicted beyond max_entries.
+    Revocation is checked separately on every request.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._claims: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.metrics: Counter = Counter()
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            claims = self._claims.get(token)
+            if claims is not None:
+                if claims["exp"] > time.time():
+                    self._claims.move_to_end(token)
+                    self.metrics["hits"] += 1
+                    return claims
+                del self._claims[token]
+        self.metrics["misses"] += 1
+        return None
+
+    def put(self, token: str, claims: dict) -> None:
+        # Only tokens that expire: the cache must never outlive one
+        if not isinstance(claims.get("exp"), (int, float)):
+            return
+        with self._lock:
+            self._claims[token] = claims
+            self._claims.move_to_end(token)
+            while len(self._claims) > self.max_entries:
+                self._claims.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._claims.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._claims)
+        return {"size": size, **self.metrics}
+
+verified_tokens = VerifiedTokenCache(settings.VERIFIED_TOKEN_CACHE_SIZE)
+
+# Changing any of these on a user changes what their token lets them do
+PRINCIPAL_ATTRIBUTES = ("email", "role", "is_active", "hashed_password")
+
+class PrincipalCache(VersionedCache):
+    """
+    Authenticated users by email (the token's sub), each kept for at most
+    ttl seconds, least recently used evicted beyond max_entries.
+
+    Entries are detached snapshots; get_current_user merges one into the
+    request's session without loading it. A change to a user's role,
+    active flag, email or password, or deleting them, drops them from this
+    process on commit and bumps the "users" version for the others.
+    """
+
+    version_key = "users"
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10000):
+        super().__init__()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._users: "OrderedDict[str, Tuple[entities.User, float]]" = OrderedDict()
+        self.metrics: Counter = Counter()
+
+    def _clear(self) -> None:
+        self._users.clear()
+
+    def get(self, email: str) -> Optional[entities.User]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._users.get(email)
+            if cached is not None:
+                if cached[1] > now:
+                    self._users.move_to_end(email)
+                    self.metrics["hits"] += 1
+                    return cached[0]
+                del self._users[email]
+        self.metrics["misses"] += 1
+        return None
+
+    def put(self, user: entities.User) -> None:
+        snapshot = entities.User(**{
+            column.key: getattr(user, column.key)
+            for column in entities.User.__mapper__.column_attrs
+        })
+        make_transient_to_detached(snapshot)
+        with self._lock:
+            self._users[user.email] = (snapshot, time.monotonic() + self.ttl)
+            self._users.move_to_end(user.email)
+            while len(self._users) > self.max_entries:
+                self._users.popitem(last=False)
+
+    def discard(self, emails) -> None:
+        with self._lock:
+            for email in emails:
+                self._users.pop(email, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._users)
+        return {"size": size, "ttl": self.ttl, "version": self._version, **self.metrics}
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_TTL, settings.PRINCIPAL_CACHE_SIZE)
+
+@event.listens_for(Session, "after_flush")
+def bump_user_version(session: Session, flush_context) -> None:
+    """Invalidate cached principals whose permissions changed"""
+    changed: Set[str] = set()
+    for obj in session.dirty:
+        if isinstance(obj, entities.User):
+            attrs = inspect(obj).attrs
+            if any(attrs[name].history.has_changes() for name in PRINCIPAL_ATTRIBUTES):
+                # Under its previous email too, if that changed
+                changed.update(attrs.email.history.deleted)
+                changed.add(obj.email)
+    for obj in session.deleted:
+        if isinstance(obj, entities.User):
+            changed.add(obj.email)
+    if changed:
+        bump_cache_version(session, PrincipalCache.version_key)
+        session.info.setdefault("principals_changed", set()).update(changed)
+
+@event.listens_for(Session, "after_commit")
+def invalidate_principals(session: Session) -> None:
+    changed = session.info.pop("principals_changed", None)
+    if changed:
+        principal_cache.discard(changed)
+
+@event.listens_for(Session, "after_rollback")
+def discard_principal_changes(session: Session) -> None:
+    session.info.pop("principals_changed", None)
+
 class AuthService:
     @staticmethod
     def create_user(db: Session, user_create: schemas.UserCreate) -> entities.User:
@@ -23,7 +170,7 @@ class AuthService:
         # Create user
         db_user = entities.User(
             email=user_create.email,
-            hashed_password=entities.User.hash_password(user_create.password.get_secret_value()),
+            hashed_password=password_hasher.hash_sync(user_create.password.get_secret_value()),
             role=user_create.role
         )
         db.add(db_user)
@@ -50,6 +197,25 @@ class AuthService:
             db.rollback()
             raise ValueError(f"Failed to create user: {str(e)}")
 
+    @staticmethod
+    def update_user(
+        db: Session,
+        user_id: int,
+        update: schemas.UserAdminUpdate
+    ) -> Optional[entities.User]:
+        user = db.get(entities.User, user_id)
+        if user is None:
+            return None
+        for key, value in update.model_dump(exclude_unset=True).items():
+            setattr(user, key, value)
+        try:
+            db.commit()
+            db.refresh(user)
+            return user
+        except Exception as e:
+            db.rollback()
+            raise ValueError(f"Failed to update user: {str(e)}")
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
@@ -58,7 +224,9 @@ class AuthService:
         else:
             expire = datetime.now(UTC) + timedelta(minutes=15)
         
-        to_encode.update({"exp": expire})
+        # iat and jti let a token be revoked on its own or with every
+        # token of its subject issued before a forced sign-out
+        to_encode.update({"exp": expire, "iat": time.time(), "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(
             to_encode, 
             settings.SECRET_KEY, 
@@ -67,30 +235,79 @@ class AuthService:
         return encoded_jwt
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return entities.User.verify_password(plain_password, hashed_password)
+    def decode_token(token: str) -> dict:
+        """Verified claims of token, decoding it only the first time it is seen"""
+        payload = verified_tokens.get(token)
+        if payload is None:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            verified_tokens.put(token, payload)
+        return payload
+
+    @staticmethod
+    def revoke_token(db: Session, token: str) -> None:
+        """Log a token out; one without a jti signs out its whole subject"""
+        payload = AuthService.decode_token(token)
+        revocation_list.revoke(
+            db,
+            expires_at=datetime.fromtimestamp(payload["exp"], UTC),
+            jti=payload.get("jti"),
+            subject=None if payload.get("jti") else payload.get("sub")
+        )
+        db.commit()
+
+    @staticmethod
+    def sign_out_user(db: Session, user_id: int) -> Optional[entities.User]:
+        """Revoke every token issued to the user so far"""
+        user = db.get(entities.User, user_id)
+        if user is None:
+            return None
+        # Tokens issued now expire within this window
+        revocation_list.revoke(
+            db,
+            expires_at=datetime.now(UTC) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+            subject=user.email
+        )
+        db.commit()
+        return user
+
+    @staticmethod
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """bcrypt check on the password hashing pool; 429 when it is saturated"""
+        try:
+            return await password_hasher.verify(plain_password, hashed_password)
+        except PasswordHasherBusy:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts in progress, try again shortly",
+                headers={"Retry-After": "1"}
+            )
 
     @staticmethod
     async def authenticate_user(
-        db: Session, 
+        db: AsyncSession, 
         email: str, 
         password: str
     ) -> Optional[entities.User]:
         print(f"Attempting to authenticate user: {email}")
-        user = db.query(entities.User).filter(entities.User.email == email).first()
+        result = await db.execute(
+            select(entities.User).filter(entities.User.email == email)
+        )
+        user = result.scalars().first()
         print(f"User found: {user is not None}")
         if not user:
             return None
         
         print("Verifying password...")
-        if not AuthService.verify_password(password, user.hashed_password):
+        if not await AuthService.verify_password(password, user.hashed_password):
             print("Password verification failed")
             return None
         print("Authentication successful")
         return user
 
+    # Plain def so FastAPI runs the blocking user lookup in its threadpool
+    # instead of on the event loop
     @staticmethod
-    async def get_current_user(
+    def get_current_user(
         token: str = Depends(oauth2_scheme),
         db: Session = Depends(get_db)
     ) -> entities.User:
@@ -100,20 +317,23 @@ class AuthService:
             headers={"WWW-Authenticate": "Bearer"},
         )
         try:
-            payload = jwt.decode(
-                token, 
-                settings.SECRET_KEY, 
-                algorithms=[settings.ALGORITHM]
-            )
-            email: str = payload.get("sub")
-            if email is None:
-                raise credentials_exception
+            payload = AuthService.decode_token(token)
         except JWTError:
             raise credentials_exception
+        email: str = payload.get("sub")
+        if email is None or revocation_list.is_revoked(db, payload):
+            raise credentials_exception
 
+        # A cached principal is merged in without a query; lazy relationships
+        # still load through this session
+        principal_cache.check_version(db)
+        cached = principal_cache.get(email)
+        if cached is not None:
+            return db.merge(cached, load=False)
         user = db.query(entities.User).filter(entities.User.email == email).first()
         if user is None:
             raise credentials_exception
+        principal_cache.put(user)
         return user
 
     @staticmethod
@@ -1,13 +1,26 @@
 from loguru import logger
-from typing import TypeVar, Generic, Type, List, Optional
+from typing import TypeVar, Generic, Type, List, Optional, Tuple, Sequence
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from src.core.pagination import Page, count_cache, encode_cursor, decode_cursor
 from src.models.base_entity import BaseEntity
 from src.models.entities import User
 
 T = TypeVar('T', bound=BaseEntity)
 
 class BaseService(Generic[T]):
+    # Indexed columns used for keyset pagination; the last one must be unique
+    cursor_columns: Tuple[str, ...] = ("id",)
+    # Loader options (the service's loading profile) applied to list and
+    # detail queries so nested response models don't lazy-load row by row
+    load_options: Tuple = ()
+    # Filtered sets at least this large get their total from count_cache
+    # (reported as approximate) for up to count_cache_ttl seconds
+    approximate_count_threshold: int = 10000
+    count_cache_ttl: float = 60.0
+
     def __init__(self, model: Type[T]):
         self.model = model
         self.logger = logger.bind(service=self.__class__.__name__)
@@ -17,18 +30,120 @@ class BaseService(Generic[T]):
         db: Session, 
         skip: int = 0, 
         limit: int = 100,
+        include_total: bool = False,
         **filters
     ) -> List[T]:
+        """Plain list of rows; use get_page for the cursor and total as well"""
+        return self.get_page(db, skip=skip, limit=limit, include_total=include_total, **filters).items
+
+    def get_page(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        options: Optional[Sequence] = None,
+        include_total: bool = False,
+        **filters
+    ) -> Page[T]:
+        """
+        Return one page of rows ordered by cursor_columns.
+
+        When a cursor is given the page starts right after the row it was
+        built from (keyset pagination) and skip is ignored; otherwise the
+        legacy offset is applied. options overrides the service's
+        load_options for endpoints that serialize a different shape.
+
+        include_total also reports how many rows match the filters. Offset
+        pages get it from a COUNT(*) OVER () column on the page query itself;
+        large sets are then served from count_cache until it goes stale.
+        """
         self.logger.debug(f"Getting all {self.model.__name__} with filters: {filters}")
-        query = db.query(self.model)
+        if not include_total:
+            query = self._page_query(db.query(self.model), skip, cursor, options, filters)
+            # Fetch one extra row to find out whether another page exists
+            return self._to_page(query.limit(limit + 1).all(), limit)
+
+        key = self._count_key(filters)
+        cached = count_cache.get(key, self.count_cache_ttl)
+        if cached is not None and (cursor or cached >= self.approximate_count_threshold):
+            query = self._page_query(db.query(self.model), skip, cursor, options, filters)
+            page = self._to_page(query.limit(limit + 1).all(), limit)
+            page.total = cached
+            page.total_is_approximate = True
+            return page
+
+        if cursor:
+            # The window would only count the rows after the cursor, so a
+            # cursor page with nothing cached pays for a separate count
+            query = self._page_query(db.query(self.model), skip, cursor, options, filters)
+            page = self._to_page(query.limit(limit + 1).all(), limit)
+            page.total = self._filtered_query(db.query(func.count(self.model.id)), filters).scalar()
+        else:
+            query = self._page_query(
+                db.query(self.model, func.count().over().label("total_count")),
+                skip, cursor, options, filters
+            )
+            rows = query.limit(limit + 1).all()
+            page = self._to_page([row[0] for row in rows], limit)
+            if rows:
+                page.total = rows[0].total_count
+            else:
+                # Past the end of an offset page: only the count is needed
+                page.total = self._filtered_query(
+                    db.query(func.count(self.model.id)), filters
+                ).scalar() if skip else 0
+        count_cache.set(key, page.total)
+        return page
+
+    def get_by_id(
+        self,
+        db: Session,
+        id: int,
+        options: Optional[Sequence] = None
+    ) -> Optional[T]:
+        self.logger.debug(f"Getting {self.model.__name__} with id: {id}")
+        return db.query(self.model).options(
+            *(self.load_options if options is None else options)
+        ).filter(self.model.id == id).first()
+
+    def _count_key(self, filters: dict) -> tuple:
+        return (self.model.__tablename__,) + tuple(sorted(
+            (key, value) for key, value in filters.items() if value is not None
+        ))
+
+    def _filtered_query(self, query, filters: dict):
         for key, value in filters.items():
             if value is not None:
                 query = query.filter(getattr(self.model, key) == value)
-        return query.offset(skip).limit(limit).all()
+        return query
 
-    def get_by_id(self, db: Session, id: int) -> Optional[T]:
-        self.logger.debug(f"Getting {self.model.__name__} with id: {id}")
-        return db.query(self.model).filter(self.model.id == id).first()
+    def _page_query(self, query, skip: int, cursor: Optional[str], options, filters: dict):
+        # Works on both a legacy Query and a 2.0-style select()
+        query = query.options(*(self.load_options if options is None else options))
+        query = self._filtered_query(query, filters)
+
+        columns = [getattr(self.model, name) for name in self.cursor_columns]
+        query = query.order_by(*columns)
+        if cursor:
+            try:
+                values = decode_cursor(cursor, len(columns))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            query = query.filter(tuple_(*columns) > tuple_(*values))
+        elif skip:
+            query = query.offset(skip)
+        return query
+
+    def _to_page(self, rows: List[T], limit: int) -> Page[T]:
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, name) for name in self.cursor_columns]
+            )
+        return Page(items=rows, next_cursor=next_cursor)
 
     def create(self, db: Session, data: dict, current_user: User) -> T:
         self.logger.info(
@@ -59,7 +174,7 @@ class BaseService(Generic[T]):
         self.logger.info(
             f"Updating {self.model.__name__} id: {id} by user {current_user.email}"
         )
-        db_item = self.get_by_id(db, id)
+        db_item = self.get_by_id(db, id, options=())
         if db_item:
             for key, value in data.items():
                 setattr(db_item, key, value)
@@ -78,7 +193,7 @@ class BaseService(Generic[T]):
 
     def delete(self, db: Session, id: int) -> bool:
         self.logger.info(f"Deleting {self.model.__name__} id: {id}")
-        db_item = self.get_by_id(db, id)
+        db_item = self.get_by_id(db, id, options=())
         if db_item:
             try:
                 db.delete(db_item)
@@ -89,4 +204,97 @@ class BaseService(Generic[T]):
                 self.logger.error(f"Error deleting {self.model.__name__} id {id}: {str(e)}")
                 db.rollback()
                 raise HTTPException(status_code=400, detail=str(e))
-        return False 
\ No newline at end of file
+        return False
+
+    # Async variants for routes running on the event loop. Relationships
+    # can't be lazy-loaded under asyncio, so anything the caller serializes
+    # must be covered by load_options or the options argument.
+
+    async def async_get_page(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        options: Optional[Sequence] = None,
+        **filters
+    ) -> Page[T]:
+        self.logger.debug(f"Getting all {self.model.__name__} with filters: {filters}")
+        stmt = self._page_query(select(self.model), skip, cursor, options, filters)
+        result = await db.execute(stmt.limit(limit + 1))
+        return self._to_page(result.scalars().unique().all(), limit)
+
+    async def async_get_by_id(
+        self,
+        db: AsyncSession,
+        id: int,
+        options: Optional[Sequence] = None
+    ) -> Optional[T]:
+        self.logger.debug(f"Getting {self.model.__name__} with id: {id}")
+        result = await db.execute(
+            select(self.model)
+            .options(*(self.load_options if options is None else options))
+            .filter(self.model.id == id)
+        )
+        return result.scalars().first()
+
+    async def async_create(self, db: AsyncSession, data: dict, current_user: User) -> T:
+        self.logger.info(
+            f"Creating new {self.model.__name__} by user {current_user.email}"
+        )
+        db_item = self.model(**data)
+        db_item.created_by_id = current_user.id
+        db_item.updated_by_id = current_user.id
+
+        try:
+            db.add(db_item)
+            await db.commit()
+            await db.refresh(db_item)
+            self.logger.info(f"Created {self.model.__name__} with id: {db_item.id}")
+            return db_item
+        except Exception as e:
+            self.logger.error(f"Error creating {self.model.__name__}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def async_update(
+        self,
+        db: AsyncSession,
+        id: int,
+        data: dict,
+        current_user: User
+    ) -> Optional[T]:
+        self.logger.info(
+            f"Updating {self.model.__name__} id: {id} by user {current_user.email}"
+        )
+        db_item = await self.async_get_by_id(db, id, options=())
+        if db_item:
+            for key, value in data.items():
+                setattr(db_item, key, value)
+            db_item.updated_by_id = current_user.id
+
+            try:
+                await db.commit()
+                await db.refresh(db_item)
+                self.logger.info(f"Updated {self.model.__name__} id: {id}")
+                return db_item
+            except Exception as e:
+                self.logger.error(f"Error updating {self.model.__name__} id {id}: {str(e)}")
+                await db.rollback()
+                raise HTTPException(status_code=400, detail=str(e))
+        return None
+
+    async def async_delete(self, db: AsyncSession, id: int) -> bool:
+        self.logger.info(f"Deleting {self.model.__name__} id: {id}")
+        db_item = await self.async_get_by_id(db, id, options=())
+        if db_item:
+            try:
+                await db.delete(db_item)
+                await db.commit()
+                self.logger.info(f"Deleted {self.model.__name__} id: {id}")
+                return True
+            except Exception as e:
+                self.logger.error(f"Error deleting {self.model.__name__} id {id}: {str(e)}")
+                await db.rollback()
+                raise HTTPException(status_code=400, detail=str(e))
+        return False
\ No newline at end of file
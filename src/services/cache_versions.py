@@ -0,0 +1,74 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from src.models import entities
+
+def bump_cache_version(session: Session, name: str) -> None:
+    """Increment the named counter in cache_versions in the session's transaction"""
+    table = entities.CacheVersion.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(table)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(table)
+    else:
+        raise ValueError(f"Cache versions are not supported on {dialect}")
+    # One statement, so two first writers can't both insert the row
+    session.execute(statement.values(name=name, version=1).on_conflict_do_update(
+        index_elements=["name"], set_={"version": table.c.version + 1}
+    ))
+
+class VersionedCache(ABC):
+    """
+    Base for process-wide caches of rarely changing rows.
+
+    Writers bump the version_key counter in cache_versions in the same
+    transaction as the change (bump_cache_version). The cache compares that
+    counter at most once per version_check_interval and is cleared when it
+    moved, so other processes see a change within that interval; the
+    writing process calls invalidate() on commit. Between checks a lookup
+    costs no query.
+    """
+
+    version_key: str
+    version_check_interval = 1.0
+
+    def __init__(self):
+        self._version: Optional[int] = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def version_query(self):
+        return select(entities.CacheVersion.version).where(
+            entities.CacheVersion.name == self.version_key
+        )
+
+    def needs_version_check(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.version_check_interval
+
+    def observe_version(self, version: Optional[int]) -> None:
+        version = version or 0
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    def check_version(self, db: Session) -> None:
+        if self.needs_version_check():
+            self.observe_version(db.execute(self.version_query()).scalar())
+
+    def invalidate(self) -> None:
+        """Drop everything and re-read the version on the next lookup"""
+        with self._lock:
+            self._clear()
+            self._version = None
+            self._checked_at = float("-inf")
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Drop every entry; called with the lock held"""
\ No newline at end of file
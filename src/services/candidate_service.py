@@ -1,15 +1,63 @@
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from pydantic import AnyUrl, ValidationError
 from src.models import entities, schemas
 from src.services.base_service import BaseService
-from typing import List, Optional
+from src.core.pagination import Page, decode_cursor, encode_cursor
+from src.database import search
+from src.core.streaming import Record
+from typing import AsyncIterator, List, Optional, Tuple
 
 class CandidateService(BaseService[entities.Candidate]):
     def __init__(self):
         super().__init__(entities.Candidate)
 
-    def get_candidates(self, db: Session, skip: int = 0, limit: int = 100) -> List[entities.Candidate]:
-        return self.get_all(db, skip=skip, limit=limit)
+    def get_candidates(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[entities.Candidate]:
+        return self.get_page(db, skip=skip, limit=limit, cursor=cursor, include_total=include_total)
+
+    def search_candidates(
+        self,
+        db: Session,
+        q: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[entities.Candidate]:
+        """
+        Best matches first from the full-text index. Pages are keyed on
+        (rank, id), so cursors stay stable while the index is unchanged.
+        """
+        self.logger.debug(f"Searching candidates for: {q}")
+        matches = search.candidate_matches(
+            db.get_bind().dialect.name, search.parse_search_query(q)
+        )
+        rank, id = matches.selected_columns.rank, matches.selected_columns.id
+        # Rank and cut the page inside the index query; only the page's
+        # rows are then joined to candidates
+        matches = matches.order_by(rank, id)
+        if cursor:
+            matches = matches.where(tuple_(rank, id) > tuple_(*decode_cursor(cursor, 2)))
+        elif skip:
+            matches = matches.offset(skip)
+        matches = matches.limit(limit + 1).subquery()
+        rows = db.query(entities.Candidate, matches.c.rank).join(
+            matches, matches.c.id == entities.Candidate.id
+        ).order_by(matches.c.rank, matches.c.id).all()
+
+        page = Page(items=[candidate for candidate, _ in rows[:limit]])
+        if len(rows) > limit:
+            candidate, rank = rows[limit - 1]
+            page.next_cursor = encode_cursor([rank, candidate.id])
+        return page
 
     def get_candidate(self, db: Session, candidate_id: int) -> Optional[entities.Candidate]:
         return self.get_by_id(db, candidate_id)
@@ -37,4 +85,115 @@ class CandidateService(BaseService[entities.Candidate]):
         current_user: entities.User
     ) -> Optional[entities.Candidate]:
         candidate_data = candidate.model_dump()
-        return self.update(db, candidate_id, candidate_data, current_user) 
\ No newline at end of file
+        return self.update(db, candidate_id, candidate_data, current_user)
+
+    async def import_candidates(
+        self,
+        db: AsyncSession,
+        records: AsyncIterator[Record],
+        current_user: entities.User,
+        chunk_size: int = 1000,
+        max_errors: int = 1000
+    ) -> schemas.CandidateImportResult:
+        """
+        Validate and insert streamed candidate records chunk by chunk.
+
+        Each chunk costs one SELECT to find emails that already exist and
+        one executemany INSERT, and is committed on its own, so memory stays
+        bounded by chunk_size and earlier chunks survive a later failure.
+        """
+        result = schemas.CandidateImportResult()
+        seen_emails = set()
+        chunk: List[Tuple[int, schemas.CandidateCreate]] = []
+
+        async for row, record, error in records:
+            result.total += 1
+            if error:
+                self._import_failed(result, max_errors, row, None, [error])
+                continue
+            try:
+                candidate = schemas.CandidateCreate(**record)
+            except ValidationError as e:
+                self._import_failed(result, max_errors, row, record.get("email"), [
+                    f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                    for err in e.errors()
+                ])
+                continue
+            if candidate.email in seen_emails:
+                self._import_failed(result, max_errors, row, candidate.email, ["Duplicate email in upload"])
+                continue
+            seen_emails.add(candidate.email)
+
+            chunk.append((row, candidate))
+            if len(chunk) >= chunk_size:
+                await self._import_chunk(db, chunk, current_user, result, max_errors)
+                chunk = []
+
+        if chunk:
+            await self._import_chunk(db, chunk, current_user, result, max_errors)
+
+        self.logger.info(
+            f"Imported {result.created}/{result.total} candidates by user {current_user.email}"
+        )
+        return result
+
+    async def _import_chunk(
+        self,
+        db: AsyncSession,
+        chunk: List[Tuple[int, schemas.CandidateCreate]],
+        current_user: entities.User,
+        result: schemas.CandidateImportResult,
+        max_errors: int
+    ) -> None:
+        emails = [candidate.email for _, candidate in chunk]
+        existing = set((await db.execute(
+            select(entities.Candidate.email).where(entities.Candidate.email.in_(emails))
+        )).scalars())
+
+        rows = []
+        for row, candidate in chunk:
+            if candidate.email in existing:
+                self._import_failed(
+                    result, max_errors, row, candidate.email,
+                    [f"Candidate with email {candidate.email} already exists"]
+                )
+                continue
+            data = {
+                key: str(value) if isinstance(value, AnyUrl) else value
+                for key, value in candidate.model_dump().items()
+            }
+            data["created_by_id"] = current_user.id
+            data["updated_by_id"] = current_user.id
+            rows.append((row, data))
+        if not rows:
+            return
+
+        try:
+            await db.execute(insert(entities.Candidate), [data for _, data in rows])
+            await db.commit()
+            result.created += len(rows)
+        except IntegrityError:
+            # Lost a race with a concurrent insert; retry row by row to find it
+            await db.rollback()
+            for row, data in rows:
+                try:
+                    await db.execute(insert(entities.Candidate), data)
+                    await db.commit()
+                    result.created += 1
+                except IntegrityError as e:
+                    await db.rollback()
+                    self._import_failed(result, max_errors, row, data["email"], [str(e.orig)])
+
+    @staticmethod
+    def _import_failed(
+        result: schemas.CandidateImportResult,
+        max_errors: int,
+        row: int,
+        email: Optional[str],
+        errors: List[str]
+    ) -> None:
+        result.failed += 1
+        if len(result.errors) < max_errors:
+            result.errors.append(schemas.CandidateImportError(row=row, email=email, errors=errors))
+        else:
+            result.errors_truncated = True
\ No newline at end of file
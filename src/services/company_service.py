@@ -1,8 +1,8 @@
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 from src.models import entities, schemas
 from src.services.base_service import BaseService
-from typing import List, Optional
+from src.core.pagination import Page
+from typing import Optional
 
 class CompanyService(BaseService[entities.Company]):
     def __init__(self):
@@ -22,43 +22,15 @@ class CompanyService(BaseService[entities.Company]):
         company_data = company.model_dump()
         return self.update(db, company_id, company_data, current_user)
 
-    def get_companies(self, db: Session, skip: int = 0, limit: int = 100) -> List[entities.Company]:
-        return self.get_all(db, skip=skip, limit=limit)
+    def get_companies(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[entities.Company]:
+        return self.get_page(db, skip=skip, limit=limit, cursor=cursor, include_total=include_total)
 
     def get_company(self, db: Session, company_id: int) -> Optional[entities.Company]:
-        return self.get_by_id(db, company_id)
-
-    @staticmethod
-    def get_companies(db: Session, skip: int = 0, limit: int = 100) -> List[entities.Company]:
-        return db.query(entities.Company).offset(skip).limit(limit).all()
-
-    @staticmethod
-    def get_company(db: Session, company_id: int) -> Optional[entities.Company]:
-        return db.query(entities.Company).filter(entities.Company.id == company_id).first()
-
-    @staticmethod
-    def create_company(db: Session, company: schemas.CompanyCreate) -> entities.Company:
-        db_company = entities.Company(**company.model_dump())
-        try:
-            db.add(db_company)
-            db.commit()
-            db.refresh(db_company)
-            return db_company
-        except IntegrityError:
-            db.rollback()
-            raise ValueError("Failed to create company")
-
-    @staticmethod
-    def update_company(db: Session, company_id: int, company: schemas.CompanyBase) -> Optional[entities.Company]:
-        db_company = db.query(entities.Company).filter(entities.Company.id == company_id).first()
-        if db_company:
-            for key, value in company.model_dump().items():
-                setattr(db_company, key, value)
-            try:
-                db.commit()
-                db.refresh(db_company)
-                return db_company
-            except IntegrityError:
-                db.rollback()
-                raise ValueError("Failed to update company")
-        return None 
\ No newline at end of file
+        return self.get_by_id(db, company_id)
\ No newline at end of file
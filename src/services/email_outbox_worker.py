@@ -0,0 +1,259 @@
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from loguru import logger
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import get_settings
+from src.database import AsyncSessionLocal
+from src.models import entities
+from src.models.base_entity import utc_now
+from src.services.email_service import EmailService
+
+class PermanentDeliveryError(Exception):
+    """A message that can never be sent, e.g. its template is missing"""
+
+class EmailOutboxWorker:
+    """
+    Background asyncio task that drains the email outbox.
+
+    Each pass claims a batch of due messages by stamping them with a claim
+    token and a lease, sends them with at most `concurrency` SMTP sessions
+    in flight, and records the outcome. Transient failures are retried with
+    exponential backoff and jitter; after max_attempts, or on a permanent
+    error, a message is dead-lettered. A worker that dies mid-batch leaves
+    its rows to be claimed again when the lease runs out.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        email_service: Optional[EmailService] = None,
+        concurrency: int = 10,
+        batch_size: int = 100,
+        max_attempts: int = 8,
+        base_backoff: timedelta = timedelta(seconds=30),
+        max_backoff: timedelta = timedelta(hours=1),
+        lease: timedelta = timedelta(minutes=5),
+        poll_interval: float = 1.0
+    ):
+        self.session_factory = session_factory
+        self.email_service = email_service or EmailService()
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.metrics: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            self.logger.info("Email outbox worker started")
+
+    async def stop(self) -> None:
+        """Let the current batch finish, then stop"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self.email_service.close()
+        self.logger.info("Email outbox worker stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                self.metrics["errors"] += 1
+                self.logger.error(f"Email outbox pass failed: {str(e)}")
+                processed = 0
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        """Claim, send and settle one batch; returns how many were claimed"""
+        async with self.session_factory() as db:
+            token, messages = await self._claim(db)
+            if not messages:
+                return 0
+            templates = await self._templates(db, messages)
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outcomes = await asyncio.gather(*(
+            self._send(message, templates, semaphore) for message in messages
+        ))
+        self.metrics["batch_seconds"] = round(time.perf_counter() - started, 3)
+
+        async with self.session_factory() as db:
+            await self._settle(db, token, messages, outcomes)
+        return len(messages)
+
+    async def _claim(self, db: AsyncSession) -> Tuple[str, List[entities.EmailOutbox]]:
+        """Lease a batch of due rows under a fresh claim token"""
+        outbox = entities.EmailOutbox
+        now = utc_now()
+        token = uuid.uuid4().hex
+        due = select(outbox.id).where(or_(
+            and_(outbox.status == entities.EmailOutboxStatus.PENDING, outbox.next_attempt_at <= now),
+            and_(outbox.status == entities.EmailOutboxStatus.SENDING, outbox.locked_until < now),
+        )).order_by(outbox.next_attempt_at).limit(self.batch_size)
+        if db.bind.dialect.name == "postgresql":
+            # Concurrent workers skip each other's rows instead of waiting
+            due = due.with_for_update(skip_locked=True)
+        await db.execute(
+            update(outbox)
+            .where(outbox.id.in_(due.scalar_subquery()))
+            .values(
+                status=entities.EmailOutboxStatus.SENDING,
+                claim_token=token,
+                locked_until=now + self.lease
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        result = await db.execute(select(outbox).where(outbox.claim_token == token))
+        messages = list(result.scalars())
+        self.metrics["claimed"] += len(messages)
+        return token, messages
+
+    async def _templates(self, db: AsyncSession, messages: List[entities.EmailOutbox]) -> Dict[tuple, object]:
+        """Active template per (type, name) in the batch, or the error resolving it"""
+        templates = {}
+        for key in {(message.template_type, message.template_name) for message in messages}:
+            try:
+                templates[key] = await self.email_service.template_service.get_active_template_async(db, *key)
+            except HTTPException as e:
+                templates[key] = PermanentDeliveryError(e.detail)
+        return templates
+
+    async def _send(
+        self,
+        message: entities.EmailOutbox,
+        templates: Dict[tuple, object],
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[Optional[str], bool]:
+        """(error or None, whether the error is permanent)"""
+        template = templates[(message.template_type, message.template_name)]
+        try:
+            if isinstance(template, PermanentDeliveryError):
+                raise template
+            try:
+                subject, html_content = self.email_service.template_service.render_template(
+                    template, json.loads(message.template_data or "{}")
+                )
+            except ValueError as e:
+                raise PermanentDeliveryError(str(e))
+            async with semaphore:
+                await self.email_service.deliver(message.to_email, subject, html_content)
+            return None, False
+        except PermanentDeliveryError as e:
+            return str(e), True
+        except Exception as e:
+            return f"{type(e).__name__}: {str(e)}", False
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Delay before retry number `attempts`: doubling, capped, with jitter"""
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _settle(
+        self,
+        db: AsyncSession,
+        token: str,
+        messages: List[entities.EmailOutbox],
+        outcomes: List[Tuple[Optional[str], bool]]
+    ) -> None:
+        """
+        Record each outcome, but only on rows still held under token: a
+        batch that outran its lease may have been claimed by another
+        worker, whose state must not be overwritten.
+        """
+        outbox = entities.EmailOutbox
+        held = outbox.claim_token == token
+        now = utc_now()
+        sent = [message.id for message, (error, _) in zip(messages, outcomes) if error is None]
+        if sent:
+            result = await db.execute(
+                update(outbox).where(outbox.id.in_(sent), held).values(
+                    status=entities.EmailOutboxStatus.SENT, sent_at=now,
+                    attempts=outbox.attempts + 1, locked_until=None, last_error=None
+                ).execution_options(synchronize_session=False)
+            )
+            self.metrics["sent"] += len(sent)
+            self._lost_leases(len(sent) - result.rowcount)
+        for message, (error, permanent) in zip(messages, outcomes):
+            if error is None:
+                continue
+            attempts = message.attempts + 1
+            values = {"attempts": attempts, "locked_until": None, "last_error": error[:2000]}
+            dead = permanent or attempts >= self.max_attempts
+            if dead:
+                values["status"] = entities.EmailOutboxStatus.DEAD
+            else:
+                values["status"] = entities.EmailOutboxStatus.PENDING
+                values["next_attempt_at"] = now + self.backoff(attempts)
+            result = await db.execute(
+                update(outbox).where(outbox.id == message.id, held).values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if not result.rowcount:
+                self._lost_leases(1)
+            elif dead:
+                self.metrics["dead"] += 1
+                self.logger.error(f"Email {message.id} to {message.to_email} dead-lettered: {error}")
+            else:
+                self.metrics["retried"] += 1
+                self.logger.warning(f"Email {message.id} to {message.to_email} failed, will retry: {error}")
+        await db.commit()
+
+    def _lost_leases(self, count: int) -> None:
+        if count:
+            self.metrics["lost_leases"] += count
+            self.logger.warning(f"{count} outbox rows were reclaimed before their batch was settled")
+
+    async def stats(self, db: AsyncSession) -> dict:
+        """Outbox size per status plus this worker's counters"""
+        outbox = entities.EmailOutbox
+        rows = (await db.execute(
+            select(outbox.status, func.count(), func.min(outbox.created_at)).group_by(outbox.status)
+        )).all()
+        return {
+            "running": self.running,
+            "outbox": {status.value: count for status, count, _ in rows},
+            "oldest_pending": next(
+                (oldest for status, _, oldest in rows if status == entities.EmailOutboxStatus.PENDING), None
+            ),
+            "worker": dict(self.metrics),
+            "smtp_pool": self.email_service.pool.stats(),
+        }
+
+settings = get_settings()
+
+# Shared by the app: started and stopped with it (see src.main)
+email_outbox_worker = EmailOutboxWorker(
+    AsyncSessionLocal,
+    concurrency=settings.EMAIL_WORKER_CONCURRENCY,
+    max_attempts=settings.EMAIL_MAX_ATTEMPTS
+)
\ No newline at end of file
@@ -1,13 +1,15 @@
-from fastapi import HTTPException
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-import aiosmtplib
+import json
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
 from loguru import logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
+from src.models import entities
 from src.core.config import get_settings
+from src.core.smtp_pool import SMTPConnectionPool
 from src.services.email_template_service import EmailTemplateService
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 class EmailService:
@@ -22,49 +24,87 @@ class EmailService:
         self.smtp_user = settings.SMTP_USER
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.FROM_EMAIL
+        self.smtp_use_tls = settings.SMTP_USE_TLS
+        self.smtp_pool_size = settings.SMTP_POOL_SIZE
+        self.smtp_pool_max_messages = settings.SMTP_POOL_MAX_MESSAGES
+        self.smtp_pool_idle_timeout = settings.SMTP_POOL_IDLE_TIMEOUT
+        self._pool: Optional[SMTPConnectionPool] = None
 
-    async def send_email(
+    @property
+    def pool(self) -> SMTPConnectionPool:
+        """SMTP sessions shared by every deliver() on this service, opened on first use"""
+        if self._pool is None:
+            self._pool = SMTPConnectionPool(
+                self.smtp_host,
+                self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_password,
+                use_tls=self.smtp_use_tls,
+                max_size=self.smtp_pool_size,
+                max_messages=self.smtp_pool_max_messages,
+                idle_timeout=self.smtp_pool_idle_timeout
+            )
+        return self._pool
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+
+    def enqueue(
         self,
-        db: Session,
+        db: Union[Session, AsyncSession],
         to_email: str,
         template_type: str,
         *,
         template_name: Optional[str] = None,
         template_data: Dict[str, Any]
-    ) -> None:
-        try:
-            # Get and render template
-            template = self.template_service.get_active_template(
-                db, template_type, template_name
-            )
-            subject, html_content = self.template_service.render_template(
-                template, template_data
-            )
+    ) -> entities.EmailOutbox:
+        """
+        Add an email to the outbox in the caller's transaction; it is sent by
+        the outbox worker once the transaction commits. Nothing is sent if
+        the transaction rolls back.
+        """
+        message = entities.EmailOutbox(
+            to_email=to_email,
+            template_type=template_type,
+            template_name=template_name,
+            template_data=json.dumps(template_data, default=str)
+        )
+        db.add(message)
+        return message
 
-            # Create message
-            message = MIMEMultipart()
-            message["From"] = self.from_email
-            message["To"] = to_email
-            message["Subject"] = subject
+    def enqueue_batch(
+        self,
+        db: Session,
+        template_type: str,
+        recipients: List[Tuple[str, Dict[str, Any]]],
+        template_name: Optional[str] = None
+    ) -> int:
+        """enqueue() for many (email, data) pairs with a single INSERT"""
+        if recipients:
+            db.execute(entities.EmailOutbox.__table__.insert(), [
+                {
+                    "to_email": to_email,
+                    "template_type": template_type,
+                    "template_name": template_name,
+                    "template_data": json.dumps(template_data, default=str),
+                }
+                for to_email, template_data in recipients
+            ])
+        return len(recipients)
 
-            # Add HTML content
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
+    async def deliver(self, to_email: str, subject: str, html_content: str) -> None:
+        # Create message
+        message = MIMEMultipart()
+        message["From"] = self.from_email
+        message["To"] = to_email
+        message["Subject"] = subject
 
-            # Send email
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_user,
-                password=self.smtp_password,
-                use_tls=True
-            )
+        # Add HTML content
+        html_part = MIMEText(html_content, "html")
+        message.attach(html_part)
+
+        # Send email over a pooled session
+        await self.pool.send(message)
 
-            self.logger.info(f"Email sent successfully to {to_email}")
-        except Exception as e:
-            self.logger.error(f"Failed to send email to {to_email}: {str(e)}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to send email: {str(e)}"
-            ) 
\ No newline at end of file
+        self.logger.info(f"Email sent successfully to {to_email}") 
\ No newline at end of file
@@ -1,10 +1,144 @@
+import threading
+from collections import Counter, OrderedDict
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.models import entities, schemas
 from src.services.base_service import BaseService
-from typing import List, Optional
+from src.services.cache_versions import VersionedCache, bump_cache_version
+from src.core.config import get_settings
+from typing import Dict, Hashable, List, Optional, Tuple
 from jinja2 import Template
+from jinja2.sandbox import SandboxedEnvironment
 from fastapi import HTTPException, status
 
+# Shared by every render: templates are edited by users, so they can't
+# reach unsafe attributes or methods of the objects they're given
+template_environment = SandboxedEnvironment()
+
+class CompiledTemplateCache:
+    """
+    Least recently used compiled (subject, html) templates per template
+    version. The key is (id, updated_at); the sources are compared too, so
+    an edit within updated_at's resolution still recompiles.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._templates: "OrderedDict[Hashable, Tuple[str, str, Template, Template]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.metrics: Counter = Counter()
+
+    def get(self, template: entities.EmailTemplate) -> Tuple[Template, Template]:
+        if template.id is None:
+            self.metrics["misses"] += 1
+            return self._compile(template)
+        key = (template.id, template.updated_at or template.created_at)
+        with self._lock:
+            cached = self._templates.get(key)
+            if cached and cached[:2] == (template.subject_template, template.html_content):
+                self._templates.move_to_end(key)
+                self.metrics["hits"] += 1
+                return cached[2], cached[3]
+        self.metrics["misses"] += 1
+        subject, html = self._compile(template)
+        with self._lock:
+            self._templates[key] = (template.subject_template, template.html_content, subject, html)
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_entries:
+                self._templates.popitem(last=False)
+                self.metrics["evictions"] += 1
+        return subject, html
+
+    def _compile(self, template: entities.EmailTemplate) -> Tuple[Template, Template]:
+        return (
+            template_environment.from_string(template.subject_template),
+            template_environment.from_string(template.html_content)
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._templates)
+        return {"size": size, "max_entries": self.max_entries, **self.metrics}
+
+compiled_templates = CompiledTemplateCache(get_settings().EMAIL_TEMPLATE_CACHE_SIZE)
+
+class ActiveTemplateCache(VersionedCache):
+    """
+    Active template per (type, name), including "there is none", shared by
+    the process. Any ORM write to email templates bumps the version (see
+    the flush hook below). Cached templates are detached copies, safe to
+    share between sessions.
+    """
+
+    version_key = "email_templates"
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._templates: Dict[Tuple[str, Optional[str]], Optional[entities.EmailTemplate]] = {}
+        self.metrics: Counter = Counter()
+
+    def _clear(self) -> None:
+        if self._templates:
+            self.metrics["invalidations"] += 1
+        self._templates.clear()
+
+    def get(self, key: Tuple[str, Optional[str]]) -> Tuple[bool, Optional[entities.EmailTemplate]]:
+        with self._lock:
+            if key in self._templates:
+                self.metrics["hits"] += 1
+                return True, self._templates[key]
+        self.metrics["misses"] += 1
+        return False, None
+
+    def put(
+        self,
+        key: Tuple[str, Optional[str]],
+        template: Optional[entities.EmailTemplate]
+    ) -> Optional[entities.EmailTemplate]:
+        """Cache a copy of template and return it"""
+        if template is not None:
+            template = entities.EmailTemplate(**{
+                column.key: getattr(template, column.key)
+                for column in entities.EmailTemplate.__mapper__.column_attrs
+            })
+        with self._lock:
+            if len(self._templates) >= self.max_entries and key not in self._templates:
+                self._templates.pop(next(iter(self._templates)))
+            self._templates[key] = template
+        return template
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._templates)
+        return {"size": size, "version": self._version, **self.metrics}
+
+active_templates = ActiveTemplateCache()
+
+@event.listens_for(Session, "after_flush")
+def bump_email_template_version(session: Session, flush_context) -> None:
+    """Any ORM write to email templates invalidates the active template caches"""
+    if any(
+        isinstance(obj, entities.EmailTemplate)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        bump_cache_version(session, ActiveTemplateCache.version_key)
+        session.info["email_templates_changed"] = True
+
+@event.listens_for(Session, "after_commit")
+def invalidate_active_templates(session: Session) -> None:
+    if session.info.pop("email_templates_changed", False):
+        active_templates.invalidate()
+
+@event.listens_for(Session, "after_rollback")
+def discard_email_template_changes(session: Session) -> None:
+    session.info.pop("email_templates_changed", None)
+
 class EmailTemplateService(BaseService[entities.EmailTemplate]):
     def __init__(self):
         super().__init__(entities.EmailTemplate)
@@ -32,21 +166,29 @@ class EmailTemplateService(BaseService[entities.EmailTemplate]):
                 detail=str(e)
             )
 
+    def _active_template_query(self, template_type: str, name: Optional[str] = None):
+        query = select(self.model).where(
+            self.model.type == template_type,
+            self.model.is_active == True
+        )
+        if name:
+            query = query.where(self.model.name == name)
+        return query.limit(1)
+
     def get_active_template(
         self,
         db: Session,
         template_type: str,
         name: Optional[str] = None
     ) -> entities.EmailTemplate:
-        query = db.query(self.model).filter(
-            self.model.type == template_type,
-            self.model.is_active == True
-        )
-        
-        if name:
-            query = query.filter(self.model.name == name)
-        
-        template = query.first()
+        """The active template, read through the process-wide cache"""
+        active_templates.check_version(db)
+        key = (template_type, name or None)
+        cached, template = active_templates.get(key)
+        if not cached:
+            template = active_templates.put(
+                key, db.execute(self._active_template_query(template_type, name)).scalars().first()
+            )
         if not template:
             raise HTTPException(
                 status_code=404,
@@ -54,18 +196,43 @@ class EmailTemplateService(BaseService[entities.EmailTemplate]):
             )
         return template
 
+    async def get_active_template_async(
+        self,
+        db: AsyncSession,
+        template_type: str,
+        name: Optional[str] = None
+    ) -> entities.EmailTemplate:
+        if active_templates.needs_version_check():
+            active_templates.observe_version((await db.execute(active_templates.version_query())).scalar())
+        key = (template_type, name or None)
+        cached, template = active_templates.get(key)
+        if not cached:
+            result = await db.execute(self._active_template_query(template_type, name))
+            template = active_templates.put(key, result.scalars().first())
+        if not template:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No active template found for type: {template_type}"
+            )
+        return template
+
+    def update_template(
+        self,
+        db: Session,
+        template_id: int,
+        template: schemas.EmailTemplateUpdate,
+        current_user: entities.User
+    ) -> Optional[entities.EmailTemplate]:
+        return self.update(db, template_id, template.model_dump(exclude_unset=True), current_user)
+
     def render_template(
         self,
         template: entities.EmailTemplate,
         context: dict
     ) -> tuple[str, str]:
         try:
-            # Render subject
-            subject_template = Template(template.subject_template)
+            subject_template, content_template = compiled_templates.get(template)
             subject = subject_template.render(**context)
-
-            # Render content
-            content_template = Template(template.html_content)
             content = content_template.render(**context)
 
             return subject, content
@@ -0,0 +1,245 @@
+from collections import defaultdict
+from datetime import date, datetime, UTC
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from loguru import logger
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from src.models import entities, schemas
+
+# Pipeline order used for stage-to-stage conversion; rejected and withdrawn
+# are exits from the pipeline and get no conversion rate
+FUNNEL_STAGES = (
+    entities.ApplicationStatus.APPLIED,
+    entities.ApplicationStatus.SCREENING,
+    entities.ApplicationStatus.INTERVIEWING,
+    entities.ApplicationStatus.OFFERED,
+    entities.ApplicationStatus.HIRED,
+)
+
+class StatusTransition(NamedTuple):
+    """An application entering to_status (None when it was deleted) from from_status"""
+    job_opening_id: int
+    from_status: Optional[entities.ApplicationStatus]
+    to_status: Optional[entities.ApplicationStatus]
+    application_id: Optional[int] = None
+    changed_by_id: Optional[int] = None
+    changed_at: Optional[datetime] = None
+
+def job_companies(db: Session, job_ids: Iterable[int]) -> Dict[int, int]:
+    """company_id per job opening id"""
+    return dict(db.execute(
+        select(entities.JobOpening.id, entities.JobOpening.company_id)
+        .where(entities.JobOpening.id.in_(set(job_ids)))
+    ).all())
+
+class FunnelService:
+    def __init__(self):
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def record(
+        self,
+        db: Session,
+        transitions: Iterable[StatusTransition],
+        day: Optional[date] = None,
+        companies: Optional[Dict[int, int]] = None
+    ) -> None:
+        """
+        Add status transitions to the daily rollup inside the caller's
+        transaction, with one upsert per touched (job, day, status) row.
+        """
+        day = day or datetime.now(UTC).date()
+        deltas: Dict[tuple, List[int]] = defaultdict(lambda: [0, 0])
+        for transition in transitions:
+            if transition.from_status is not None:
+                deltas[(transition.job_opening_id, transition.from_status)][1] += 1
+            if transition.to_status is not None:
+                deltas[(transition.job_opening_id, transition.to_status)][0] += 1
+        if not deltas:
+            return
+
+        if companies is None:
+            companies = job_companies(db, (job_id for job_id, _ in deltas))
+        self._upsert(db, [
+            {
+                "job_opening_id": job_id,
+                "day": day,
+                "status": status,
+                "company_id": companies.get(job_id),
+                "entered": entered,
+                "exited": exited,
+            }
+            for (job_id, status), (entered, exited) in deltas.items()
+        ])
+
+    def _upsert(self, db: Session, rows: List[dict]) -> None:
+        table = entities.ApplicationFunnelDaily.__table__
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            statement = postgresql.insert(table)
+        elif dialect == "sqlite":
+            statement = sqlite.insert(table)
+        else:
+            raise ValueError(f"Funnel rollups are not supported on {dialect}")
+        statement = statement.on_conflict_do_update(
+            index_elements=["job_opening_id", "day", "status"],
+            set_={
+                "entered": table.c.entered + statement.excluded.entered,
+                "exited": table.c.exited + statement.excluded.exited,
+            }
+        )
+        db.execute(statement, rows)
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Recompute the rollup from the applications table; returns the row count.
+
+        Only the current status is known per application, so each one is
+        counted as entering applied on its applied_date and, if it has moved
+        on since, leaving applied for its current status on its last update.
+        """
+        application = entities.Application
+        job = entities.JobOpening
+        deltas: Dict[tuple, List[int]] = defaultdict(lambda: [0, 0])
+
+        applied = db.execute(
+            select(
+                application.job_opening_id, job.company_id,
+                func.date(func.coalesce(application.applied_date, application.created_at)),
+                func.count()
+            ).join(job, job.id == application.job_opening_id).group_by(
+                application.job_opening_id, job.company_id,
+                func.date(func.coalesce(application.applied_date, application.created_at))
+            )
+        ).all()
+        for job_id, company_id, day, count in applied:
+            deltas[(job_id, company_id, _as_date(day), entities.ApplicationStatus.APPLIED)][0] += count
+
+        moved = db.execute(
+            select(
+                application.job_opening_id, job.company_id,
+                func.date(func.coalesce(application.updated_at, application.created_at)),
+                application.status, func.count()
+            ).join(job, job.id == application.job_opening_id).where(
+                application.status != entities.ApplicationStatus.APPLIED
+            ).group_by(
+                application.job_opening_id, job.company_id,
+                func.date(func.coalesce(application.updated_at, application.created_at)),
+                application.status
+            )
+        ).all()
+        for job_id, company_id, day, status, count in moved:
+            day = _as_date(day)
+            deltas[(job_id, company_id, day, entities.ApplicationStatus.APPLIED)][1] += count
+            deltas[(job_id, company_id, day, status)][0] += count
+
+        try:
+            db.execute(entities.ApplicationFunnelDaily.__table__.delete())
+            rows = [
+                {
+                    "job_opening_id": job_id,
+                    "company_id": company_id,
+                    "day": day,
+                    "status": status,
+                    "entered": entered,
+                    "exited": exited,
+                }
+                for (job_id, company_id, day, status), (entered, exited) in deltas.items()
+            ]
+            if rows:
+                db.execute(entities.ApplicationFunnelDaily.__table__.insert(), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        self.logger.info(f"Rebuilt application funnel rollup: {len(rows)} rows")
+        return len(rows)
+
+    def _filtered(self, query, company_id: Optional[int], job_opening_id: Optional[int]):
+        rollup = entities.ApplicationFunnelDaily
+        if company_id is not None:
+            query = query.where(rollup.company_id == company_id)
+        if job_opening_id is not None:
+            query = query.where(rollup.job_opening_id == job_opening_id)
+        return query
+
+    def get_funnel(
+        self,
+        db: Session,
+        company_id: Optional[int] = None,
+        job_opening_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> schemas.Funnel:
+        """Applications per status as of date_to, and stage entries within the range"""
+        rollup = entities.ApplicationFunnelDaily
+        in_range = rollup.entered
+        if date_from is not None:
+            in_range = case((rollup.day >= date_from, rollup.entered), else_=0)
+        query = select(
+            rollup.status,
+            func.sum(rollup.entered - rollup.exited),
+            func.sum(in_range)
+        ).group_by(rollup.status)
+        if date_to is not None:
+            query = query.where(rollup.day <= date_to)
+        totals = {
+            status: (current or 0, entered or 0)
+            for status, current, entered in db.execute(
+                self._filtered(query, company_id, job_opening_id)
+            ).all()
+        }
+
+        stages = []
+        previous = None
+        for status in entities.ApplicationStatus:
+            current, entered = totals.get(status, (0, 0))
+            conversion_rate = None
+            if status in FUNNEL_STAGES and previous is not None:
+                conversion_rate = round(entered / previous, 4) if previous else None
+            if status in FUNNEL_STAGES:
+                previous = entered
+            stages.append(schemas.FunnelStage(
+                status=status, current=current, entered=entered, conversion_rate=conversion_rate
+            ))
+        return schemas.Funnel(
+            company_id=company_id,
+            job_opening_id=job_opening_id,
+            date_from=date_from,
+            date_to=date_to,
+            stages=stages
+        )
+
+    def get_daily(
+        self,
+        db: Session,
+        company_id: Optional[int] = None,
+        job_opening_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> List[schemas.FunnelDay]:
+        """Entries into and exits from each status per day"""
+        rollup = entities.ApplicationFunnelDaily
+        query = select(
+            rollup.day, rollup.status, func.sum(rollup.entered), func.sum(rollup.exited)
+        ).group_by(rollup.day, rollup.status).order_by(rollup.day, rollup.status)
+        if date_from is not None:
+            query = query.where(rollup.day >= date_from)
+        if date_to is not None:
+            query = query.where(rollup.day <= date_to)
+        return [
+            schemas.FunnelDay(day=day, status=status, entered=entered, exited=exited)
+            for day, status, entered, exited in db.execute(
+                self._filtered(query, company_id, job_opening_id)
+            ).all()
+        ]
+
+def _as_date(value) -> date:
+    # SQLite's date() returns text
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+funnel_service = FunnelService()
\ No newline at end of file
@@ -1,16 +1,41 @@
-from sqlalchemy.orm import Session
+from collections import defaultdict
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from src.models import entities, schemas
+from src.models.base_entity import to_utc_naive, utc_now
+from src.services.application_service import ApplicationService
 from src.services.base_service import BaseService
 from src.services.email_service import EmailService
+from src.services.funnel_service import StatusTransition
+from src.services.scheduling_service import SchedulingService
+from src.services.status_history_service import record_status_transitions
 from typing import List, Optional
-from datetime import datetime, UTC
 from fastapi import HTTPException
 
 class InterviewProcessService(BaseService[entities.InterviewProcess]):
+    # schemas.InterviewStep nests template_step; the notification emails also
+    # walk process -> application -> candidate / job_opening -> company
+    step_load_options = (
+        joinedload(entities.InterviewStep.template_step),
+        joinedload(entities.InterviewStep.process)
+        .joinedload(entities.InterviewProcess.application)
+        .joinedload(entities.Application.candidate),
+        joinedload(entities.InterviewStep.process)
+        .joinedload(entities.InterviewProcess.application)
+        .joinedload(entities.Application.job_opening)
+        .joinedload(entities.JobOpening.company),
+        joinedload(entities.InterviewStep.process)
+        .joinedload(entities.InterviewProcess.template)
+        .selectinload(entities.InterviewTemplate.steps),
+    )
+
     def __init__(self):
         super().__init__(entities.InterviewProcess)
         self.logger = self.logger.bind(service="InterviewProcessService")
         self.email_service = EmailService()
+        self.application_service = ApplicationService()
+        self.scheduling_service = SchedulingService()
 
     def start_interview_process(
         self,
@@ -55,61 +80,217 @@ class InterviewProcessService(BaseService[entities.InterviewProcess]):
         db.commit()
         db.refresh(process)
 
-        # Update application status
+        # Update application status and notify the candidate in the same transaction
         application.status = entities.ApplicationStatus.INTERVIEWING
+        self._queue_process_started_email(db, application)
         db.commit()
 
-        # Send email notification to candidate
-        self._send_process_started_email(application)
-
         return process
 
-    async def update_interview_step(
+    def start_interview_processes(
         self,
         db: Session,
+        batch: schemas.InterviewProcessBatchStart,
+        current_user: entities.User
+    ) -> schemas.InterviewProcessBatchResult:
+        """
+        Start interview processes for many applications in one transaction.
+
+        Templates are read once for the whole batch; processes, steps and
+        the move to INTERVIEWING are each written with one statement.
+        Applications that already have a process, or whose job opening has
+        no template, are reported and skipped.
+        """
+        application = entities.Application
+        process_table = entities.InterviewProcess.__table__
+        ids = list(dict.fromkeys(batch.application_ids))
+        result = schemas.InterviewProcessBatchResult()
+
+        rows = db.execute(
+            select(
+                application.id, application.status, application.job_opening_id,
+                entities.JobOpening.interview_template_id
+            ).outerjoin(entities.JobOpening, entities.JobOpening.id == application.job_opening_id)
+            .where(application.id.in_(ids))
+        ).all()
+        started = set(db.execute(
+            select(process_table.c.application_id).where(process_table.c.application_id.in_(ids))
+        ).scalars())
+        found = {row.id for row in rows}
+        result.not_found_ids = [id for id in ids if id not in found]
+        result.already_started_ids = sorted(started)
+        result.no_template_ids = sorted(
+            row.id for row in rows if row.id not in started and not row.interview_template_id
+        )
+        eligible = [row for row in rows if row.id not in started and row.interview_template_id]
+        if not eligible:
+            return result
+
+        template_steps = defaultdict(list)
+        for step in db.execute(
+            select(
+                entities.InterviewTemplateStep.id,
+                entities.InterviewTemplateStep.template_id,
+                entities.InterviewTemplateStep.order
+            ).where(entities.InterviewTemplateStep.template_id.in_(
+                {row.interview_template_id for row in eligible}
+            )).order_by(entities.InterviewTemplateStep.template_id, entities.InterviewTemplateStep.order)
+        ):
+            template_steps[step.template_id].append(step)
+
+        now = utc_now()
+        audit = {
+            "created_at": now, "updated_at": now,
+            "created_by_id": current_user.id, "updated_by_id": current_user.id,
+        }
+        self.logger.info(
+            f"Starting {len(eligible)} interview processes by user {current_user.email}"
+        )
+        try:
+            statement = insert(process_table).values([
+                {
+                    "application_id": row.id,
+                    "template_id": row.interview_template_id,
+                    "current_step": 0,
+                    "status": entities.InterviewStepStatus.PENDING,
+                    **audit,
+                }
+                for row in eligible
+            ])
+            if db.get_bind().dialect.full_returning:
+                process_ids = dict(db.execute(
+                    statement.returning(process_table.c.application_id, process_table.c.id)
+                ).all())
+            else:
+                db.execute(statement)
+                process_ids = dict(db.execute(
+                    select(process_table.c.application_id, process_table.c.id)
+                    .where(process_table.c.application_id.in_([row.id for row in eligible]))
+                ).all())
+
+            step_rows = [
+                {
+                    "process_id": process_ids[row.id],
+                    "template_step_id": step.id,
+                    "order": step.order,
+                    "status": entities.InterviewStepStatus.PENDING,
+                    **audit,
+                }
+                for row in eligible
+                for step in template_steps[row.interview_template_id]
+            ]
+            if step_rows:
+                db.execute(insert(entities.InterviewStep.__table__), step_rows)
+
+            moving = [row for row in eligible if row.status != entities.ApplicationStatus.INTERVIEWING]
+            if moving:
+                db.execute(
+                    update(application.__table__)
+                    .where(application.__table__.c.id.in_([row.id for row in moving]))
+                    .values(status=entities.ApplicationStatus.INTERVIEWING, updated_by_id=current_user.id)
+                )
+                # Core UPDATEs don't go through the ORM flush hook
+                record_status_transitions(db, [
+                    StatusTransition(
+                        row.job_opening_id, row.status, entities.ApplicationStatus.INTERVIEWING,
+                        row.id, current_user.id
+                    )
+                    for row in moving
+                ])
+            if batch.notify and eligible:
+                result.notifications_queued = self.application_service.queue_candidate_notifications(
+                    db, [row.id for row in eligible], "interview_process_started"
+                )
+            db.commit()
+        except Exception as e:
+            self.logger.error(f"Error starting interview processes: {str(e)}")
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+        result.started = [
+            schemas.InterviewProcessStarted(
+                application_id=row.id,
+                process_id=process_ids[row.id],
+                step_count=len(template_steps[row.interview_template_id])
+            )
+            for row in sorted(eligible, key=lambda row: row.id)
+        ]
+        return result
+
+    async def update_interview_step(
+        self,
+        db: AsyncSession,
         step_id: int,
         update: schemas.InterviewStepUpdate,
         current_user: entities.User
     ) -> entities.InterviewStep:
-        step = db.query(entities.InterviewStep).get(step_id)
+        step = await self._get_step(db, step_id)
         if not step:
             raise HTTPException(status_code=404, detail="Interview step not found")
 
-        # Update step
         update_data = update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(step, key, value)
+        if "scheduled_at" in update_data:
+            update_data["scheduled_at"] = to_utc_naive(update_data["scheduled_at"])
 
-        # If status is being updated to completed, set completed_at
-        if update.status == entities.InterviewStepStatus.COMPLETED:
-            step.completed_at = datetime.now(UTC)
+        # Reject double bookings before writing anything
+        previous_booking = None
+        rescheduled = bool(update_data.keys() & {"scheduled_at", "interviewer_id", "status"})
+        if rescheduled:
+            previous_booking = await self.scheduling_service.reserve(
+                db, step,
+                update_data.get("interviewer_id", step.interviewer_id),
+                update_data.get("scheduled_at", step.scheduled_at),
+                update_data.get("status", step.status)
+            )
 
-        db.commit()
-        db.refresh(step)
+        # Anything failing past the reservation must hand the slot back
+        try:
+            for key, value in update_data.items():
+                setattr(step, key, value)
+
+            # If status is being updated to completed, set completed_at
+            if update.status == entities.InterviewStepStatus.COMPLETED:
+                step.completed_at = utc_now()
 
-        # Send email notifications
-        if update.status == entities.InterviewStepStatus.SCHEDULED:
-            await self._send_interview_scheduled_email(step)
-        elif update.status in [entities.InterviewStepStatus.PASSED, entities.InterviewStepStatus.FAILED]:
-            await self._send_interview_result_email(step)
+            # Notifications go to the outbox in the same transaction
+            if update.status == entities.InterviewStepStatus.SCHEDULED:
+                self._queue_interview_scheduled_email(db, step)
+            elif update.status in [entities.InterviewStepStatus.PASSED, entities.InterviewStepStatus.FAILED]:
+                self._queue_interview_result_email(db, step)
 
-        return step
+            await db.commit()
+        except Exception:
+            if rescheduled:
+                self.scheduling_service.schedule.restore(step_id, previous_booking)
+            raise
+        # Reload with the step profile: nothing can be lazy-loaded under
+        # asyncio, and the response walks the whole graph
+        return await self._get_step(db, step_id)
+
+    async def _get_step(self, db: AsyncSession, step_id: int) -> Optional[entities.InterviewStep]:
+        result = await db.execute(
+            select(entities.InterviewStep)
+            .options(*self.step_load_options)
+            .filter(entities.InterviewStep.id == step_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().unique().first()
 
-    async def _send_process_started_email(self, application: entities.Application):
+    def _queue_process_started_email(self, db: Session, application: entities.Application):
         data = {
             "candidate_name": f"{application.candidate.first_name} {application.candidate.last_name}",
             "job_title": application.job_opening.title,
             "company_name": application.job_opening.company.name
         }
-        await self.email_service.send_email(
-            db=None,
+        self.email_service.enqueue(
+            db,
             to_email=application.candidate.email,
             template_type="interview_process_started",
             template_data=data,
             template_name=None
         )
 
-    async def _send_interview_scheduled_email(self, step: entities.InterviewStep):
+    def _queue_interview_scheduled_email(self, db: AsyncSession, step: entities.InterviewStep):
         data = {
             "candidate_name": f"{step.process.application.candidate.first_name}",
             "interview_type": step.template_step.name,
@@ -118,15 +299,15 @@ class InterviewProcessService(BaseService[entities.InterviewProcess]):
             "location": step.location or "Remote",
             "meeting_link": step.meeting_link
         }
-        await self.email_service.send_email(
-            db=None,
+        self.email_service.enqueue(
+            db,
             to_email=step.process.application.candidate.email,
             template_type="interview_scheduled",
             template_data=data,
             template_name=None
         )
 
-    async def _send_interview_result_email(self, step: entities.InterviewStep):
+    def _queue_interview_result_email(self, db: AsyncSession, step: entities.InterviewStep):
         is_success = step.status == entities.InterviewStepStatus.PASSED
         
         # Determine template type based on result
@@ -144,8 +325,8 @@ class InterviewProcessService(BaseService[entities.InterviewProcess]):
             "is_final_step": is_final_step
         }
 
-        await self.email_service.send_email(
-            db=None,
+        self.email_service.enqueue(
+            db,
             to_email=step.process.application.candidate.email,
             template_type=template_type,
             template_data=data,
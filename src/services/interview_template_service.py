@@ -1,10 +1,14 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from src.models import entities, schemas
 from src.services.base_service import BaseService
-from typing import List, Optional
+from src.core.pagination import Page
+from typing import Optional
 import json
 
 class InterviewTemplateService(BaseService[entities.InterviewTemplate]):
+    # schemas.InterviewTemplate nests its steps; one extra IN query per page
+    load_options = (selectinload(entities.InterviewTemplate.steps),)
+
     def __init__(self):
         super().__init__(entities.InterviewTemplate)
         self.logger = self.logger.bind(service="InterviewTemplateService")
@@ -41,6 +45,8 @@ class InterviewTemplateService(BaseService[entities.InterviewTemplate]):
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[entities.InterviewTemplate]:
-        return self.get_all(db, skip=skip, limit=limit, is_active=True) 
\ No newline at end of file
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[entities.InterviewTemplate]:
+        return self.get_page(db, skip=skip, limit=limit, cursor=cursor, include_total=include_total, is_active=True) 
\ No newline at end of file
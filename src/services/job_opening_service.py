@@ -1,10 +1,15 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from src.models import entities, schemas
 from src.services.base_service import BaseService
-from typing import List, Optional
+from src.services.job_search_service import job_index
+from src.core.pagination import Page
+from typing import Optional
 
 class JobOpeningService(BaseService[entities.JobOpening]):
+    # schemas.JobOpening nests company
+    load_options = (joinedload(entities.JobOpening.company),)
+
     def __init__(self):
         super().__init__(entities.JobOpening)
 
@@ -14,14 +19,16 @@ class JobOpeningService(BaseService[entities.JobOpening]):
         skip: int = 0,
         limit: int = 100,
         company_id: Optional[int] = None,
-        status: Optional[entities.JobStatus] = None
-    ) -> List[entities.JobOpening]:
+        status: Optional[entities.JobStatus] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[entities.JobOpening]:
         filters = {}
         if company_id:
             filters['company_id'] = company_id
         if status:
             filters['status'] = status
-        return self.get_all(db, skip=skip, limit=limit, **filters)
+        return self.get_page(db, skip=skip, limit=limit, cursor=cursor, include_total=include_total, **filters)
 
     def get_job_opening(self, db: Session, job_id: int) -> Optional[entities.JobOpening]:
         return self.get_by_id(db, job_id)
@@ -40,4 +47,19 @@ class JobOpeningService(BaseService[entities.JobOpening]):
             raise ValueError("Company not found")
 
         job_data = job.model_dump()
-        return self.create(db, job_data, current_user) 
\ No newline at end of file
+        db_job = self.create(db, job_data, current_user)
+        # Searchable right away in this process; others pick it up on refresh
+        job_index.upsert(db_job)
+        return db_job
+
+    def update_job_opening(
+        self,
+        db: Session,
+        job_id: int,
+        job: schemas.JobOpeningBase,
+        current_user: entities.User
+    ) -> Optional[entities.JobOpening]:
+        db_job = self.update(db, job_id, job.model_dump(), current_user)
+        if db_job is not None:
+            job_index.upsert(db_job)
+        return db_job
\ No newline at end of file
@@ -0,0 +1,245 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+from src.models import entities
+from src.services.watermark_poller import WatermarkPoller
+
+# Facets reported by the search endpoint, in response order
+FACETS = ("location", "job_type", "experience_level", "company", "status")
+
+_TOKEN = re.compile(r"\w+")
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN.findall(text.lower()) if text else []
+
+@dataclass
+class JobDocument:
+    id: int
+    facets: Dict[str, str]
+    title_tokens: Set[str]
+    tokens: Set[str]
+
+@dataclass
+class JobSearchHits:
+    ids: List[int]
+    total: int
+    # facet -> [(value, count)], most common first
+    facets: Dict[str, List[tuple]] = field(default_factory=dict)
+
+class JobFacetIndex(WatermarkPoller):
+    """
+    In-process inverted index and facet postings over job openings.
+
+    Keyword search intersects token postings (the last word also matches as
+    a prefix, for search-as-you-type). Facet counts are taken over the jobs
+    matching the keywords and every *other* facet filter, so each facet
+    shows what selecting one of its values would return.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._documents: Dict[int, JobDocument] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._title_postings: Dict[str, Set[int]] = {}
+        self._facet_postings: Dict[str, Dict[str, Set[int]]] = {name: {} for name in FACETS}
+        self._company_names: Dict[str, str] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def refresh(self, db: Session, force: bool = False) -> int:
+        """Index jobs changed since the last refresh and drop deleted ones"""
+        if not self.refresh_due(force):
+            return 0
+        with self._lock:
+            # Compare ids rather than counts: a delete and a create in the
+            # same interval leave the count unchanged
+            ids = set(db.execute(select(entities.JobOpening.id)).scalars())
+            for job_id in set(self._documents) - ids:
+                self._remove(job_id)
+            query = db.query(entities.JobOpening).options(joinedload(entities.JobOpening.company))
+            since = self.changed_since()
+            if since is not None:
+                query = query.filter(entities.JobOpening.updated_at >= since)
+            jobs = query.all()
+            for job in jobs:
+                self._upsert(job)
+                self.advance_watermark(job.updated_at)
+            self.mark_refreshed()
+            return len(jobs)
+
+    def upsert(self, job: entities.JobOpening) -> None:
+        with self._lock:
+            self._upsert(job)
+
+    def remove(self, job_ids: Iterable[int]) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                self._remove(job_id)
+
+    def _upsert(self, job: entities.JobOpening) -> None:
+        self._remove(job.id)
+        company = job.company
+        facets = {
+            "location": job.location,
+            "job_type": job.job_type,
+            "experience_level": job.experience_level,
+            "company": str(job.company_id) if job.company_id is not None else None,
+            "status": job.status.value if job.status else None,
+        }
+        facets = {name: value for name, value in facets.items() if value}
+        if company is not None:
+            self._company_names[str(company.id)] = company.name
+        title_tokens = set(tokenize(job.title))
+        tokens = title_tokens | set(tokenize(" ".join(filter(None, [
+            job.description, job.requirements, company.name if company else None
+        ]))))
+        document = JobDocument(job.id, facets, title_tokens, tokens)
+        self._documents[job.id] = document
+        for token in tokens:
+            if token not in self._postings:
+                self._postings[token] = set()
+                self._sorted_tokens = None
+            self._postings[token].add(job.id)
+        for token in title_tokens:
+            self._title_postings.setdefault(token, set()).add(job.id)
+        for name, value in facets.items():
+            self._facet_postings[name].setdefault(value, set()).add(job.id)
+
+    def _remove(self, job_id: int) -> None:
+        document = self._documents.pop(job_id, None)
+        if document is None:
+            return
+        for token in document.tokens:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(job_id)
+                if not postings:
+                    del self._postings[token]
+                    self._sorted_tokens = None
+        for token in document.title_tokens:
+            postings = self._title_postings.get(token)
+            if postings is not None:
+                postings.discard(job_id)
+                if not postings:
+                    del self._title_postings[token]
+        for name, value in document.facets.items():
+            postings = self._facet_postings[name].get(value)
+            if postings is not None:
+                postings.discard(job_id)
+                if not postings:
+                    del self._facet_postings[name][value]
+
+    def _expand(self, word: str, prefix: bool) -> List[str]:
+        """The indexed tokens a query word stands for"""
+        if not prefix:
+            return [word] if word in self._postings else []
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        tokens = self._sorted_tokens
+        expanded = []
+        i = bisect_left(tokens, word)
+        while i < len(tokens) and tokens[i].startswith(word):
+            expanded.append(tokens[i])
+            i += 1
+        return expanded
+
+    @staticmethod
+    def _union(postings: Dict[str, Set[int]], tokens: List[str]) -> Set[int]:
+        if len(tokens) == 1:
+            return postings.get(tokens[0], set())
+        return set().union(*(postings.get(token, ()) for token in tokens))
+
+    def company_name(self, company_id: str) -> Optional[str]:
+        return self._company_names.get(company_id)
+
+    def search(
+        self,
+        q: Optional[str] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> JobSearchHits:
+        filters = {name: set(values) for name, values in (filters or {}).items() if values}
+        words = tokenize(q)
+        with self._lock:
+            # Search-as-you-type: the word still being typed matches as a prefix
+            expanded = [
+                self._expand(word, i == len(words) - 1 and not (q or "").endswith(" "))
+                for i, word in enumerate(words)
+            ]
+            if expanded:
+                postings = sorted((self._union(self._postings, t) for t in expanded), key=len)
+                matched = postings[0].intersection(*postings[1:])
+            else:
+                matched = set(self._documents)
+
+            selected = {
+                name: set().union(*(self._facet_postings[name].get(v, ()) for v in values))
+                for name, values in filters.items()
+            }
+            hits = matched.intersection(*selected.values()) if selected else matched
+
+            facets = {}
+            for name in FACETS:
+                others = [ids for other, ids in selected.items() if other != name]
+                base = matched.intersection(*others) if others else matched
+                counts = [
+                    (value, len(postings & base))
+                    for value, postings in self._facet_postings[name].items()
+                ]
+                facets[name] = sorted(
+                    ((value, count) for value, count in counts if count),
+                    key=lambda item: (-item[1], item[0])
+                )
+
+            # Jobs with more query words in the title first, newest first within a tier
+            title_hits = Counter()
+            for tokens in expanded:
+                title_hits.update(self._union(self._title_postings, tokens) & hits)
+            wanted = skip + limit
+            ordered = heapq.nsmallest(wanted, title_hits, key=lambda job_id: (-title_hits[job_id], -job_id))
+            if len(ordered) < wanted:
+                rest = hits.difference(title_hits) if title_hits else hits
+                ordered += heapq.nlargest(wanted - len(ordered), rest)
+        return JobSearchHits(ids=ordered[skip:skip + limit], total=len(hits), facets=facets)
+
+# Shared by every request in the process
+job_index = JobFacetIndex()
+
+class JobSearchService:
+    def __init__(self, index: JobFacetIndex = job_index):
+        self.index = index
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def search_jobs(
+        self,
+        db: Session,
+        q: Optional[str] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> tuple:
+        """Page of matching jobs (best first), the match count and facet counts"""
+        self.index.refresh(db)
+        hits = self.index.search(q, filters, skip, limit)
+        jobs = {
+            job.id: job
+            for job in db.query(entities.JobOpening).options(
+                joinedload(entities.JobOpening.company)
+            ).filter(entities.JobOpening.id.in_(hits.ids))
+        }
+        missing = [job_id for job_id in hits.ids if job_id not in jobs]
+        if missing:
+            self.index.remove(missing)
+        return [jobs[job_id] for job_id in hits.ids if job_id in jobs], hits.total, hits.facets
\ No newline at end of file
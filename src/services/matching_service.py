@@ -0,0 +1,297 @@
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from loguru import logger
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from src.models import entities
+from src.services.watermark_poller import WatermarkPoller
+
+# Weights of the three partial scores in the final match score
+SKILL_WEIGHT = 0.6
+EXPERIENCE_WEIGHT = 0.25
+LOCATION_WEIGHT = 0.15
+
+# Years expected for JobOpening.experience_level when requirements don't say
+EXPERIENCE_LEVEL_YEARS = {
+    "intern": 0, "entry": 0, "junior": 1, "mid": 3, "mid-level": 3,
+    "senior": 5, "lead": 7, "staff": 8, "principal": 10,
+}
+
+_SKILL_SEPARATORS = re.compile(r"[,;/|\n]+")
+_REQUIREMENT_TOKEN = re.compile(r"[a-z0-9][\w.+#-]*")
+_REQUIRED_YEARS = re.compile(r"(\d+)\s*\+?\s*(?:years|yrs)")
+# Longest multi-word skill looked up in requirements text
+_MAX_SKILL_WORDS = 3
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(skill.lower().split()).strip(".")
+
+def split_skills(skills: Optional[str]) -> List[str]:
+    if not skills:
+        return []
+    return list(dict.fromkeys(
+        normalize_skill(skill) for skill in _SKILL_SEPARATORS.split(skills) if skill.strip()
+    ))
+
+def split_location(location: Optional[str]) -> tuple:
+    """("san francisco, ca", "ca") - the full place and its last component"""
+    if not location or not location.strip():
+        return None, None
+    parts = [" ".join(part.lower().split()) for part in location.split(",") if part.strip()]
+    return ", ".join(parts), parts[-1]
+
+@dataclass
+class MatchScore:
+    candidate_id: int
+    score: float
+    skill_score: float
+    experience_score: float
+    location_score: float
+
+class CandidateFeatureIndex(WatermarkPoller):
+    """
+    In-memory feature matrix of every candidate, scored with NumPy.
+
+    Skills are stored sparsely as a padded matrix of skill ids (0 = empty
+    slot), one row per candidate, so scoring a job is a single gather of
+    per-skill weights plus a row sum. Rows are updated in place: refresh()
+    only re-reads candidates created or changed since the last refresh.
+    """
+
+    def __init__(self, initial_capacity: int = 1024, skill_slots: int = 8):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._skill_ids: Dict[str, int] = {}
+        self._place_ids: Dict[str, int] = {}
+        self._row_of: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        self.size = 0
+        self.ids = np.zeros(initial_capacity, dtype=np.int64)
+        self.active = np.zeros(initial_capacity, dtype=bool)
+        self.skills = np.zeros((initial_capacity, skill_slots), dtype=np.int32)
+        self.years = np.zeros(initial_capacity, dtype=np.float32)
+        self.places = np.zeros(initial_capacity, dtype=np.int32)
+        self.regions = np.zeros(initial_capacity, dtype=np.int32)
+        self._max_id = 0
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def skill_id(self, skill: str, create: bool = False) -> int:
+        skill_id = self._skill_ids.get(skill, 0)
+        if not skill_id and create:
+            skill_id = self._skill_ids[skill] = len(self._skill_ids) + 1
+        return skill_id
+
+    def place_id(self, place: Optional[str], create: bool = False) -> int:
+        if place is None:
+            return 0
+        place_id = self._place_ids.get(place, 0)
+        if not place_id and create:
+            place_id = self._place_ids[place] = len(self._place_ids) + 1
+        return place_id
+
+    def refresh(self, db: Session, force: bool = False) -> int:
+        """Load candidates created or updated since the last refresh; returns how many"""
+        if not self.refresh_due(force):
+            return 0
+        table = entities.Candidate.__table__
+        query = select(
+            table.c.id, table.c.skills, table.c.experience_years,
+            table.c.location, table.c.created_at, table.c.updated_at
+        )
+        with self._lock:
+            since = self.changed_since()
+            if since is not None:
+                # Re-reading a row is harmless: upserts are idempotent
+                query = query.where(or_(
+                    table.c.id > self._max_id,
+                    table.c.created_at >= since,
+                    table.c.updated_at >= since
+                ))
+            count = 0
+            result = db.execute(query.execution_options(stream_results=True))
+            for rows in result.partitions(10000):
+                for row in rows:
+                    self._upsert(row.id, row.skills, row.experience_years, row.location)
+                    self.advance_watermark(row.updated_at or row.created_at)
+                    self._max_id = max(self._max_id, row.id)
+                count += len(rows)
+            self.mark_refreshed()
+            if count:
+                self.logger.debug(f"Refreshed {count} candidate feature rows")
+            return count
+
+    def upsert(self, candidate: entities.Candidate) -> None:
+        with self._lock:
+            self._upsert(candidate.id, candidate.skills, candidate.experience_years, candidate.location)
+
+    def remove(self, candidate_ids: Iterable[int]) -> None:
+        with self._lock:
+            for candidate_id in candidate_ids:
+                row = self._row_of.pop(candidate_id, None)
+                if row is not None:
+                    self.active[row] = False
+                    self._free_rows.append(row)
+
+    def _upsert(self, candidate_id: int, skills: Optional[str], years, location: Optional[str]) -> None:
+        row = self._row_of.get(candidate_id)
+        if row is None:
+            row = self._free_rows.pop() if self._free_rows else self._append_row()
+            self._row_of[candidate_id] = row
+        skill_ids = [self.skill_id(skill, create=True) for skill in split_skills(skills)]
+        if len(skill_ids) > self.skills.shape[1]:
+            self._widen(len(skill_ids))
+        self.skills[row] = 0
+        self.skills[row, :len(skill_ids)] = skill_ids
+        self.ids[row] = candidate_id
+        self.active[row] = True
+        self.years[row] = years if years is not None else np.nan
+        place, region = split_location(location)
+        self.places[row] = self.place_id(place, create=True)
+        self.regions[row] = self.place_id(region, create=True)
+
+    def _append_row(self) -> int:
+        if self.size == len(self.ids):
+            capacity = len(self.ids) * 2
+            for name in ("ids", "active", "years", "places", "regions"):
+                array = getattr(self, name)
+                grown = np.zeros(capacity, dtype=array.dtype)
+                grown[:len(array)] = array
+                setattr(self, name, grown)
+            grown = np.zeros((capacity, self.skills.shape[1]), dtype=self.skills.dtype)
+            grown[:len(self.skills)] = self.skills
+            self.skills = grown
+        self.size += 1
+        return self.size - 1
+
+    def _widen(self, slots: int) -> None:
+        grown = np.zeros((len(self.skills), max(slots, self.skills.shape[1] * 2)), dtype=self.skills.dtype)
+        grown[:, :self.skills.shape[1]] = self.skills
+        self.skills = grown
+
+    def extract_skills(self, text: Optional[str]) -> List[int]:
+        """Ids of known skills mentioned in free text, including multi-word ones"""
+        if not text:
+            return []
+        tokens = [token.rstrip(".") for token in _REQUIREMENT_TOKEN.findall(text.lower())]
+        found = {}
+        for length in range(1, _MAX_SKILL_WORDS + 1):
+            for start in range(len(tokens) - length + 1):
+                skill_id = self.skill_id(" ".join(tokens[start:start + length]))
+                if skill_id:
+                    found[skill_id] = None
+        return list(found)
+
+    def score(
+        self,
+        skill_ids: Sequence[int],
+        required_years: float,
+        location: Optional[str]
+    ) -> tuple:
+        """Partial and total scores for every row (inactive rows score -1)"""
+        with self._lock:
+            n = self.size
+            skills = self.skills[:n]
+            active = self.active[:n]
+            years = self.years[:n]
+            places = self.places[:n]
+            regions = self.regions[:n]
+            ids = self.ids[:n].copy()
+
+            if skill_ids:
+                # Gather a weight per skill slot; slot id 0 (empty) weighs 0
+                weights = np.zeros(len(self._skill_ids) + 1, dtype=np.float32)
+                weights[list(skill_ids)] = 1.0 / len(skill_ids)
+                skill_score = weights[skills].sum(axis=1)
+            else:
+                skill_score = np.zeros(n, dtype=np.float32)
+
+            if required_years > 0:
+                experience_score = np.nan_to_num(np.clip(years / required_years, 0.0, 1.0))
+            else:
+                experience_score = np.where(np.isnan(years), 0.5, 1.0).astype(np.float32)
+
+            place, region = split_location(location)
+            if place is None or "remote" in place:
+                location_score = np.ones(n, dtype=np.float32)
+            else:
+                place_id, region_id = self.place_id(place), self.place_id(region)
+                location_score = np.where(
+                    (places == place_id) & (place_id > 0), 1.0,
+                    np.where((regions == region_id) & (region_id > 0), 0.5, 0.0)
+                ).astype(np.float32)
+
+            total = (
+                SKILL_WEIGHT * skill_score
+                + EXPERIENCE_WEIGHT * experience_score
+                + LOCATION_WEIGHT * location_score
+            )
+            total = np.where(active, total, -1.0)
+            return ids, total, skill_score, experience_score, location_score
+
+    def top_k(self, skill_ids: Sequence[int], required_years: float, location: Optional[str], k: int) -> List[MatchScore]:
+        ids, total, skill_score, experience_score, location_score = self.score(
+            skill_ids, required_years, location
+        )
+        k = min(k, int((total >= 0).sum()))
+        if k <= 0:
+            return []
+        # O(n) selection of the k best, then sort just those
+        best = np.argpartition(-total, k - 1)[:k]
+        best = best[np.lexsort((ids[best], -total[best]))]
+        return [
+            MatchScore(
+                candidate_id=int(ids[i]),
+                score=round(float(total[i]), 4),
+                skill_score=round(float(skill_score[i]), 4),
+                experience_score=round(float(experience_score[i]), 4),
+                location_score=round(float(location_score[i]), 4)
+            )
+            for i in best
+        ]
+
+# Shared by every request in the process
+candidate_index = CandidateFeatureIndex()
+
+def required_years(job: entities.JobOpening) -> float:
+    """Years asked for in the requirements text, else implied by experience_level"""
+    match = _REQUIRED_YEARS.search((job.requirements or "").lower())
+    if match:
+        return float(match.group(1))
+    level = (job.experience_level or "").lower()
+    for name, years in EXPERIENCE_LEVEL_YEARS.items():
+        if level.startswith(name):
+            return float(years)
+    return 0.0
+
+class MatchingService:
+    def __init__(self, index: CandidateFeatureIndex = candidate_index):
+        self.index = index
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def match_candidates(self, db: Session, job: entities.JobOpening, limit: int = 20) -> List[tuple]:
+        """Top candidates for a job as (candidate, MatchScore) pairs, best first"""
+        self.index.refresh(db)
+        skill_ids = self.index.extract_skills(" ".join(filter(None, [job.title, job.requirements])))
+        candidates = {}
+        while True:
+            scores = self.index.top_k(skill_ids, required_years(job), job.location, limit)
+            wanted = [score.candidate_id for score in scores if score.candidate_id not in candidates]
+            if wanted:
+                candidates.update(
+                    (candidate.id, candidate)
+                    for candidate in db.query(entities.Candidate).filter(entities.Candidate.id.in_(wanted))
+                )
+            missing = [score.candidate_id for score in scores if score.candidate_id not in candidates]
+            if not missing:
+                break
+            # Deleted since the index last saw them: drop them and rank again
+            self.index.remove(missing)
+        matches = [(candidates[score.candidate_id], score) for score in scores]
+        self.logger.debug(f"Matched {len(matches)} candidates for job {job.id}")
+        return matches
\ No newline at end of file
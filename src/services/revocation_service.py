@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime, UTC
+from typing import Dict, Optional
+from loguru import logger
+from sqlalchemy import and_, delete, exists, or_, select
+from sqlalchemy.orm import Session
+from src.core.bloom import BloomFilter
+from src.core.config import get_settings
+from src.database.routing import PRIMARY_OPTION
+from src.models import entities
+from src.models.base_entity import to_utc_naive, utc_now
+
+class RevocationList:
+    """
+    In-memory view of revoked_tokens for the per-request revocation check.
+
+    A Bloom filter holds "jti:<id>" for revoked tokens and "sub:<email>" for
+    forced sign-outs. A token whose keys aren't in the filter is not
+    revoked, which is nearly every request and costs no query; a hit is
+    confirmed against the table, so a false positive costs one query and
+    never rejects a valid token.
+
+    The filter catches up with rows revoked by other processes by polling
+    the primary, at most once per refresh_interval, for ids above the
+    highest one seen. Ids skipped below it belong to inserts that hadn't
+    committed yet (or rolled back), so the newest max_gaps of them are
+    polled again until they show up or are gap_timeout old. Filters can't
+    forget, so it is rebuilt from the unexpired rows every
+    rebuild_interval, or sooner when it fills up.
+    """
+
+    refresh_interval = 1.0
+    rebuild_interval = 3600.0
+    gap_timeout = 60.0
+    max_gaps = 1000
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.RLock()
+        self._filter = BloomFilter(capacity, error_rate)
+        self._rebuilt_at = float("-inf")
+        self._refreshed_at = float("-inf")
+        self._last_id = 0
+        # Unseen id -> when it was first skipped
+        self._gaps: Dict[int, float] = {}
+        self.metrics: Counter = Counter()
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def refresh(self, db: Session, force: bool = False) -> int:
+        """Add rows revoked since the last refresh; rebuild when due"""
+        now = time.monotonic()
+        if not force and now - self._refreshed_at < self.refresh_interval:
+            return 0
+        table = entities.RevokedToken
+        with self._lock:
+            rebuild = now - self._rebuilt_at >= self.rebuild_interval or self._filter.full
+            self._gaps = {i: seen for i, seen in self._gaps.items() if now - seen < self.gap_timeout}
+            query = select(table.id, table.jti, table.subject).where(table.expires_at >= utc_now())
+            if not rebuild:
+                newer = table.id > self._last_id
+                query = query.where(or_(newer, table.id.in_(self._gaps)) if self._gaps else newer)
+            rows = db.execute(query.order_by(table.id).execution_options(**{PRIMARY_OPTION: True})).all()
+            if rebuild:
+                # Leave room to grow before the next rebuild
+                self._filter = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+                self._rebuilt_at = now
+            for row_id, jti, subject in rows:
+                self._add(jti, subject)
+                self._gaps.pop(row_id, None)
+                if row_id > self._last_id:
+                    skipped = range(max(self._last_id + 1, row_id - self.max_gaps), row_id)
+                    self._gaps.update(dict.fromkeys(skipped, now))
+                    self._last_id = row_id
+            if len(self._gaps) > self.max_gaps:
+                self._gaps = dict(sorted(self._gaps.items())[-self.max_gaps:])
+            self._refreshed_at = now
+            return len(rows)
+
+    def _add(self, jti: Optional[str], subject: Optional[str]) -> None:
+        if jti:
+            self._filter.add(f"jti:{jti}")
+        if subject:
+            self._filter.add(f"sub:{subject}")
+
+    def is_revoked(self, db: Session, claims: dict) -> bool:
+        self.refresh(db)
+        jti, subject = claims.get("jti"), claims.get("sub")
+        with self._lock:
+            maybe = (jti is not None and f"jti:{jti}" in self._filter) or f"sub:{subject}" in self._filter
+        if not maybe:
+            self.metrics["passed"] += 1
+            return False
+
+        table = entities.RevokedToken
+        issued_at = to_utc_naive(datetime.fromtimestamp(claims.get("iat") or 0, UTC))
+        matches = [and_(table.subject == subject, table.revoked_at >= issued_at)]
+        if jti is not None:
+            matches.append(table.jti == jti)
+        # On the primary: a lagging replica could miss the revocation the filter just saw
+        revoked = db.execute(select(exists().where(and_(
+            or_(*matches), table.expires_at >= utc_now()
+        ))).execution_options(**{PRIMARY_OPTION: True})).scalar()
+        self.metrics["revoked" if revoked else "false_positives"] += 1
+        return revoked
+
+    def revoke(
+        self,
+        db: Session,
+        expires_at: datetime,
+        jti: Optional[str] = None,
+        subject: Optional[str] = None
+    ) -> None:
+        """
+        Record a revocation in the caller's transaction, pruning expired
+        rows on the way. This process's filter knows at once; a rollback
+        leaves only a false positive behind.
+        """
+        table = entities.RevokedToken
+        db.execute(delete(table).where(table.expires_at < utc_now()))
+        db.add(table(jti=jti, subject=subject, expires_at=to_utc_naive(expires_at)))
+        with self._lock:
+            self._add(jti, subject)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._filter = BloomFilter(self.capacity, self.error_rate)
+            self._rebuilt_at = float("-inf")
+            self._refreshed_at = float("-inf")
+            self._last_id = 0
+            self._gaps = {}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "filter_items": self._filter.count,
+                "filter_capacity": self._filter.capacity,
+                "filter_bits": self._filter.size,
+                **self.metrics,
+            }
+
+settings = get_settings()
+
+revocation_list = RevocationList(settings.TOKEN_REVOCATION_CAPACITY)
\ No newline at end of file
@@ -0,0 +1,511 @@
+import heapq
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as clock, timedelta, UTC
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from fastapi import HTTPException
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.models import entities, schemas
+from src.models.base_entity import to_utc_naive
+from src.services.watermark_poller import WatermarkPoller
+
+# Used for steps whose template step has no duration
+DEFAULT_DURATION = timedelta(minutes=60)
+
+def step_duration(minutes: Optional[int]) -> timedelta:
+    return timedelta(minutes=minutes) if minutes else DEFAULT_DURATION
+
+def _step_rows():
+    """Columns the schedule is built from, one row per interview step"""
+    step = entities.InterviewStep
+    return select(
+        step.id, step.interviewer_id, step.scheduled_at, step.status, step.updated_at,
+        entities.InterviewTemplateStep.duration_minutes
+    ).outerjoin(entities.InterviewTemplateStep, entities.InterviewTemplateStep.id == step.template_step_id)
+
+@dataclass(frozen=True)
+class Booking:
+    step_id: Optional[int]
+    interviewer_id: int
+    start: datetime
+    end: datetime
+
+@dataclass
+class _Lane:
+    """One interviewer's bookings, sorted by start"""
+    starts: List[datetime] = field(default_factory=list)
+    bookings: List[Booking] = field(default_factory=list)
+    # Upper bound on booking length, so overlap lookups can bound their scan
+    longest: timedelta = timedelta(0)
+
+class InterviewerSchedule(WatermarkPoller):
+    """
+    In-process interval index of interviewer bookings.
+
+    Each interviewer's bookings are kept sorted by start. A booking that
+    overlaps [start, end) must start before end and no earlier than
+    start minus the interviewer's longest booking, so a conflict check is
+    two binary searches plus a scan of that window - O(log n) for any
+    realistic calendar, and still correct if old data holds overlaps.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._lanes: Dict[int, _Lane] = {}
+        self._by_step: Dict[int, Booking] = {}
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def __len__(self) -> int:
+        return len(self._by_step)
+
+    def changes(self, force: bool = False):
+        """SELECT of steps changed since the last refresh, or None if one ran just now"""
+        if not self.refresh_due(force):
+            return None
+        query = _step_rows()
+        since = self.changed_since()
+        if since is not None:
+            query = query.where(entities.InterviewStep.updated_at >= since)
+        return query
+
+    def apply_changes(self, rows: Sequence) -> int:
+        """Load the rows returned by changes() and advance the watermark"""
+        with self._lock:
+            self.load(rows)
+            for row in rows:
+                self.advance_watermark(row.updated_at)
+            self.mark_refreshed()
+        if rows:
+            self.logger.debug(f"Refreshed {len(rows)} interview step bookings")
+        return len(rows)
+
+    def load(self, rows: Iterable) -> None:
+        """Book or release each step row according to its current state"""
+        with self._lock:
+            for row in rows:
+                self._release(row.id)
+                if row.interviewer_id and row.scheduled_at and row.status != entities.InterviewStepStatus.CANCELLED:
+                    self._book(Booking(
+                        row.id, row.interviewer_id, row.scheduled_at,
+                        row.scheduled_at + step_duration(row.duration_minutes)
+                    ))
+
+    def booking(self, step_id: int) -> Optional[Booking]:
+        return self._by_step.get(step_id)
+
+    def release(self, step_id: int) -> Optional[Booking]:
+        with self._lock:
+            return self._release(step_id)
+
+    def release_missing(self, step_ids: Iterable[int], found: set) -> None:
+        """Drop bookings of steps that were looked up and no longer exist"""
+        with self._lock:
+            for step_id in step_ids:
+                if step_id not in found:
+                    self._release(step_id)
+
+    def restore(self, step_id: int, booking: Optional[Booking]) -> None:
+        """Put back the booking a step had before a failed reservation"""
+        with self._lock:
+            self._release(step_id)
+            if booking is not None:
+                self._book(booking)
+
+    def _book(self, booking: Booking) -> None:
+        lane = self._lanes.setdefault(booking.interviewer_id, _Lane())
+        i = bisect_left(lane.starts, booking.start)
+        lane.starts.insert(i, booking.start)
+        lane.bookings.insert(i, booking)
+        lane.longest = max(lane.longest, booking.end - booking.start)
+        if booking.step_id is not None:
+            self._by_step[booking.step_id] = booking
+
+    def _release(self, step_id: int) -> Optional[Booking]:
+        booking = self._by_step.pop(step_id, None)
+        if booking is None:
+            return None
+        lane = self._lanes[booking.interviewer_id]
+        i = bisect_left(lane.starts, booking.start)
+        while lane.bookings[i] is not booking:
+            i += 1
+        del lane.starts[i]
+        del lane.bookings[i]
+        return booking
+
+    def conflicts(
+        self,
+        interviewer_id: int,
+        start: datetime,
+        end: datetime,
+        exclude: Iterable[int] = ()
+    ) -> List[Booking]:
+        """Bookings of the interviewer overlapping [start, end), earliest first"""
+        with self._lock:
+            lane = self._lanes.get(interviewer_id)
+            if lane is None:
+                return []
+            lo = bisect_left(lane.starts, start - lane.longest)
+            hi = bisect_left(lane.starts, end)
+            exclude = set(exclude)
+            return [
+                booking for booking in lane.bookings[lo:hi]
+                if booking.end > start and booking.step_id not in exclude
+            ]
+
+    def reserve(self, booking: Booking) -> List[Booking]:
+        """Atomically book the step unless it conflicts; returns the conflicts"""
+        with self._lock:
+            conflicts = self.conflicts(
+                booking.interviewer_id, booking.start, booking.end, exclude=[booking.step_id]
+            )
+            if not conflicts:
+                self._release(booking.step_id)
+                self._book(booking)
+            return conflicts
+
+# Shared by every request in the process
+interviewer_schedule = InterviewerSchedule()
+
+def _describe(conflicts: List[Booking]) -> str:
+    return ", ".join(
+        f"step {booking.step_id} ({booking.start.isoformat()} - {booking.end.isoformat()})"
+        for booking in conflicts
+    )
+
+def _align_up(value: datetime, origin: datetime, step: timedelta) -> datetime:
+    """The first origin + n * step at or after value"""
+    if value <= origin:
+        return origin
+    return origin + -((origin - value) // step) * step
+
+def working_windows(
+    date_from: date,
+    date_to: date,
+    day_start: clock,
+    day_end: clock,
+    include_weekends: bool = False
+) -> List[tuple]:
+    """(start, end) of the working hours of each day in the range, in order"""
+    windows = []
+    day = date_from
+    while day <= date_to:
+        if include_weekends or day.weekday() < 5:
+            windows.append((datetime.combine(day, day_start), datetime.combine(day, day_end)))
+        day += timedelta(days=1)
+    return windows
+
+def free_starts(
+    busy: List[Booking],
+    windows: List[tuple],
+    duration: timedelta,
+    granularity: timedelta,
+    not_before: datetime
+) -> Iterator[datetime]:
+    """
+    Lazily yield the slot starts, on the granularity grid of each window,
+    where [start, start + duration) misses every busy interval. busy is
+    sorted by start and may overlap; past a conflict the search jumps
+    straight to the end of the latest overlapping booking.
+    """
+    i = 0
+    for window_start, window_end in windows:
+        t = _align_up(max(window_start, not_before), window_start, granularity)
+        while t + duration <= window_end:
+            while i < len(busy) and busy[i].end <= t:
+                i += 1
+            blocked_until = None
+            j = i
+            while j < len(busy) and busy[j].start < t + duration:
+                if busy[j].end > t and (blocked_until is None or busy[j].end > blocked_until):
+                    blocked_until = busy[j].end
+                j += 1
+            if blocked_until is None:
+                yield t
+                t += granularity
+            else:
+                t = _align_up(blocked_until, window_start, granularity)
+
+class SchedulingService:
+    # Longest date range find_free_slots will search
+    max_slot_search = timedelta(days=31)
+
+    def __init__(self, schedule: InterviewerSchedule = interviewer_schedule):
+        self.schedule = schedule
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def refresh(self, db: Session, force: bool = False) -> int:
+        query = self.schedule.changes(force)
+        if query is None:
+            return 0
+        return self.schedule.apply_changes(db.execute(query).all())
+
+    async def refresh_async(self, db: AsyncSession, force: bool = False) -> int:
+        query = self.schedule.changes(force)
+        if query is None:
+            return 0
+        return self.schedule.apply_changes((await db.execute(query)).all())
+
+    async def reserve(
+        self,
+        db: AsyncSession,
+        step: entities.InterviewStep,
+        interviewer_id: Optional[int],
+        scheduled_at: Optional[datetime],
+        status: Optional[entities.InterviewStepStatus]
+    ) -> Optional[Booking]:
+        """
+        Hold the step's new slot in the schedule, or raise 409 if the
+        interviewer is booked then. Returns the step's previous booking so a
+        failed commit can restore() it. Conflicts found in the index are
+        re-read from the database before rejecting, in case they are stale.
+
+        The index only knows this process's view, so a slot it accepts is
+        confirmed against interview_steps in the caller's transaction,
+        under a lock on the interviewer, before the caller commits.
+        """
+        await self.refresh_async(db)
+        previous = self.schedule.booking(step.id)
+        if not interviewer_id or not scheduled_at or status == entities.InterviewStepStatus.CANCELLED:
+            self.schedule.release(step.id)
+            return previous
+        duration = step.template_step.duration_minutes if step.template_step else None
+        booking = Booking(step.id, interviewer_id, scheduled_at, scheduled_at + step_duration(duration))
+        if booking == previous:
+            return previous
+
+        conflicts = self.schedule.reserve(booking)
+        if conflicts:
+            ids = [conflict.step_id for conflict in conflicts]
+            rows = (await db.execute(_step_rows().where(entities.InterviewStep.id.in_(ids)))).all()
+            self.schedule.load(rows)
+            self.schedule.release_missing(ids, {row.id for row in rows})
+            conflicts = self.schedule.reserve(booking)
+        if not conflicts:
+            conflicts = await self._confirm(db, booking)
+            if conflicts:
+                self.schedule.restore(step.id, previous)
+        if conflicts:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Interviewer {interviewer_id} is already booked: {_describe(conflicts)}"
+            )
+        return previous
+
+    async def _confirm(self, db: AsyncSession, booking: Booking) -> List[Booking]:
+        """
+        Bookings in the database that overlap the booking, read after
+        locking the interviewer's users row (FOR UPDATE; SQLite has no row
+        locks but serialises writers). Concurrent reservations for one
+        interviewer, from any worker process, run this check one at a time,
+        each seeing the steps the others committed.
+        """
+        await db.execute(
+            select(entities.User.id).where(entities.User.id == booking.interviewer_id).with_for_update()
+        )
+        longest_minutes = (await db.execute(
+            select(func.max(entities.InterviewTemplateStep.duration_minutes))
+        )).scalar()
+        longest = max(DEFAULT_DURATION, step_duration(longest_minutes))
+        step = entities.InterviewStep
+        rows = (await db.execute(_step_rows().where(
+            step.interviewer_id == booking.interviewer_id,
+            step.scheduled_at >= booking.start - longest,
+            step.scheduled_at < booking.end,
+            step.id != booking.step_id,
+            step.status.is_distinct_from(entities.InterviewStepStatus.CANCELLED)
+        ))).all()
+        if rows:
+            self.schedule.load(rows)
+        conflicts = []
+        for row in rows:
+            end = row.scheduled_at + step_duration(row.duration_minutes)
+            if end > booking.start:
+                conflicts.append(Booking(row.id, row.interviewer_id, row.scheduled_at, end))
+        return conflicts
+
+    def check_schedule(
+        self,
+        db: Session,
+        proposals: List[schemas.ScheduleProposal]
+    ) -> List[schemas.ScheduleCheckResult]:
+        """
+        Validate many proposed bookings at once, against existing bookings
+        and against each other. Steps being moved by the batch don't
+        conflict with their own current slot.
+        """
+        self.refresh(db)
+        step_ids = [p.step_id for p in proposals if p.step_id is not None]
+        durations = dict(db.execute(
+            select(entities.InterviewStep.id, entities.InterviewTemplateStep.duration_minutes)
+            .join(entities.InterviewTemplateStep, entities.InterviewTemplateStep.id == entities.InterviewStep.template_step_id)
+            .where(entities.InterviewStep.id.in_(step_ids))
+        ).all()) if step_ids else {}
+        missing = sorted(set(step_ids) - set(durations))
+        if missing:
+            raise ValueError(f"Interview steps not found: {missing}")
+
+        bookings = []
+        for proposal in proposals:
+            start = to_utc_naive(proposal.scheduled_at)
+            minutes = proposal.duration_minutes or durations.get(proposal.step_id)
+            bookings.append(Booking(
+                proposal.step_id, proposal.interviewer_id, start, start + step_duration(minutes)
+            ))
+
+        existing = self._existing_conflicts(db, bookings, set(step_ids))
+        within = self._batch_conflicts(bookings)
+        return [
+            schemas.ScheduleCheckResult(
+                index=i,
+                step_id=booking.step_id,
+                interviewer_id=booking.interviewer_id,
+                starts_at=booking.start,
+                ends_at=booking.end,
+                ok=not existing[i] and not within[i],
+                conflicts=[
+                    schemas.ScheduleConflict(step_id=c.step_id, starts_at=c.start, ends_at=c.end)
+                    for c in existing[i]
+                ] + [
+                    schemas.ScheduleConflict(
+                        proposal_index=j, step_id=bookings[j].step_id,
+                        starts_at=bookings[j].start, ends_at=bookings[j].end
+                    )
+                    for j in within[i]
+                ]
+            )
+            for i, booking in enumerate(bookings)
+        ]
+
+    def _existing_conflicts(self, db: Session, bookings: List[Booking], moving: set) -> List[List[Booking]]:
+        def lookup():
+            return [
+                self.schedule.conflicts(b.interviewer_id, b.start, b.end, exclude=moving)
+                for b in bookings
+            ]
+        found = lookup()
+        suspects = sorted({c.step_id for conflicts in found for c in conflicts})
+        if suspects:
+            # Confirm against the database, then look again with fresh rows
+            rows = db.execute(_step_rows().where(entities.InterviewStep.id.in_(suspects))).all()
+            self.schedule.load(rows)
+            self.schedule.release_missing(suspects, {row.id for row in rows})
+            found = lookup()
+        return found
+
+    @staticmethod
+    def _batch_conflicts(bookings: List[Booking]) -> List[List[int]]:
+        """
+        Indexes of the other proposals each proposal overlaps: a sweep per
+        interviewer in start order, with a heap of the bookings still open
+        """
+        within: List[List[int]] = [[] for _ in bookings]
+        lanes: Dict[int, List[int]] = {}
+        for i, booking in enumerate(bookings):
+            lanes.setdefault(booking.interviewer_id, []).append(i)
+        for indexes in lanes.values():
+            indexes.sort(key=lambda i: bookings[i].start)
+            open_ends: List[tuple] = []
+            for i in indexes:
+                while open_ends and open_ends[0][0] <= bookings[i].start:
+                    heapq.heappop(open_ends)
+                for _, j in open_ends:
+                    within[i].append(j)
+                    within[j].append(i)
+                heapq.heappush(open_ends, (bookings[i].end, i))
+        return [sorted(indexes) for indexes in within]
+
+    def interviewers(
+        self,
+        db: Session,
+        step_type: Optional[entities.InterviewStepType] = None,
+        interviewer_ids: Optional[List[int]] = None
+    ) -> List[int]:
+        """
+        Ids of active recruiters and admins who can interview; for a step
+        type, those who have been assigned a step of that type before
+        """
+        user = entities.User
+        query = select(user.id).where(
+            user.is_active.is_(True),
+            user.role.in_([entities.UserRole.RECRUITER, entities.UserRole.ADMIN])
+        )
+        if interviewer_ids:
+            query = query.where(user.id.in_(interviewer_ids))
+        if step_type is not None:
+            step = entities.InterviewStep
+            template_step = entities.InterviewTemplateStep
+            query = query.where(user.id.in_(
+                select(step.interviewer_id)
+                .join(template_step, template_step.id == step.template_step_id)
+                .where(template_step.step_type == step_type)
+            ))
+        return list(db.execute(query.order_by(user.id)).scalars())
+
+    def find_free_slots(
+        self,
+        db: Session,
+        date_from: date,
+        date_to: date,
+        duration_minutes: int = 60,
+        step_type: Optional[entities.InterviewStepType] = None,
+        interviewer_ids: Optional[List[int]] = None,
+        limit: int = 5,
+        day_start: clock = clock(9),
+        day_end: clock = clock(17),
+        granularity_minutes: int = 30,
+        include_weekends: bool = False
+    ) -> List[schemas.FreeSlot]:
+        """
+        The earliest slots in the range where at least one interviewer is
+        free for duration_minutes, with everyone free at each. Each
+        interviewer's free slots are generated lazily from their sorted
+        bookings and the generators are merged with a heap, so the work
+        grows with the interviewers and the slots returned, not with the
+        length of the range.
+        """
+        if date_to < date_from:
+            raise ValueError("date_to must not be before date_from")
+        if date_to - date_from > self.max_slot_search:
+            raise ValueError(f"Slot searches are limited to {self.max_slot_search.days} days")
+        if day_end <= day_start:
+            raise ValueError("day_end must be after day_start")
+
+        self.refresh(db)
+        windows = working_windows(date_from, date_to, day_start, day_end, include_weekends)
+        if not windows:
+            return []
+        duration = timedelta(minutes=duration_minutes)
+        granularity = timedelta(minutes=granularity_minutes)
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        heap = []
+        for interviewer_id in self.interviewers(db, step_type, interviewer_ids):
+            busy = self.schedule.conflicts(interviewer_id, windows[0][0], windows[-1][1])
+            starts = free_starts(busy, windows, duration, granularity, now)
+            first = next(starts, None)
+            if first is not None:
+                heap.append((first, interviewer_id, starts))
+        heapq.heapify(heap)
+
+        slots = []
+        while heap and len(slots) < limit:
+            start = heap[0][0]
+            free = []
+            while heap and heap[0][0] == start:
+                _, interviewer_id, starts = heapq.heappop(heap)
+                free.append((interviewer_id, starts))
+            slots.append(schemas.FreeSlot(
+                starts_at=start,
+                ends_at=start + duration,
+                interviewer_ids=sorted(interviewer_id for interviewer_id, _ in free)
+            ))
+            for interviewer_id, starts in free:
+                following = next(starts, None)
+                if following is not None:
+                    heapq.heappush(heap, (following, interviewer_id, starts))
+        return slots
\ No newline at end of file
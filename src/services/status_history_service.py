@@ -0,0 +1,237 @@
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional
+from loguru import logger
+from sqlalchemy import case, event, extract, func, inspect, select
+from sqlalchemy.orm import Session
+from src.models import entities, schemas
+from src.models.base_entity import utc_now
+from src.services.funnel_service import StatusTransition, funnel_service, job_companies
+
+# Percentiles reported for every duration, as (schema field, fraction)
+PERCENTILES = (("p50_seconds", 0.5), ("p90_seconds", 0.9))
+
+class StatusHistoryService:
+    def __init__(self):
+        self.logger = logger.bind(service=self.__class__.__name__)
+
+    def record(
+        self,
+        db: Session,
+        transitions: Iterable[StatusTransition],
+        companies: Optional[Dict[int, int]] = None
+    ) -> None:
+        """Append one history row per transition inside the caller's transaction"""
+        transitions = [t for t in transitions if t.application_id is not None]
+        if not transitions:
+            return
+        if companies is None:
+            companies = job_companies(db, (t.job_opening_id for t in transitions))
+        now = utc_now()
+        db.execute(entities.ApplicationStatusHistory.__table__.insert(), [
+            {
+                "application_id": t.application_id,
+                "job_opening_id": t.job_opening_id,
+                "company_id": companies.get(t.job_opening_id),
+                "from_status": t.from_status,
+                "to_status": t.to_status,
+                "changed_at": t.changed_at or now,
+                "changed_by_id": t.changed_by_id,
+            }
+            for t in transitions
+        ])
+
+    def backfill(self, db: Session) -> int:
+        """
+        Give applications that predate the history table a starting history;
+        returns the number of rows written.
+
+        Only the current status is known, so each one is recorded as applied
+        on its applied_date and, if it has moved on since, as entering its
+        current status on its last update.
+        """
+        application = entities.Application
+        history = entities.ApplicationStatusHistory
+        rows = db.execute(
+            select(
+                application.id, application.job_opening_id, application.status,
+                application.applied_date, application.created_at, application.updated_at,
+                application.created_by_id, application.updated_by_id
+            ).where(~select(history.id).where(
+                history.application_id == application.id
+            ).exists())
+        ).all()
+        transitions = []
+        for row in rows:
+            applied_at = row.applied_date or row.created_at
+            transitions.append(StatusTransition(
+                row.job_opening_id, None, entities.ApplicationStatus.APPLIED,
+                row.id, row.created_by_id, applied_at
+            ))
+            if row.status != entities.ApplicationStatus.APPLIED:
+                transitions.append(StatusTransition(
+                    row.job_opening_id, entities.ApplicationStatus.APPLIED, row.status,
+                    row.id, row.updated_by_id, max(filter(None, [applied_at, row.updated_at]))
+                ))
+        try:
+            self.record(db, transitions)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        self.logger.info(f"Backfilled status history for {len(rows)} applications")
+        return len(transitions)
+
+    def _seconds_between(self, db: Session, start, end):
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return extract("epoch", end - start)
+        if dialect == "sqlite":
+            return (func.julianday(end) - func.julianday(start)) * 86400.0
+        raise ValueError(f"Time-in-stage reports are not supported on {dialect}")
+
+    def _stays(self, company_id: Optional[int], job_opening_id: Optional[int]):
+        """
+        Every history row with when the application left that status (the
+        next row's changed_at) and when it first entered the pipeline
+        """
+        history = entities.ApplicationStatusHistory
+        window = {
+            "partition_by": history.application_id,
+            "order_by": (history.changed_at, history.id),
+        }
+        query = select(
+            history.application_id,
+            history.to_status,
+            history.changed_at,
+            func.lead(history.changed_at).over(**window).label("left_at"),
+            func.first_value(history.changed_at).over(**window).label("started_at"),
+        )
+        # Every row of an application shares its job, so filtering before
+        # the window keeps each application's history whole
+        if company_id is not None:
+            query = query.where(history.company_id == company_id)
+        if job_opening_id is not None:
+            query = query.where(history.job_opening_id == job_opening_id)
+        return query.subquery("stays")
+
+    def _percentiles(self, durations, group_by=None):
+        """
+        Count, average and nearest-rank percentiles of durations.seconds,
+        optionally per group_by: the smallest duration whose CUME_DIST
+        reaches the fraction. Runs the same on SQLite, which has no
+        percentile_cont.
+        """
+        grouped = [group_by.label("grp")] if group_by is not None else []
+        ranked = select(
+            *grouped,
+            durations.c.seconds,
+            func.cume_dist().over(
+                partition_by=group_by, order_by=durations.c.seconds
+            ).label("cume_dist")
+        ).subquery("ranked")
+        query = select(
+            *([ranked.c.grp] if grouped else []),
+            func.count().label("count"),
+            func.avg(ranked.c.seconds).label("average_seconds"),
+            *(
+                func.min(case((ranked.c.cume_dist >= fraction, ranked.c.seconds))).label(name)
+                for name, fraction in PERCENTILES
+            )
+        )
+        return query.group_by(ranked.c.grp) if grouped else query
+
+    def get_time_in_stage(
+        self,
+        db: Session,
+        company_id: Optional[int] = None,
+        job_opening_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> schemas.TimeInStage:
+        """
+        How long applications stayed in each status before moving on, and
+        how long hires took from application. Stays that haven't ended are
+        not counted; the date range applies to when a stay began (for
+        time-to-hire, to the hire).
+        """
+        stays = self._stays(company_id, job_opening_id)
+        in_range = []
+        if date_from is not None:
+            in_range.append(stays.c.changed_at >= datetime.combine(date_from, time.min))
+        if date_to is not None:
+            in_range.append(stays.c.changed_at < datetime.combine(date_to + timedelta(days=1), time.min))
+
+        completed = select(
+            stays.c.to_status,
+            self._seconds_between(db, stays.c.changed_at, stays.c.left_at).label("seconds")
+        ).where(
+            stays.c.left_at.is_not(None), stays.c.to_status.is_not(None), *in_range
+        ).subquery("durations")
+        by_status = {
+            row.grp: row
+            for row in db.execute(self._percentiles(completed, completed.c.to_status)).all()
+        }
+
+        hires = select(
+            self._seconds_between(db, stays.c.started_at, stays.c.changed_at).label("seconds")
+        ).where(
+            stays.c.to_status == entities.ApplicationStatus.HIRED, *in_range
+        ).subquery("durations")
+        hired = db.execute(self._percentiles(hires)).one()
+
+        return schemas.TimeInStage(
+            company_id=company_id,
+            job_opening_id=job_opening_id,
+            date_from=date_from,
+            date_to=date_to,
+            stages=[
+                schemas.StageDuration(status=status, **_stats(by_status.get(status)))
+                for status in entities.ApplicationStatus
+            ],
+            time_to_hire=schemas.DurationStats(**_stats(hired))
+        )
+
+def _stats(row) -> dict:
+    if row is None or not row.count:
+        return {"count": 0}
+    return {
+        "count": row.count,
+        "average_seconds": round(float(row.average_seconds), 1),
+        **{name: round(float(getattr(row, name)), 1) for name, _ in PERCENTILES},
+    }
+
+status_history_service = StatusHistoryService()
+
+def record_status_transitions(db: Session, transitions: List[StatusTransition]) -> None:
+    """Write transitions to the funnel rollup and the status history"""
+    if not transitions:
+        return
+    companies = job_companies(db, (t.job_opening_id for t in transitions))
+    funnel_service.record(db, transitions, companies=companies)
+    status_history_service.record(db, transitions, companies=companies)
+
+@event.listens_for(Session, "after_flush")
+def record_application_transitions(session: Session, flush_context) -> None:
+    """
+    Record status changes of Application objects flushed by any ORM write
+    (create, update, delete) in the same transaction. Set-based UPDATEs
+    bypass this and call record_status_transitions themselves.
+    """
+    transitions = []
+    for obj in session.new:
+        if isinstance(obj, entities.Application):
+            transitions.append(StatusTransition(
+                obj.job_opening_id, None, obj.status, obj.id, obj.created_by_id, obj.applied_date
+            ))
+    for obj in session.dirty:
+        if isinstance(obj, entities.Application):
+            history = inspect(obj).attrs.status.history
+            if history.added and history.deleted and history.added[0] != history.deleted[0]:
+                transitions.append(StatusTransition(
+                    obj.job_opening_id, history.deleted[0], history.added[0],
+                    obj.id, obj.updated_by_id, obj.updated_at
+                ))
+    for obj in session.deleted:
+        if isinstance(obj, entities.Application):
+            transitions.append(StatusTransition(obj.job_opening_id, obj.status, None, obj.id))
+    record_status_transitions(session, transitions)
\ No newline at end of file
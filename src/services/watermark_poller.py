@@ -0,0 +1,57 @@
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+class WatermarkPoller:
+    """
+    Base for in-process indexes that follow a table by polling it for rows
+    changed since a timestamp watermark.
+
+    Changes committed by transactions that started before the last poll
+    carry older timestamps, so each poll re-reads refresh_overlap of
+    history; re-reading a row must be harmless. A change that commits more
+    than refresh_overlap after its timestamp was stamped (a long
+    transaction, a skewed clock) is still missed, so every
+    reconcile_interval a poll reads everything again. Polls run at most
+    once per refresh_interval, so readers may be that stale. Subclasses
+    call these helpers with their own lock held.
+    """
+
+    refresh_overlap = timedelta(seconds=5)
+    refresh_interval = 1.0
+    reconcile_interval = 300.0
+
+    def __init__(self):
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at = float("-inf")
+        self._reconciled_at = float("-inf")
+        self._reconciling = False
+
+    def refresh_due(self, force: bool = False) -> bool:
+        return force or time.monotonic() - self._refreshed_at >= self.refresh_interval
+
+    def changed_since(self) -> Optional[datetime]:
+        """Lower bound for the next poll's change filter; None means read everything"""
+        if self._watermark is None or time.monotonic() - self._reconciled_at >= self.reconcile_interval:
+            self._reconciling = True
+            return None
+        return self._watermark - self.refresh_overlap
+
+    def advance_watermark(self, changed: Optional[datetime]) -> None:
+        """Move the watermark up to a polled row's change time"""
+        if changed is not None and (self._watermark is None or changed > self._watermark):
+            self._watermark = changed
+
+    def mark_refreshed(self) -> None:
+        """End a poll; after the first, even an empty one, polls only read changes"""
+        if self._watermark is None:
+            self._watermark = datetime.min + self.refresh_overlap
+        self._refreshed_at = time.monotonic()
+        if self._reconciling:
+            self._reconciled_at = self._refreshed_at
+            self._reconciling = False
+
+    def reset_watermark(self) -> None:
+        """Make the next poll read everything, without waiting for the interval"""
+        self._watermark = None
+        self._refreshed_at = float("-inf")
\ No newline at end of file
@@ -1,20 +1,41 @@
+import os
+
+# Tests drive the email outbox worker themselves
+os.environ.setdefault("EMAIL_WORKER_ENABLED", "false")
+
+import itertools
+from contextlib import contextmanager
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from src.database import Base
 from src.database.seed import seed_database
+from src.models import entities
 from fastapi.testclient import TestClient
 from src.main import app
-from src.database import get_db
+from src.database import get_db, get_async_db
+from src.core.pagination import count_cache
+from src.services.auth_service import principal_cache, verified_tokens
+from src.services.revocation_service import revocation_list
+from src.services.email_template_service import active_templates
 
-# Use SQLite in-memory database for testing
+# Use a SQLite file so the sync and async engines see the same data
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# NullPool: every TestClient runs its own event loop, so connections can't be reused
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 @pytest.fixture(scope="session")
 def db_engine():
     Base.metadata.create_all(bind=engine)
@@ -23,9 +44,9 @@ def db_engine():
 
 @pytest.fixture(scope="function")
 def db_session(db_engine):
-    connection = db_engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    # Data is committed so the async engine can read it; tables are emptied
+    # after each test instead of rolling back an outer transaction
+    session = TestingSessionLocal()
     
     # Seed the database
     seed_database(session)
@@ -33,8 +54,14 @@ def db_session(db_engine):
     yield session
     
     session.close()
-    transaction.rollback()
-    connection.close()
+    with db_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    count_cache.clear()
+    active_templates.invalidate()
+    principal_cache.invalidate()
+    verified_tokens.clear()
+    revocation_list.reset()
 
 @pytest.fixture(scope="function")
 def client(db_session):
@@ -43,8 +70,65 @@ def client(db_session):
             yield db_session
         finally:
             db_session.close()
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
             
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
-    app.dependency_overrides.clear() 
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest.fixture(scope="function")
+def auth_headers(client):
+    def login(username, password):
+        response = client.post(
+            "/v1/auth/token",
+            data={"username": username, "password": password}
+        )
+        assert response.status_code == 200
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return login
+
+
+@pytest.fixture(scope="function")
+def add_applications(db_session):
+    """Add count applications from new candidates (applicant<n>@example.com) and commit"""
+    numbers = itertools.count()
+
+    def add(count=1, job=None, status=entities.ApplicationStatus.APPLIED, **candidate):
+        job = job or db_session.query(entities.JobOpening).first()
+        applications = []
+        for _ in range(count):
+            n = next(numbers)
+            fields = dict(
+                email=f"applicant{n}@example.com", first_name="Applicant", last_name=str(n),
+                skills="Python", experience_years=1, education="BSc"
+            )
+            fields.update(candidate)
+            applications.append(entities.Application(
+                candidate=entities.Candidate(**fields), job_opening=job, status=status
+            ))
+        db_session.add_all(applications)
+        db_session.commit()
+        return applications
+    return add
+
+@pytest.fixture(scope="function")
+def count_queries(db_engine):
+    """Context manager collecting the SQL statements run on the test database inside it"""
+    @contextmanager
+    def count():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+    return count
\ No newline at end of file
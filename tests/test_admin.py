@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import subprocess
+import sys
+from src.database.pool import InstrumentedQueuePool, pool_status
+from src.models import entities
+
+def test_pool_status_reports_usage():
+    pool = InstrumentedQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=2, max_overflow=1)
+    first = pool.connect()
+    second = pool.connect()
+    status = pool_status(pool)
+    assert status["checked_out"] == 2
+    assert status["wait_time"]["count"] == 2
+
+    first.close()
+    status = pool_status(pool)
+    assert status["checked_out"] == 1
+    assert status["idle"] == 1
+    second.close()
+
+def test_pool_settings_come_from_the_environment():
+    # Settings are read at import, so check them in a fresh interpreter;
+    # engines don't connect until first use
+    env = dict(os.environ, ENVIRONMENT="production", DB_POOL_SIZE="42", DB_MAX_OVERFLOW="7")
+    output = subprocess.run(
+        [sys.executable, "-c", (
+            "from src.database import engine, async_engine; "
+            "print(engine.pool.size(), engine.pool._max_overflow, async_engine.sync_engine.pool.size())"
+        )],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert output[-3:] == ["42", "7", "42"]
+
+def test_pool_stats_requires_admin(client, db_session, auth_headers):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    response = client.get("/v1/admin/db/pool", headers=headers)
+    assert response.status_code == 403
+
+def test_pool_stats_as_admin(client, db_session, auth_headers):
+    headers = auth_headers("admin@company.com", "admin123")
+    response = client.get("/v1/admin/db/pool", headers=headers)
+    assert response.status_code == 200
+    assert set(response.json()) == {"sync", "async"}
+
+def test_principal_is_cached(client, db_session, auth_headers, count_queries):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    assert client.get("/v1/email-templates/", headers=headers).status_code == 200
+    with count_queries() as statements:
+        assert client.get("/v1/email-templates/", headers=headers).status_code == 200
+    assert statements
+    assert not any("FROM users" in statement for statement in statements)
+
+def test_role_and_deactivation_take_effect(client, db_session, auth_headers):
+    recruiter_id = db_session.query(entities.User).filter(
+        entities.User.email == "recruiter@company.com"
+    ).one().id
+    admin = auth_headers("admin@company.com", "admin123")
+    recruiter = auth_headers("recruiter@company.com", "recruiter123")
+    assert client.get("/v1/admin/db/pool", headers=recruiter).status_code == 403
+
+    response = client.patch(f"/v1/admin/users/{recruiter_id}", headers=admin, json={"role": "ADMIN"})
+    assert response.status_code == 200
+    assert response.json()["role"] == "ADMIN"
+    assert client.get("/v1/admin/db/pool", headers=recruiter).status_code == 200
+
+    response = client.patch(f"/v1/admin/users/{recruiter_id}", headers=admin, json={"is_active": False})
+    assert response.status_code == 200
+    response = client.get("/v1/admin/db/pool", headers=recruiter)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+def test_update_user_requires_admin(client, db_session, auth_headers):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    response = client.patch("/v1/admin/users/1", headers=headers, json={"is_active": False})
+    assert response.status_code == 403
+    headers = auth_headers("admin@company.com", "admin123")
+    response = client.patch("/v1/admin/users/999999", headers=headers, json={"is_active": False})
+    assert response.status_code == 404
\ No newline at end of file
@@ -0,0 +1,46 @@
+from src.models import entities
+
+def test_batch_update_by_filter(client, db_session, auth_headers, add_applications):
+    applications = add_applications(5, status=entities.ApplicationStatus.SCREENING)
+    job_id = applications[0].job_opening_id
+    ids = [application.id for application in applications]
+    response = client.post(
+        "/v1/applications/batch/status",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        json={"filter": {"job_opening_id": job_id, "status": "screening"}, "status": "rejected"}
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert [change["id"] for change in result["updated"]] == ids
+    assert {change["previous_status"] for change in result["updated"]} == {"screening"}
+
+    db_session.expire_all()
+    statuses = {a.status for a in db_session.query(entities.Application).filter(
+        entities.Application.id.in_(ids)
+    )}
+    assert statuses == {entities.ApplicationStatus.REJECTED}
+
+def test_batch_update_by_ids_reports_unchanged_and_missing(client, db_session, auth_headers, add_applications):
+    ids = [application.id for application in add_applications(2, status=entities.ApplicationStatus.SCREENING)]
+    headers = auth_headers("admin@company.com", "admin123")
+    client.post(
+        "/v1/applications/batch/status", headers=headers,
+        json={"ids": ids[:1], "status": "offered"}
+    )
+    response = client.post(
+        "/v1/applications/batch/status", headers=headers,
+        json={"ids": ids + [999999], "status": "offered"}
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert [change["id"] for change in result["updated"]] == ids[1:]
+    assert result["unchanged_ids"] == ids[:1]
+    assert result["not_found_ids"] == [999999]
+
+def test_batch_update_requires_selection(client, db_session, auth_headers):
+    response = client.post(
+        "/v1/applications/batch/status",
+        headers=auth_headers("admin@company.com", "admin123"),
+        json={"status": "rejected"}
+    )
+    assert response.status_code == 422
\ No newline at end of file
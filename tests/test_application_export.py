@@ -0,0 +1,43 @@
+import csv
+import gzip
+import io
+import json
+from src.core.streaming import gzip_chunks
+
+def test_export_ndjson_with_projection(client, db_session, auth_headers):
+    response = client.get(
+        "/v1/applications/export",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        params={"columns": "id,status,company_name"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    listed = client.get("/v1/applications/").json()
+    assert [row["id"] for row in rows] == sorted(a["id"] for a in listed)
+    assert all(set(row) == {"id", "status", "company_name"} for row in rows)
+
+def test_gzip_chunks_form_one_member():
+    assert gzip.decompress(b"".join(gzip_chunks([b"a,b\n", b"", b"1,2\n"]))) == b"a,b\n1,2\n"
+
+def test_export_csv_gzip(client, db_session, auth_headers):
+    headers = auth_headers("admin@company.com", "admin123")
+    headers["Accept-Encoding"] = "gzip"
+    response = client.get(
+        "/v1/applications/export",
+        headers=headers,
+        params={"format": "csv", "batch_size": 1}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows and rows[0].keys() >= {"id", "status", "company_id"}
+
+def test_export_rejects_unknown_columns(client, db_session, auth_headers):
+    response = client.get(
+        "/v1/applications/export",
+        headers=auth_headers("admin@company.com", "admin123"),
+        params={"columns": "id,password"}
+    )
+    assert response.status_code == 400
\ No newline at end of file
@@ -0,0 +1,52 @@
+import json
+from src.models import entities
+
+CSV_BODY = (
+    "first_name,last_name,email,skills,experience_years,education,notes\n"
+    "Ada,Lovelace,ada@example.com,\"Python, Math\",10,BSc,\"Line one\nline two\"\n"
+    "Alan,Turing,alan@example.com,Python,abc,PhD,\n"
+    "Grace,Hopper,candidate@company.com,COBOL,30,PhD,\n"
+    "Ada,Again,ada@example.com,Python,3,BSc,\n"
+)
+
+def test_import_csv_reports_row_errors(client, db_session, auth_headers):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    headers["Content-Type"] = "text/csv"
+    response = client.post("/v1/candidates/import", content=CSV_BODY, headers=headers)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["total"] == 4
+    assert result["created"] == 1
+    assert result["failed"] == 3
+    assert [error["row"] for error in result["errors"]] == [2, 4, 3]
+
+    ada = db_session.query(entities.Candidate).filter_by(email="ada@example.com").one()
+    assert ada.notes == "Line one\nline two"
+
+def test_import_ndjson(client, db_session, auth_headers):
+    headers = auth_headers("admin@company.com", "admin123")
+    headers["Content-Type"] = "application/x-ndjson"
+    rows = [
+        {
+            "first_name": "User", "last_name": str(i), "email": f"user{i}@example.com",
+            "skills": "Go", "experience_years": i, "education": "BSc"
+        }
+        for i in range(25)
+    ]
+    body = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+    response = client.post(
+        "/v1/candidates/import", params={"chunk_size": 10}, content=body, headers=headers
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 25
+    assert result["errors"][0]["row"] == 26
+    assert db_session.query(entities.Candidate).filter(
+        entities.Candidate.email.like("user%@example.com")
+    ).count() == 25
+
+def test_import_requires_supported_format(client, db_session, auth_headers):
+    headers = auth_headers("admin@company.com", "admin123")
+    headers["Content-Type"] = "application/xml"
+    response = client.post("/v1/candidates/import", content="<x/>", headers=headers)
+    assert response.status_code == 415
@@ -0,0 +1,67 @@
+from src.models import entities
+from src.services.matching_service import CandidateFeatureIndex, MatchingService
+
+def _job(db_session):
+    return db_session.query(entities.JobOpening).filter_by(title="Senior Software Engineer").one()
+
+def test_matches_rank_skills_experience_and_location(client, db_session, auth_headers):
+    job = _job(db_session)
+    for i, (skills, years, location) in enumerate([
+        ("Python, AWS", 6, "San Francisco, CA"),
+        ("Python", 2, "Los Angeles, CA"),
+        ("Java", 10, "Berlin"),
+    ]):
+        db_session.add(entities.Candidate(
+            email=f"match{i}@example.com", first_name="Match", last_name=str(i),
+            skills=skills, experience_years=years, location=location, education="BSc"
+        ))
+    db_session.commit()
+
+    response = client.get(
+        f"/v1/job-openings/{job.id}/matches",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        params={"limit": 3}
+    )
+    assert response.status_code == 200
+    matches = response.json()
+    # The seeded candidate has the same Python / 5+ years / San Francisco profile
+    assert {m["candidate"]["email"] for m in matches[:2]} == {"match0@example.com", "candidate@company.com"}
+    assert [m["score"] for m in matches] == sorted((m["score"] for m in matches), reverse=True)
+    by_email = {m["candidate"]["email"]: m for m in matches}
+    assert by_email["match0@example.com"]["location_score"] == 1.0
+    assert "match2@example.com" not in by_email
+
+def test_matches_skip_deleted_candidates(db_session):
+    index = CandidateFeatureIndex()
+    for i in range(15):
+        db_session.add(entities.Candidate(
+            email=f"gone{i}@example.com", first_name="Gone", last_name=str(i),
+            skills="Python, AWS", experience_years=8, location="San Francisco, CA", education="BSc"
+        ))
+    db_session.add(entities.Candidate(
+        email="kept@example.com", first_name="Kept", last_name="Match",
+        skills="Java", experience_years=1, location="Berlin", education="BSc"
+    ))
+    db_session.commit()
+    index.refresh(db_session)
+
+    # Deleted behind the index's back, and ranked above every live candidate
+    db_session.query(entities.Candidate).filter(entities.Candidate.email.like("gone%")).delete(synchronize_session=False)
+    db_session.commit()
+    matches = MatchingService(index).match_candidates(db_session, _job(db_session), limit=2)
+    assert [candidate.email for candidate, _ in matches] == ["candidate@company.com", "kept@example.com"]
+
+def test_index_refreshes_changed_candidates(db_session):
+    index = CandidateFeatureIndex(initial_capacity=1)
+    index.refresh(db_session)
+    candidate = db_session.query(entities.Candidate).first()
+    python = index.skill_id("python")
+    assert index.top_k([python], 0, None, 1)[0].skill_score == 1.0
+
+    candidate.skills = "Rust, Go"
+    db_session.commit()
+    assert index.refresh(db_session, force=True) >= 1
+    assert index.top_k([python], 0, None, 1)[0].skill_score == 0.0
+
+    index.remove([candidate.id])
+    assert index.top_k([python], 0, None, 1) == []
\ No newline at end of file
@@ -0,0 +1,54 @@
+import pytest
+from src.core.pagination import NEXT_CURSOR_HEADER
+from src.database.search import parse_search_query, to_fts5, to_tsquery
+from src.models import entities
+
+def _add_candidates(db_session):
+    profiles = [
+        ("Python, Kubernetes, AWS", "Platform Engineer", "Acme"),
+        ("Python, Django", "Backend Developer", "Globex"),
+        ("Go, Kubernetes", "SRE", "Initech"),
+    ]
+    for i, (skills, position, company) in enumerate(profiles):
+        db_session.add(entities.Candidate(
+            email=f"search{i}@example.com", first_name="Search", last_name=str(i),
+            skills=skills, current_position=position, current_company=company,
+            experience_years=3, education="BSc"
+        ))
+    db_session.commit()
+
+def _search(client, q, **params):
+    response = client.get("/v1/candidates/search", params={"q": q, **params})
+    assert response.status_code == 200
+    return response
+
+def test_query_rendering():
+    query = parse_search_query('Python AND kube* OR "machine learning" -java')
+    assert to_fts5(query) == '(("Python" AND "kube"*) OR ("machine learning")) NOT "java"'
+    assert to_tsquery(query) == "((('Python') & ('kube':*)) | (('machine' <-> 'learning'))) & !('java')"
+    with pytest.raises(ValueError):
+        parse_search_query("-java")
+
+def test_search_matches_all_terms(client, db_session):
+    _add_candidates(db_session)
+    emails = [c["email"] for c in _search(client, "Python AND Kubernetes").json()]
+    assert emails == ["search0@example.com"]
+    emails = {c["email"] for c in _search(client, "kubernetes -python").json()}
+    assert emails == {"search2@example.com"}
+
+def test_search_index_follows_updates(client, db_session):
+    _add_candidates(db_session)
+    candidate = db_session.query(entities.Candidate).filter_by(email="search1@example.com").one()
+    candidate.skills = "Rust"
+    db_session.commit()
+    assert _search(client, "rust").json()[0]["email"] == "search1@example.com"
+    assert "search1@example.com" not in {c["email"] for c in _search(client, "django").json()}
+
+def test_search_pages_with_cursor(client, db_session):
+    _add_candidates(db_session)
+    response = _search(client, "python OR kubernetes", limit=2)
+    seen = [c["id"] for c in response.json()]
+    response = _search(client, "python OR kubernetes", limit=2, cursor=response.headers[NEXT_CURSOR_HEADER])
+    seen += [c["id"] for c in response.json()]
+    assert NEXT_CURSOR_HEADER not in response.headers
+    assert len(seen) == len(set(seen)) >= 3
\ No newline at end of file
@@ -0,0 +1,184 @@
+import asyncio
+import aiosmtplib
+import pytest
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from sqlalchemy import update
+from src.core.debug_smtp import DebugSMTPServer
+from src.core.smtp_pool import SMTPConnectionPool
+from src.models import entities
+from src.services.email_outbox_worker import EmailOutboxWorker
+from src.services.email_service import EmailService
+from tests.conftest import TestingAsyncSessionLocal
+
+def _worker(server, **options):
+    email_service = EmailService()
+    email_service.smtp_host = server.host
+    email_service.smtp_port = server.port
+    email_service.smtp_user = "outbox"
+    email_service.smtp_password = "secret"
+    email_service.smtp_use_tls = False
+    return EmailOutboxWorker(TestingAsyncSessionLocal, email_service, **options)
+
+def _run(server, *passes, **options):
+    """Run each pass against a fresh worker and a running debug server"""
+    async def drive():
+        async with server:
+            worker = _worker(server, **options)
+            return [await worker.run_once() for _ in passes]
+    return asyncio.run(drive())
+
+def _enqueue(db_session, template_type, *emails):
+    service = EmailService()
+    for email in emails:
+        service.enqueue(db_session, email, template_type, template_data={
+            "candidate_name": "Jane", "interview_type": "Technical", "job_title": "Engineer",
+            "company_name": "Acme", "feedback": "Great", "is_final_step": False
+        })
+    db_session.commit()
+
+def _outbox(db_session):
+    db_session.expire_all()
+    return db_session.query(entities.EmailOutbox).order_by(entities.EmailOutbox.id).all()
+
+def _message(to_email):
+    message = EmailMessage()
+    message["From"] = "recruitment@example.com"
+    message["To"] = to_email
+    message["Subject"] = "Hello"
+    message.set_content("Hi")
+    return message
+
+def test_smtp_pool_reuses_sessions():
+    async def drive():
+        async with DebugSMTPServer() as server:
+            pool = SMTPConnectionPool(server.host, server.port, "outbox", "secret", max_size=3, max_messages=8)
+            await asyncio.gather(*(pool.send(_message(f"{i}@example.com")) for i in range(12)))
+            assert len(server.messages) == 12
+            assert server.connections == 3
+            assert pool.stats()["idle"] == 3
+
+            # Sessions dropped by the server are replaced
+            server.disconnect_all()
+            await asyncio.sleep(0.05)
+            await pool.send(_message("after@example.com"))
+            assert server.connections == 4
+
+            # A refused message leaves its session usable
+            server.fail_next = 1
+            with pytest.raises(aiosmtplib.SMTPDataError):
+                await pool.send(_message("refused@example.com"))
+            await pool.send(_message("next@example.com"))
+            assert server.connections == 4
+            assert len(server.messages) == 14
+            await pool.close()
+            assert pool.stats()["idle"] == 0
+    asyncio.run(drive())
+
+def test_worker_delivers_pending_messages(db_session):
+    _enqueue(db_session, "interview_success", "a@example.com", "b@example.com", "c@example.com")
+    server = DebugSMTPServer()
+
+    assert _run(server, 1, 2) == [3, 0]
+    assert server.connections <= 3
+    assert sorted(message.rcpt_tos[0] for message in server.messages) == [
+        "a@example.com", "b@example.com", "c@example.com"
+    ]
+    assert b"Jane" in server.messages[0].data
+    outbox = _outbox(db_session)
+    assert {message.status for message in outbox} == {entities.EmailOutboxStatus.SENT}
+    assert {message.attempts for message in outbox} == {1}
+    assert all(message.sent_at is not None for message in outbox)
+
+def test_worker_retries_transient_failures(db_session):
+    _enqueue(db_session, "interview_success", "a@example.com")
+    server = DebugSMTPServer(fail_next=1)
+
+    # The retry isn't due yet on the second pass
+    assert _run(server, 1, 2) == [1, 0]
+    [message] = _outbox(db_session)
+    assert message.status == entities.EmailOutboxStatus.PENDING
+    assert message.attempts == 1
+    assert "451" in message.last_error
+    assert message.next_attempt_at > datetime.utcnow() + timedelta(seconds=10)
+
+    message.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    assert _run(server, 1) == [1]
+    [message] = _outbox(db_session)
+    assert message.status == entities.EmailOutboxStatus.SENT
+    assert message.attempts == 2
+    assert len(server.messages) == 1
+
+def test_worker_dead_letters(db_session):
+    _enqueue(db_session, "no_such_template", "missing@example.com")
+    _enqueue(db_session, "interview_success", "flaky@example.com")
+    server = DebugSMTPServer(fail_next=1)
+
+    assert _run(server, 1, max_attempts=1) == [2]
+    outbox = _outbox(db_session)
+    assert [message.status for message in outbox] == [entities.EmailOutboxStatus.DEAD] * 2
+    assert "no active template" in outbox[0].last_error.lower()
+    assert "451" in outbox[1].last_error
+    assert server.messages == []
+
+def test_worker_reclaims_expired_leases(db_session):
+    _enqueue(db_session, "interview_success", "a@example.com")
+    [message] = _outbox(db_session)
+    # Claimed by a worker that died mid-send
+    message.status = entities.EmailOutboxStatus.SENDING
+    message.locked_until = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+
+    server = DebugSMTPServer()
+    assert _run(server, 1) == [1]
+    assert _outbox(db_session)[0].status == entities.EmailOutboxStatus.SENT
+
+def test_settle_leaves_reclaimed_rows_alone(db_session):
+    _enqueue(db_session, "interview_success", "a@example.com", "b@example.com", "c@example.com")
+    worker = EmailOutboxWorker(TestingAsyncSessionLocal, EmailService())
+    outbox = entities.EmailOutbox
+
+    async def drive():
+        async with TestingAsyncSessionLocal() as db:
+            token, messages = await worker._claim(db)
+        # The batch outran its lease: another worker claimed the first and last rows
+        async with TestingAsyncSessionLocal() as db:
+            await db.execute(update(outbox).where(
+                outbox.id.in_([messages[0].id, messages[2].id])
+            ).values(claim_token="other"))
+            await db.commit()
+        async with TestingAsyncSessionLocal() as db:
+            await worker._settle(db, token, messages, [(None, False), (None, False), ("451 busy", False)])
+    asyncio.run(drive())
+
+    assert [message.status for message in _outbox(db_session)] == [
+        entities.EmailOutboxStatus.SENDING, entities.EmailOutboxStatus.SENT, entities.EmailOutboxStatus.SENDING
+    ]
+    assert worker.metrics["lost_leases"] == 2
+    assert worker.metrics["retried"] == 0
+
+def test_rolled_back_changes_send_nothing(db_session):
+    EmailService().enqueue(db_session, "a@example.com", "interview_success", template_data={})
+    db_session.rollback()
+    assert _outbox(db_session) == []
+
+def test_batch_status_update_queues_in_transaction(client, db_session, auth_headers):
+    db_session.add(entities.EmailTemplate(
+        name="Rejected", subject_template="Your application", type="application_rejected",
+        html_content="<p>Dear {{ candidate_name }}, {{ job_title }} at {{ company_name }}</p>"
+    ))
+    db_session.commit()
+    ids = [application.id for application in db_session.query(entities.Application)]
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+
+    response = client.post("/v1/applications/batch/status", headers=headers, json={
+        "ids": ids, "status": "rejected"
+    })
+    assert response.status_code == 200
+    assert response.json()["notifications_queued"] == len(ids)
+    assert len(_outbox(db_session)) == len(ids)
+
+    response = client.get("/v1/admin/email/outbox", headers=auth_headers("admin@company.com", "admin123"))
+    assert response.status_code == 200
+    assert response.json()["outbox"] == {"pending": len(ids)}
\ No newline at end of file
@@ -1,6 +1,12 @@
 import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import update
 from src.models import entities
 from src.services.auth_service import AuthService
+from src.services.email_template_service import (
+    ActiveTemplateCache, CompiledTemplateCache, EmailTemplateService, active_templates
+)
 
 def test_list_templates_as_admin(client, db_session):
     # Login as admin
@@ -90,4 +96,95 @@ def test_create_template_as_admin(client, db_session):
     )
     assert response.status_code == 201
     created_template = response.json()
-    assert created_template["name"] == template_data["name"] 
\ No newline at end of file
+    assert created_template["name"] == template_data["name"] 
+
+def _template(id, html_content, updated_at=datetime(2024, 1, 1)):
+    return entities.EmailTemplate(
+        id=id, name=f"Template {id}", subject_template="Hi {{ name }}",
+        html_content=html_content, type="test", updated_at=updated_at
+    )
+
+def test_compiled_template_cache():
+    cache = CompiledTemplateCache(max_entries=2)
+    first = _template(1, "<p>{{ name }}</p>")
+    subject, html = cache.get(first)
+    assert cache.get(_template(1, "<p>{{ name }}</p>")) == (subject, html)
+    assert html.render(name="Jane") == "<p>Jane</p>"
+
+    # A new version, or an edit that kept updated_at, is recompiled
+    edited = cache.get(_template(1, "<b>{{ name }}</b>"))[1]
+    assert edited.render(name="Jane") == "<b>Jane</b>"
+    newer = _template(1, "<i>{{ name }}</i>", datetime(2024, 1, 2))
+    assert cache.get(newer)[1].render(name="Jane") == "<i>Jane</i>"
+
+    # The least recently used version is evicted
+    cache.get(_template(2, "two"))
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 1
+
+def test_render_template_is_sandboxed():
+    service = EmailTemplateService()
+    subject, html = service.render_template(_template(3, "{{ items | length }}"), {"name": "Jane", "items": [1, 2]})
+    assert (subject, html) == ("Hi Jane", "2")
+    with pytest.raises(ValueError):
+        service.render_template(_template(4, "{{ name.__class__.__mro__ }}"), {"name": "Jane"})
+
+def test_active_template_is_cached(client, db_session, auth_headers, monkeypatch, count_queries):
+    monkeypatch.setattr(active_templates, "version_check_interval", 3600.0)
+    service = EmailTemplateService()
+    template = service.get_active_template(db_session, "interview_success")
+    template_id = template.id
+    with count_queries() as statements:
+        assert service.get_active_template(db_session, "interview_success").id == template_id
+        with pytest.raises(HTTPException):
+            service.get_active_template(db_session, "no_such_type")
+        with pytest.raises(HTTPException):
+            service.get_active_template(db_session, "no_such_type")
+    # One lookup for the missing type, none for the cached one or the repeat miss
+    assert len(statements) == 1
+
+    # Deactivating through the API invalidates this process right away
+    response = client.put(
+        f"/v1/email-templates/{template_id}",
+        headers=auth_headers("admin@company.com", "admin123"),
+        json={"is_active": False}
+    )
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+    with pytest.raises(HTTPException):
+        service.get_active_template(db_session, "interview_success")
+
+def test_active_template_follows_other_processes(db_session, monkeypatch):
+    monkeypatch.setattr(active_templates, "version_check_interval", 3600.0)
+    service = EmailTemplateService()
+    assert service.get_active_template(db_session, "interview_failure").subject_template != "Changed"
+
+    # Another process edits the template and bumps the counter
+    table = entities.EmailTemplate.__table__
+    versions = entities.CacheVersion.__table__
+    with db_session.get_bind().begin() as connection:
+        connection.execute(update(table).where(table.c.type == "interview_failure").values(subject_template="Changed"))
+        connection.execute(update(versions).where(
+            versions.c.name == ActiveTemplateCache.version_key
+        ).values(version=versions.c.version + 1))
+
+    # Served from the cache until the next version check
+    assert service.get_active_template(db_session, "interview_failure").subject_template != "Changed"
+    monkeypatch.setattr(active_templates, "version_check_interval", 0.0)
+    assert service.get_active_template(db_session, "interview_failure").subject_template == "Changed"
+    assert active_templates.stats()["invalidations"] >= 1
+
+def test_update_template_requires_admin(client, db_session, auth_headers):
+    response = client.put(
+        "/v1/email-templates/1",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        json={"is_active": False}
+    )
+    assert response.status_code == 403
+    response = client.put(
+        "/v1/email-templates/999999",
+        headers=auth_headers("admin@company.com", "admin123"),
+        json={"is_active": False}
+    )
+    assert response.status_code == 404
\ No newline at end of file
@@ -0,0 +1,49 @@
+from src.models import entities
+from src.services.funnel_service import funnel_service
+
+def _stages(response):
+    assert response.status_code == 200
+    return {stage["status"]: stage for stage in response.json()["stages"]}
+
+def test_rollup_follows_creates_and_status_changes(client, db_session, auth_headers, add_applications):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    job = db_session.query(entities.JobOpening).first()
+    job_id = job.id
+    baseline = _stages(client.get("/v1/analytics/funnel", headers=headers))
+
+    applications = add_applications(4, job=job)
+    applications[0].status = entities.ApplicationStatus.SCREENING
+    db_session.commit()
+    response = client.post(
+        "/v1/applications/batch/status", headers=headers,
+        json={"ids": [a.id for a in applications[1:3]], "status": "screening", "notify": False}
+    )
+    assert len(response.json()["updated"]) == 2
+
+    stages = _stages(client.get("/v1/analytics/funnel", headers=headers))
+    assert stages["applied"]["current"] - baseline["applied"]["current"] == 1
+    assert stages["screening"]["current"] - baseline["screening"]["current"] == 3
+    assert stages["screening"]["entered"] - baseline["screening"]["entered"] == 3
+
+    stages = _stages(client.get(
+        "/v1/analytics/funnel", headers=headers, params={"job_opening_id": job_id}
+    ))
+    assert stages["screening"]["conversion_rate"] == round(
+        stages["screening"]["entered"] / stages["applied"]["entered"], 4
+    )
+
+    days = client.get("/v1/analytics/funnel/daily", headers=headers).json()
+    assert any(day["status"] == "screening" and day["entered"] >= 3 for day in days)
+
+def test_rebuild_matches_current_statuses(client, db_session, auth_headers, add_applications):
+    add_applications(status=entities.ApplicationStatus.OFFERED)
+    funnel_service.rebuild(db_session)
+
+    stages = _stages(client.get(
+        "/v1/analytics/funnel", headers=auth_headers("admin@company.com", "admin123")
+    ))
+    current = {
+        status.value: db_session.query(entities.Application).filter_by(status=status).count()
+        for status in entities.ApplicationStatus
+    }
+    assert {status: stage["current"] for status, stage in stages.items()} == current
\ No newline at end of file
@@ -0,0 +1,41 @@
+from sqlalchemy import create_engine, text
+from src.core.middleware.db_profiler import QueryFingerprintRecorder
+from src.database.index_advisor import advise, load_fingerprints
+
+def _engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, author TEXT, body TEXT)"))
+        connection.execute(text("CREATE TABLE tags (id INTEGER PRIMARY KEY, label TEXT)"))
+        connection.execute(text("CREATE INDEX ix_tags_label ON tags (label)"))
+    return engine
+
+def test_reports_filtered_full_scan():
+    findings = advise(_engine(), [
+        {"statement": "SELECT notes.id FROM notes WHERE notes.author = ?", "parameters": ["ann"]},
+        {"statement": "SELECT notes.body FROM notes WHERE notes.author = ? LIMIT ?", "parameters": ["bob", 5]},
+    ])
+    assert len(findings) == 1
+    assert findings[0].table == "notes"
+    assert findings[0].columns == ["author"]
+    assert findings[0].occurrences == 2
+    assert findings[0].suggestion == "CREATE INDEX ix_notes_author ON notes (author)"
+
+def test_indexed_and_unfiltered_queries_are_not_reported():
+    findings = advise(_engine(), [
+        {"statement": "SELECT tags.id FROM tags WHERE tags.label = ?", "parameters": ["x"]},
+        {"statement": "SELECT notes.id FROM notes ORDER BY notes.id LIMIT ?", "parameters": [10]},
+    ])
+    assert findings == []
+
+def test_recorder_redacts_parameters_and_collapses_in_lists(tmp_path):
+    path = tmp_path / "queries.jsonl"
+    recorder = QueryFingerprintRecorder(str(path), max_shapes=2)
+    recorder.record("SELECT notes.id FROM notes WHERE notes.id IN (?, ?, ?) AND notes.author = ?", (1, 2, 3, "ann"), False)
+    recorder.record("SELECT notes.id FROM notes WHERE notes.id IN (?, ?) AND notes.author = ?", (4, 5, "bob"), False)
+    recorder.record("SELECT tags.id FROM tags WHERE tags.label = %(label_1)s", {"label_1": "secret"}, False)
+    recorder.record("SELECT tags.id FROM tags WHERE tags.id = ?", (7,), False)
+    assert load_fingerprints(path) == [
+        {"statement": "SELECT notes.id FROM notes WHERE notes.id IN (?) AND notes.author = ?", "parameters": [0, ""]},
+        {"statement": "SELECT tags.id FROM tags WHERE tags.label = %(label_1)s", "parameters": {"label_1": ""}},
+    ]
\ No newline at end of file
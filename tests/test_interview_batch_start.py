@@ -0,0 +1,60 @@
+from src.models import entities
+
+def test_batch_start(client, db_session, auth_headers, add_applications):
+    db_session.add(entities.EmailTemplate(
+        name="Process Started", subject_template="Interviews for {{ job_title }}",
+        html_content="<p>Dear {{ candidate_name }}</p>", type="interview_process_started"
+    ))
+    db_session.commit()
+    job = db_session.query(entities.JobOpening).filter(
+        entities.JobOpening.interview_template_id.is_not(None)
+    ).first()
+    ids = [application.id for application in add_applications(3, job=job, status=entities.ApplicationStatus.SCREENING)]
+    no_template_job = entities.JobOpening(title="Untemplated", company_id=1, status=entities.JobStatus.OPEN)
+    [no_template] = [application.id for application in add_applications(1, job=no_template_job)]
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+
+    response = client.post("/v1/interviews/applications/batch/start", headers=headers, json={
+        "application_ids": ids + [no_template, 999999]
+    })
+    assert response.status_code == 200
+    result = response.json()
+    assert [started["application_id"] for started in result["started"]] == ids
+    assert {started["step_count"] for started in result["started"]} == {3}
+    assert result["no_template_ids"] == [no_template]
+    assert result["not_found_ids"] == [999999]
+    assert result["notifications_queued"] == 3
+
+    db_session.expire_all()
+    outbox = db_session.query(entities.EmailOutbox).order_by(entities.EmailOutbox.id).all()
+    assert [message.to_email for message in outbox] == [f"applicant{i}@example.com" for i in range(3)]
+    assert {message.template_type for message in outbox} == {"interview_process_started"}
+    assert {message.status for message in outbox} == {entities.EmailOutboxStatus.PENDING}
+    processes = db_session.query(entities.InterviewProcess).filter(
+        entities.InterviewProcess.application_id.in_(ids)
+    ).all()
+    assert [len(process.steps) for process in processes] == [3, 3, 3]
+    assert [step.order for step in processes[0].steps] == [1, 2, 3]
+    statuses = {a.status for a in db_session.query(entities.Application).filter(
+        entities.Application.id.in_(ids)
+    )}
+    assert statuses == {entities.ApplicationStatus.INTERVIEWING}
+    assert db_session.query(entities.ApplicationStatusHistory).filter(
+        entities.ApplicationStatusHistory.application_id.in_(ids),
+        entities.ApplicationStatusHistory.to_status == entities.ApplicationStatus.INTERVIEWING
+    ).count() == 3
+
+    # A second run skips them
+    response = client.post("/v1/interviews/applications/batch/start", headers=headers, json={
+        "application_ids": ids, "notify": False
+    })
+    assert response.json()["started"] == []
+    assert response.json()["already_started_ids"] == ids
+
+def test_batch_start_requires_recruiter(client, db_session, auth_headers):
+    response = client.post(
+        "/v1/interviews/applications/batch/start",
+        headers=auth_headers("candidate@company.com", "candidate123"),
+        json={"application_ids": [1]}
+    )
+    assert response.status_code == 403
\ No newline at end of file
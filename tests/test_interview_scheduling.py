@@ -0,0 +1,140 @@
+from datetime import datetime
+import pytest
+from src.models import entities
+
+@pytest.fixture
+def steps(db_session):
+    """Two pending steps (30 and 60 minutes) and the recruiter's user id"""
+    application = db_session.query(entities.Application).first()
+    template = db_session.query(entities.InterviewTemplate).first()
+    process = entities.InterviewProcess(
+        application=application,
+        template=template,
+        current_step=0,
+        status=entities.InterviewStepStatus.PENDING
+    )
+    db_session.add(process)
+    db_session.flush()
+    steps = [
+        entities.InterviewStep(
+            process_id=process.id,
+            template_step_id=template_step.id,
+            order=template_step.order,
+            status=entities.InterviewStepStatus.PENDING
+        )
+        for template_step in template.steps[:2]
+    ]
+    db_session.add_all(steps)
+    db_session.commit()
+    interviewer = db_session.query(entities.User).filter_by(email="recruiter@company.com").one()
+    return [step.id for step in steps], interviewer.id
+
+def test_double_booking_is_rejected(client, auth_headers, steps):
+    (first, second), interviewer_id = steps
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+
+    def schedule(step_id, at, **extra):
+        return client.put(f"/v1/interviews/steps/{step_id}", headers=headers, json={
+            "interviewer_id": interviewer_id, "scheduled_at": at, **extra
+        })
+
+    assert schedule(first, "2030-03-04T10:00:00").status_code == 200
+    # The first step is a 30 minute screening
+    response = schedule(second, "2030-03-04T10:15:00")
+    assert response.status_code == 409
+    assert f"step {first}" in response.json()["detail"]
+    assert schedule(second, "2030-03-04T10:30:00").status_code == 200
+    # Same instant with an offset, and updates that keep the slot
+    assert schedule(first, "2030-03-04T12:40:00+02:00").status_code == 409
+    assert schedule(second, "2030-03-04T10:30:00", location="Room 4").status_code == 200
+
+    # Cancelling frees the slot
+    assert schedule(second, "2030-03-04T10:30:00", status="cancelled").status_code == 200
+    assert schedule(first, "2030-03-04T10:45:00").status_code == 200
+
+def test_bulk_schedule_check(client, auth_headers, steps):
+    (first, second), interviewer_id = steps
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    client.put(f"/v1/interviews/steps/{first}", headers=headers, json={
+        "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T10:00:00"
+    })
+
+    response = client.post("/v1/interviews/schedule/check", headers=headers, json={"proposals": [
+        # Overlaps the booked first step
+        {"step_id": second, "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T09:30:00"},
+        # These two overlap each other
+        {"interviewer_id": interviewer_id, "scheduled_at": "2030-03-05T09:00:00", "duration_minutes": 60},
+        {"interviewer_id": interviewer_id, "scheduled_at": "2030-03-05T09:45:00", "duration_minutes": 30},
+    ]})
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["ok"] for result in results] == [False, False, False]
+    assert results[0]["ends_at"] == "2030-03-04T10:30:00"
+    assert [c["step_id"] for c in results[0]["conflicts"]] == [first]
+    assert [c["proposal_index"] for c in results[1]["conflicts"]] == [2]
+    assert [c["proposal_index"] for c in results[2]["conflicts"]] == [1]
+
+    # Steps moved by the batch free their current slots
+    response = client.post("/v1/interviews/schedule/check", headers=headers, json={"proposals": [
+        {"step_id": first, "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T11:00:00"},
+        {"step_id": second, "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T10:00:00"},
+    ]})
+    assert [result["ok"] for result in response.json()] == [True, True]
+
+    response = client.post("/v1/interviews/schedule/check", headers=headers, json={"proposals": [
+        {"step_id": 9999, "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T09:30:00"}
+    ]})
+    assert response.status_code == 400
+
+def test_free_slots(client, auth_headers, steps):
+    (first, second), interviewer_id = steps
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    # Screening 09:00-09:30 and technical 10:00-11:00 on a Monday
+    for step_id, at in [(first, "2030-03-04T09:00:00"), (second, "2030-03-04T10:00:00")]:
+        client.put(f"/v1/interviews/steps/{step_id}", headers=headers, json={
+            "interviewer_id": interviewer_id, "scheduled_at": at
+        })
+
+    def free_slots(**params):
+        response = client.get("/v1/interviews/schedule/free-slots", headers=headers, params={
+            "date_from": "2030-03-02", "date_to": "2030-03-08", "limit": 3, **params
+        })
+        assert response.status_code == 200
+        return [(slot["starts_at"][11:16], slot["interviewer_ids"]) for slot in response.json()]
+
+    # The weekend is skipped; only the recruiter has run a technical step
+    assert free_slots(step_type="technical") == [
+        ("11:00", [interviewer_id]), ("11:30", [interviewer_id]), ("12:00", [interviewer_id])
+    ]
+    slots = free_slots()
+    assert slots[0][0] == "09:00" and interviewer_id not in slots[0][1]
+    assert free_slots(interviewer_ids=[interviewer_id], duration_minutes=30)[0][0] == "09:30"
+
+    response = client.get("/v1/interviews/schedule/free-slots", headers=headers, params={
+        "date_from": "2030-03-08", "date_to": "2030-03-02"
+    })
+    assert response.status_code == 400
+def test_booking_missed_by_the_index_is_rejected(client, db_session, auth_headers, steps):
+    (first, second), interviewer_id = steps
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    assert client.put(f"/v1/interviews/steps/{second}", headers=headers, json={
+        "location": "Room 1"
+    }).status_code == 200
+
+    # Booked by another process, with a timestamp older than the index's
+    # refresh window, so only the database knows about it
+    db_session.query(entities.InterviewStep).filter_by(id=first).update({
+        "interviewer_id": interviewer_id,
+        "scheduled_at": datetime(2030, 3, 4, 10, 0),
+        "updated_at": datetime(2000, 1, 1)
+    })
+    db_session.commit()
+
+    response = client.put(f"/v1/interviews/steps/{second}", headers=headers, json={
+        "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T10:15:00"
+    })
+    assert response.status_code == 409
+    assert f"step {first}" in response.json()["detail"]
+    assert client.put(f"/v1/interviews/steps/{second}", headers=headers, json={
+        "interviewer_id": interviewer_id, "scheduled_at": "2030-03-04T10:30:00"
+    }).status_code == 200
\ No newline at end of file
@@ -0,0 +1,48 @@
+import pytest
+from src.models import entities
+
+@pytest.fixture
+def interview_step(db_session):
+    application = db_session.query(entities.Application).first()
+    template = db_session.query(entities.InterviewTemplate).first()
+    process = entities.InterviewProcess(
+        application=application,
+        template=template,
+        current_step=0,
+        status=entities.InterviewStepStatus.PENDING
+    )
+    db_session.add(process)
+    db_session.flush()
+    step = entities.InterviewStep(
+        process_id=process.id,
+        template_step_id=template.steps[0].id,
+        order=template.steps[0].order,
+        status=entities.InterviewStepStatus.PENDING
+    )
+    db_session.add(step)
+    db_session.commit()
+    return step.id
+
+def test_update_interview_step(client, db_session, auth_headers, interview_step):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    response = client.put(
+        f"/v1/interviews/steps/{interview_step}",
+        headers=headers,
+        json={"feedback": "Strong fundamentals", "location": "Room 4"}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["feedback"] == "Strong fundamentals"
+    assert body["template_step"]["name"] == "Initial Screening"
+
+def test_update_missing_interview_step(client, db_session, auth_headers):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    response = client.put("/v1/interviews/steps/9999", headers=headers, json={})
+    assert response.status_code == 404
+
+def test_login_rejects_bad_password(client, db_session):
+    response = client.post(
+        "/v1/auth/token",
+        data={"username": "admin@company.com", "password": "wrong"}
+    )
+    assert response.status_code == 401
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from src.models import entities, schemas
+from src.services.job_opening_service import JobOpeningService
+from src.models.base_entity import utc_now
+from src.services.job_search_service import JobFacetIndex, job_index
+
+def _facet(result, name):
+    return {f["value"]: f["count"] for f in result["facets"][name]}
+
+def test_search_with_facets(client, db_session):
+    job_index.refresh(db_session, force=True)
+    response = client.get("/v1/job-openings/search", params={"q": "engineer"})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["total"] == 1
+    assert result["items"][0]["title"] == "Senior Software Engineer"
+    assert _facet(result, "location") == {"San Francisco, CA": 1}
+
+    # A facet's own filter doesn't narrow its counts
+    result = client.get(
+        "/v1/job-openings/search", params={"location": "New York, NY"}
+    ).json()
+    assert [job["location"] for job in result["items"]] == ["New York, NY"]
+    assert _facet(result, "location") == {"San Francisco, CA": 1, "New York, NY": 1}
+    assert _facet(result, "experience_level") == {"Mid-level": 1}
+    company = result["facets"]["company"][0]
+    assert company["label"] == result["items"][0]["company"]["name"]
+
+def test_prefix_search(db_session):
+    index = JobFacetIndex()
+    index.refresh(db_session)
+    assert index.search("soft").total == 1
+    assert index.search("soft ").total == 0
+
+def test_index_follows_create_and_update(db_session):
+    index = job_index
+    index.refresh(db_session, force=True)
+    admin = db_session.query(entities.User).filter_by(role=entities.UserRole.ADMIN).first()
+    company = db_session.query(entities.Company).first()
+    service = JobOpeningService()
+    job = service.create_job_opening(db_session, schemas.JobOpeningCreate(
+        title="Data Scientist", description="Models", requirements="Statistics",
+        location="Remote", job_type="contract", experience_level="Senior",
+        company_id=company.id
+    ), admin)
+    assert index.search("scientist").ids == [job.id]
+
+    service.update_job_opening(db_session, job.id, schemas.JobOpeningBase(
+        title="Machine Learning Engineer", description="Models", requirements="Statistics",
+        location="Remote", job_type="contract", experience_level="Senior"
+    ), admin)
+    assert index.search("scientist").total == 0
+    assert job.id in index.search("machine learning").ids
+
+def test_refresh_drops_deleted_jobs_when_count_is_unchanged(db_session):
+    index = JobFacetIndex()
+    company = db_session.query(entities.Company).first()
+
+    def add(title):
+        job = entities.JobOpening(
+            title=title, description="Models", requirements="Statistics",
+            location="Remote", job_type="contract", experience_level="Senior",
+            company_id=company.id
+        )
+        db_session.add(job)
+        db_session.commit()
+        return job
+
+    old = add("Data Scientist")
+    index.refresh(db_session)
+    db_session.delete(old)
+    add("Data Analyst")
+    index.refresh(db_session, force=True)
+    assert index.search("scientist").total == 0
+    assert index.search("analyst").total == 1
+    assert dict(index.search().facets["job_type"])["contract"] == 1
+
+def test_reconcile_picks_up_changes_behind_the_watermark(db_session, monkeypatch):
+    index = JobFacetIndex()
+    index.refresh(db_session)
+    job_id = db_session.query(entities.JobOpening.id).order_by(entities.JobOpening.id).first()[0]
+
+    # Committed long after its updated_at was stamped: behind the overlap
+    table = entities.JobOpening.__table__
+    with db_session.get_bind().begin() as connection:
+        connection.execute(table.update().where(table.c.id == job_id).values(
+            title="Site Reliability Engineer", updated_at=utc_now() - timedelta(hours=1)
+        ))
+    index.refresh(db_session, force=True)
+    assert index.search("reliability").total == 0
+
+    monkeypatch.setattr(index, "reconcile_interval", 0.0)
+    index.refresh(db_session, force=True)
+    assert index.search("reliability").ids == [job_id]
\ No newline at end of file
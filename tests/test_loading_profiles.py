@@ -0,0 +1,13 @@
+def test_application_list_query_count_is_constant(client, db_session, add_applications, count_queries):
+    add_applications(2)
+    db_session.expunge_all()
+    with count_queries() as small:
+        assert client.get("/v1/applications/").status_code == 200
+
+    add_applications(20)
+    db_session.expunge_all()
+    with count_queries() as large:
+        response = client.get("/v1/applications/")
+    assert response.status_code == 200
+    assert len(response.json()) == 23
+    assert len(large) == len(small) == 1
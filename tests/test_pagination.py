@@ -0,0 +1,64 @@
+from src.core.pagination import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_APPROXIMATE_HEADER,
+    encode_cursor, decode_cursor
+)
+from src.services.company_service import CompanyService
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([42])
+    assert decode_cursor(cursor, 1) == [42]
+
+def test_walk_companies_with_cursor(client, db_session):
+    seen = []
+    response = client.get("/v1/companies/", params={"limit": 1})
+    assert response.status_code == 200
+    seen.extend(company["id"] for company in response.json())
+
+    while NEXT_CURSOR_HEADER in response.headers:
+        response = client.get(
+            "/v1/companies/",
+            params={"limit": 1, "cursor": response.headers[NEXT_CURSOR_HEADER]}
+        )
+        assert response.status_code == 200
+        seen.extend(company["id"] for company in response.json())
+
+    # Seed data creates three companies
+    assert len(seen) == 3
+    assert seen == sorted(seen)
+
+def test_offset_pagination_still_supported(client, db_session):
+    all_ids = [c["id"] for c in client.get("/v1/companies/").json()]
+    response = client.get("/v1/companies/", params={"skip": 1, "limit": 1})
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()] == all_ids[1:2]
+
+def test_invalid_cursor_is_rejected(client, db_session):
+    response = client.get("/v1/applications/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+def test_include_total_on_first_and_cursor_pages(client, db_session):
+    response = client.get("/v1/companies/", params={"limit": 1, "include_total": True})
+    assert response.headers[TOTAL_COUNT_HEADER] == "3"
+    assert TOTAL_COUNT_APPROXIMATE_HEADER not in response.headers
+
+    # Later pages reuse the count taken with the first page
+    response = client.get(
+        "/v1/companies/",
+        params={"limit": 1, "include_total": True, "cursor": response.headers[NEXT_CURSOR_HEADER]}
+    )
+    assert response.headers[TOTAL_COUNT_HEADER] == "3"
+    assert response.headers[TOTAL_COUNT_APPROXIMATE_HEADER] == "true"
+
+def test_total_is_omitted_by_default(client, db_session):
+    response = client.get("/v1/companies/")
+    assert TOTAL_COUNT_HEADER not in response.headers
+
+def test_large_totals_come_from_cache(db_session, monkeypatch):
+    service = CompanyService()
+    monkeypatch.setattr(service, "approximate_count_threshold", 2)
+    page = service.get_page(db_session, limit=1, include_total=True)
+    assert (page.total, page.total_is_approximate) == (3, False)
+
+    page = service.get_page(db_session, skip=2, limit=1, include_total=True)
+    assert (page.total, page.total_is_approximate) == (3, True)
+    assert len(page.items) == 1
\ No newline at end of file
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+import pytest
+from src.core.password_hashing import PasswordHasher, PasswordHasherBusy, password_hasher
+
+def test_hash_and_verify_off_the_event_loop():
+    hasher = PasswordHasher(workers=2, max_pending=4)
+    hashed = hasher.hash_sync("secret")
+
+    async def check():
+        return await asyncio.gather(hasher.verify("secret", hashed), hasher.verify("wrong", hashed))
+
+    assert asyncio.run(check()) == [True, False]
+    stats = hasher.stats()
+    assert stats["hashed"] == 1
+    assert stats["verified"] == 2
+    assert stats["pending"] == 0
+    assert stats["wait_time"]["count"] == 3
+
+def test_saturated_hasher_rejects_at_once():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    release = threading.Event()
+    blocked = hasher._submit("hashed", release.wait)
+    with pytest.raises(PasswordHasherBusy):
+        asyncio.run(hasher.hash("secret"))
+    release.set()
+    blocked.result()
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.hash_sync("secret")
+
+def test_sync_hashing_waits_instead_of_shedding():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    release = threading.Event()
+    blocked = hasher._submit("hashed", release.wait)
+    threading.Timer(0.1, release.set).start()
+    assert hasher.hash_sync("secret")
+    assert blocked.result()
+    assert "rejected" not in hasher.stats()
+
+def test_login_returns_429_when_saturated(client, db_session, monkeypatch):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    response = client.post(
+        "/v1/auth/token",
+        data={"username": "admin@company.com", "password": "admin123"}
+    )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
\ No newline at end of file
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+from src.database import Base
+from src.database.routing import PRIMARY_OPTION, ReplicaSet, RoutingSession
+from src.models import entities
+
+@pytest.fixture
+def routed_sessions(tmp_path):
+    # Two SQLite files stand in for the primary and a read replica
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", connect_args={"check_same_thread": False})
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False})
+    for engine, name in [(primary, "Primary Co"), (replica, "Replica Co")]:
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(entities.Company.__table__.insert(), {"name": name})
+
+    factory = sessionmaker(
+        class_=RoutingSession,
+        bind=primary,
+        replica_set=ReplicaSet([replica])
+    )
+    yield factory
+
+    for engine in (primary, replica):
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+def _company_names(session):
+    return [c.name for c in session.query(entities.Company).order_by(entities.Company.id)]
+
+def test_read_only_session_uses_replica(routed_sessions):
+    session = routed_sessions(read_only=True)
+    assert _company_names(session) == ["Replica Co"]
+    session.close()
+
+def test_write_session_uses_primary(routed_sessions):
+    session = routed_sessions()
+    assert _company_names(session) == ["Primary Co"]
+    session.close()
+
+def test_zero_staleness_forces_primary(routed_sessions):
+    session = routed_sessions(read_only=True, max_staleness=0)
+    assert _company_names(session) == ["Primary Co"]
+    session.close()
+
+def test_reads_after_write_go_to_primary(routed_sessions):
+    session = routed_sessions(read_only=True)
+    session.add(entities.Company(name="New Co"))
+    session.flush()
+    assert _company_names(session) == ["Primary Co", "New Co"]
+    session.rollback()
+    session.close()
+
+
+def test_primary_option_routes_one_statement(routed_sessions):
+    session = routed_sessions(read_only=True)
+    query = select(entities.Company.name).execution_options(**{PRIMARY_OPTION: True})
+    assert session.execute(query).scalars().all() == ["Primary Co"]
+    # The rest of the session keeps reading from the replica
+    assert _company_names(session) == ["Replica Co"]
+    session.close()
+
+def test_raw_sql_goes_to_primary(routed_sessions):
+    session = routed_sessions(read_only=True)
+    session.execute(text("INSERT INTO companies (name) VALUES ('Raw Co')"))
+    assert _company_names(session) == ["Primary Co", "Raw Co"]
+    session.rollback()
+    session.close()
\ No newline at end of file
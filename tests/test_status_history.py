@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+from src.models import entities
+from src.services.funnel_service import StatusTransition
+from src.services.status_history_service import status_history_service
+
+DAY = 86400.0
+
+def test_status_changes_are_recorded_in_the_same_transaction(client, db_session, auth_headers):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    job = db_session.query(entities.JobOpening).first()
+    candidate = entities.Candidate(
+        email="history@example.com", first_name="History", last_name="Test",
+        skills="Python", experience_years=1, education="BSc"
+    )
+    application = entities.Application(candidate=candidate, job_opening=job)
+    db_session.add(application)
+    db_session.commit()
+    application_id, company_id = application.id, job.company_id
+
+    application.status = entities.ApplicationStatus.SCREENING
+    db_session.commit()
+    response = client.post(
+        "/v1/applications/batch/status", headers=headers,
+        json={"ids": [application_id], "status": "interviewing", "notify": False}
+    )
+    assert response.status_code == 200
+
+    history = db_session.query(entities.ApplicationStatusHistory).filter_by(
+        application_id=application_id
+    ).order_by(entities.ApplicationStatusHistory.id).all()
+    assert [(row.from_status, row.to_status) for row in history] == [
+        (None, entities.ApplicationStatus.APPLIED),
+        (entities.ApplicationStatus.APPLIED, entities.ApplicationStatus.SCREENING),
+        (entities.ApplicationStatus.SCREENING, entities.ApplicationStatus.INTERVIEWING),
+    ]
+    assert history[-1].changed_by_id is not None
+    assert history[-1].company_id == company_id
+
+def test_time_in_stage_percentiles(client, db_session, auth_headers):
+    job = db_session.query(entities.JobOpening).first()
+    job_id = job.id
+    start = datetime(2026, 1, 1)
+    applied, screening, hired = (
+        entities.ApplicationStatus.APPLIED,
+        entities.ApplicationStatus.SCREENING,
+        entities.ApplicationStatus.HIRED,
+    )
+    transitions = []
+    # Application n waits n days in applied, then a day in screening;
+    # the even ones are hired
+    for n in range(1, 11):
+        application_id = 10000 + n
+        transitions += [
+            StatusTransition(job_id, None, applied, application_id, None, start),
+            StatusTransition(job_id, applied, screening, application_id, None, start + timedelta(days=n)),
+        ]
+        if n % 2 == 0:
+            transitions.append(StatusTransition(
+                job_id, screening, hired, application_id, None, start + timedelta(days=n + 1)
+            ))
+    status_history_service.record(db_session, transitions)
+    db_session.commit()
+
+    response = client.get(
+        "/v1/analytics/time-in-stage",
+        headers=auth_headers("admin@company.com", "admin123"),
+        params={"job_opening_id": job_id}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    stages = {stage["status"]: stage for stage in report["stages"]}
+    assert stages["applied"] == {
+        "status": "applied", "count": 10, "average_seconds": 5.5 * DAY,
+        "p50_seconds": 5 * DAY, "p90_seconds": 9 * DAY,
+    }
+    # Screening ended only for the hires; hired never ends
+    assert stages["screening"]["count"] == 5
+    assert stages["screening"]["p90_seconds"] == DAY
+    assert stages["hired"]["count"] == 0
+    assert report["time_to_hire"]["count"] == 5
+    assert report["time_to_hire"]["p50_seconds"] == 7 * DAY
+
+    # Only stays that began in the range
+    stages = {stage["status"]: stage for stage in client.get(
+        "/v1/analytics/time-in-stage",
+        headers=auth_headers("admin@company.com", "admin123"),
+        params={"job_opening_id": job_id, "date_from": "2026-01-02"}
+    ).json()["stages"]}
+    assert stages["applied"]["count"] == 0
+    assert stages["screening"]["count"] == 5
+
+def test_time_in_stage_requires_recruiter(client, db_session, auth_headers):
+    response = client.get(
+        "/v1/analytics/time-in-stage",
+        headers=auth_headers("candidate@company.com", "candidate123")
+    )
+    assert response.status_code == 403
+def test_single_application_transition_over_http(client, db_session, auth_headers):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    job = db_session.query(entities.JobOpening).filter_by(status=entities.JobStatus.OPEN).first()
+    candidate = entities.Candidate(
+        email="single@example.com", first_name="Single", last_name="Test",
+        skills="Python", experience_years=1, education="BSc"
+    )
+    db_session.add(candidate)
+    db_session.commit()
+    job_id, candidate_id = job.id, candidate.id
+
+    def funnel():
+        return {
+            row.status: (row.entered, row.exited)
+            for row in db_session.query(entities.ApplicationFunnelDaily).filter_by(job_opening_id=job_id)
+        }
+    before = funnel()
+
+    response = client.post(
+        "/v1/applications/", headers=headers,
+        json={"candidate_id": candidate_id, "job_opening_id": job_id}
+    )
+    assert response.status_code == 201
+    application_id = response.json()["id"]
+    response = client.put(
+        f"/v1/applications/{application_id}/status", headers=headers,
+        json={"status": "screening"}
+    )
+    assert response.status_code == 200
+
+    history = db_session.query(entities.ApplicationStatusHistory).filter_by(
+        application_id=application_id
+    ).order_by(entities.ApplicationStatusHistory.id).all()
+    assert [(row.from_status, row.to_status) for row in history] == [
+        (None, entities.ApplicationStatus.APPLIED),
+        (entities.ApplicationStatus.APPLIED, entities.ApplicationStatus.SCREENING),
+    ]
+    assert history[-1].changed_by_id is not None
+
+    after = funnel()
+    def delta(status):
+        entered, exited = before.get(status, (0, 0))
+        return after[status][0] - entered, after[status][1] - exited
+    assert delta(entities.ApplicationStatus.APPLIED) == (1, 1)
+    assert delta(entities.ApplicationStatus.SCREENING) == (1, 0)
\ No newline at end of file
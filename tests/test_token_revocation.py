@@ -0,0 +1,88 @@
+import random
+from datetime import datetime, timedelta, UTC
+from src.core.bloom import BloomFilter
+from src.models import entities
+from src.services import auth_service
+from src.services.revocation_service import revocation_list
+
+def test_bloom_filter():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti:{random.getrandbits(64):x}" for _ in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other:{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+    assert bloom.full
+
+def test_token_is_decoded_once(client, db_session, auth_headers, monkeypatch, count_queries):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    decoded = []
+    decode = auth_service.jwt.decode
+    monkeypatch.setattr(auth_service.jwt, "decode", lambda *args, **kwargs: decoded.append(1) or decode(*args, **kwargs))
+    monkeypatch.setattr(revocation_list, "refresh_interval", 3600.0)
+    monkeypatch.setattr(auth_service.principal_cache, "version_check_interval", 3600.0)
+    assert client.get("/v1/auth/me", headers=headers).status_code == 200
+    with count_queries() as statements:
+        for _ in range(2):
+            assert client.get("/v1/auth/me", headers=headers).status_code == 200
+    assert len(decoded) == 1
+    # Once warm, neither the revocation check nor the principal costs a query
+    assert statements == []
+
+def test_logout_revokes_only_that_token(client, db_session, auth_headers):
+    first = auth_headers("recruiter@company.com", "recruiter123")
+    second = auth_headers("recruiter@company.com", "recruiter123")
+    assert client.post("/v1/auth/logout", headers=first).status_code == 204
+    assert client.get("/v1/auth/me", headers=first).status_code == 401
+    assert client.get("/v1/auth/me", headers=second).status_code == 200
+    assert revocation_list.stats().get("false_positives", 0) == 0
+
+def test_forced_sign_out(client, db_session, auth_headers):
+    recruiter_id = db_session.query(entities.User).filter(
+        entities.User.email == "recruiter@company.com"
+    ).one().id
+    tokens = [auth_headers("recruiter@company.com", "recruiter123") for _ in range(2)]
+    admin = auth_headers("admin@company.com", "admin123")
+
+    assert client.post(f"/v1/admin/users/{recruiter_id}/sign-out", headers=admin).status_code == 204
+    for headers in tokens:
+        assert client.get("/v1/auth/me", headers=headers).status_code == 401
+    # Logging in again works, and other users are unaffected
+    assert client.get("/v1/auth/me", headers=auth_headers("recruiter@company.com", "recruiter123")).status_code == 200
+    assert client.get("/v1/auth/me", headers=admin).status_code == 200
+    assert client.post("/v1/admin/users/999999/sign-out", headers=admin).status_code == 404
+
+def test_revocations_by_other_processes(client, db_session, auth_headers, monkeypatch):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    assert client.get("/v1/auth/me", headers=headers).status_code == 200
+    claims = auth_service.verified_tokens.get(headers["Authorization"].split()[1])
+
+    # Written by another process: seen once the filter next refreshes
+    with db_session.get_bind().begin() as connection:
+        connection.execute(entities.RevokedToken.__table__.insert().values(
+            jti=claims["jti"], revoked_at=datetime.now(UTC),
+            expires_at=datetime.now(UTC) + timedelta(minutes=30)
+        ))
+    monkeypatch.setattr(revocation_list, "refresh_interval", 0.0)
+    assert client.get("/v1/auth/me", headers=headers).status_code == 401
+
+def test_revocations_committed_out_of_order(client, db_session, auth_headers, monkeypatch):
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    monkeypatch.setattr(revocation_list, "refresh_interval", 0.0)
+    expires_at = datetime.now(UTC) + timedelta(minutes=30)
+    table = entities.RevokedToken.__table__
+
+    # A later insert commits and is polled first...
+    with db_session.get_bind().begin() as connection:
+        connection.execute(table.insert().values(id=1000, jti="other", expires_at=expires_at))
+    assert client.get("/v1/auth/me", headers=headers).status_code == 200
+
+    # ...then an earlier one lands below it, stamped well in the past
+    claims = auth_service.verified_tokens.get(headers["Authorization"].split()[1])
+    with db_session.get_bind().begin() as connection:
+        connection.execute(table.insert().values(
+            id=990, jti=claims["jti"], revoked_at=datetime.now(UTC) - timedelta(hours=1),
+            expires_at=expires_at
+        ))
+    assert client.get("/v1/auth/me", headers=headers).status_code == 401
\ No newline at end of file
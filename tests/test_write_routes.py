@@ -0,0 +1,94 @@
+from src.models import entities
+from src.services.application_service import ApplicationService
+
+def _candidate_payload(email):
+    return {
+        "first_name": "Ada", "last_name": "Lovelace", "email": email,
+        "skills": "Python, SQL", "experience_years": 4, "education": "BSc"
+    }
+
+def test_create_candidate(client, db_session, auth_headers):
+    response = client.post(
+        "/v1/candidates/",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        json=_candidate_payload("ada@example.com")
+    )
+    assert response.status_code == 201
+    assert response.json()["email"] == "ada@example.com"
+
+def test_update_candidate(client, db_session, auth_headers):
+    candidate_id = db_session.query(entities.Candidate).first().id
+    payload = _candidate_payload("renamed@example.com")
+    response = client.put(
+        f"/v1/candidates/{candidate_id}",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        json=payload
+    )
+    assert response.status_code == 200
+    assert response.json()["email"] == "renamed@example.com"
+
+def test_create_job_opening(client, db_session, auth_headers):
+    company_id = db_session.query(entities.Company).first().id
+    payload = {
+        "title": "Data Engineer", "company_id": company_id, "description": "Pipelines",
+        "requirements": "3+ years of experience", "location": "Remote",
+        "job_type": "full-time", "experience_level": "Mid"
+    }
+    response = client.post(
+        "/v1/job-openings/",
+        headers=auth_headers("recruiter@company.com", "recruiter123"),
+        json=payload
+    )
+    assert response.status_code == 201
+    assert response.json()["company_id"] == company_id
+
+def test_create_application_and_update_status(client, db_session, auth_headers):
+    job_id = db_session.query(entities.JobOpening).filter(
+        entities.JobOpening.status == entities.JobStatus.OPEN
+    ).first().id
+    candidate = entities.Candidate(**_candidate_payload("applicant@example.com"))
+    db_session.add(candidate)
+    db_session.commit()
+    candidate_id = candidate.id
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+
+    response = client.post(
+        "/v1/applications/",
+        headers=headers,
+        json={"candidate_id": candidate_id, "job_opening_id": job_id}
+    )
+    assert response.status_code == 201
+    application_id = response.json()["id"]
+
+    response = client.put(
+        f"/v1/applications/{application_id}/status",
+        headers=headers,
+        json={"status": "interviewing"}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "interviewing"
+
+def test_concurrent_duplicate_application(client, db_session, auth_headers, monkeypatch):
+    job_id = db_session.query(entities.JobOpening).filter(
+        entities.JobOpening.status == entities.JobStatus.OPEN
+    ).first().id
+    candidate = entities.Candidate(**_candidate_payload("racer@example.com"))
+    db_session.add(candidate)
+    db_session.commit()
+    payload = {"candidate_id": candidate.id, "job_opening_id": job_id}
+    headers = auth_headers("recruiter@company.com", "recruiter123")
+    assert client.post("/v1/applications/", headers=headers, json=payload).status_code == 201
+
+    # The other request's insert commits between this one's check and insert
+    find = ApplicationService._find_application
+    checks = []
+
+    def racing_find(self, db, candidate_id, job_opening_id):
+        checks.append(candidate_id)
+        return None if len(checks) == 1 else find(self, db, candidate_id, job_opening_id)
+
+    monkeypatch.setattr(ApplicationService, "_find_application", racing_find)
+
+    response = client.post("/v1/applications/", headers=headers, json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Candidate has already applied for this position"
\ No newline at end of file